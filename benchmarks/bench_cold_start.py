@@ -0,0 +1,91 @@
+"""Cold start benchmark: import time and latency of the first request in a fresh process.
+
+Run from the repository root:
+
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --repeat 10 --handshake 0.1
+    python benchmarks/bench_cold_start.py --url https://www.openai.fm   # Against the real endpoint
+
+Every measurement runs in a new interpreter, the way a short-lived worker or a
+serverless function starts. The first ``speak`` is measured with and without a
+``warmup()`` call beforehand; the warmup itself is reported separately, since it
+can run while the worker waits for its first job.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stub_server import StubServer, StubSettings  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import openai_tts
+timings = {"import openai_tts": time.perf_counter() - start}
+start = time.perf_counter()
+from openai_tts import OpenaiTTS, TTSConfig
+timings["import OpenaiTTS"] = time.perf_counter() - start
+base_url, output_path, warm = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+with OpenaiTTS(TTSConfig(base_url=base_url, verbose=False)) as tts:
+    if warm:
+        start = time.perf_counter()
+        tts.warmup()
+        timings["warmup()"] = time.perf_counter() - start
+    start = time.perf_counter()
+    tts.speak("Hello there, this is the first request.", output_path=output_path)
+    timings["first speak, warm" if warm else "first speak, cold"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def probe(base_url: str, output_path: str, warm: bool) -> Dict[str, float]:
+    """Run the probe in a fresh interpreter and return its timings."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT) + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, base_url, output_path, "1" if warm else "0"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default=None, help="Base URL of a running endpoint; starts an in-process stub if omitted")
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh processes per variant")
+    parser.add_argument('--latency', type=float, default=0.05, help="Stub response latency in seconds")
+    parser.add_argument('--handshake', type=float, default=0.05, help="Stub delay per new connection, standing in for TLS")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = StubServer(StubSettings(latency=args.latency, jitter=0, handshake=args.handshake)).start()
+        base_url = server.base_url
+
+    timings: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "first.mp3")
+        for _ in range(args.repeat):
+            for warm in (False, True):
+                for name, value in probe(base_url, output_path, warm).items():
+                    timings.setdefault(name, []).append(value)
+    if server is not None:
+        server.stop()
+
+    for name, values in timings.items():
+        print(f"{name:>20}: median {statistics.median(values) * 1e3:7.1f} ms, min {min(values) * 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
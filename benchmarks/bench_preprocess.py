@@ -0,0 +1,59 @@
+"""Corpus preparation benchmark: one process against a pool of worker processes.
+
+Run from the repository root:
+
+    python benchmarks/bench_preprocess.py
+    python benchmarks/bench_preprocess.py --documents 2000 --size 20K --processes 1 4 16 --chunk-chars 400
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from openai_tts import CorpusPreprocessor, OpenaiTTS, TTSConfig  # noqa: E402
+from bench_tokenizer import make_document, parse_size  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=400, help="Number of documents")
+    parser.add_argument('--size', default='10K', help="Characters per document, e.g. 10K")
+    parser.add_argument('--processes', type=int, nargs='+', default=None,
+                        help="Pool sizes to measure (default: 1, 2, 4 ... up to the number of CPUs)")
+    parser.add_argument('--chunk-chars', type=int, default=None, help="TTSConfig.chunk_max_chars")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    documents: List[str] = [make_document(size, seed=i) for i in range(args.documents)]
+    total_chars = sum(map(len, documents))
+    config = TTSConfig(chunk_max_chars=args.chunk_chars)
+    cpus = os.cpu_count() or 1
+    pool_sizes = args.processes or sorted({min(cpus, 2 ** i) for i in range(cpus.bit_length() + 1)})
+
+    print(f"{args.documents} documents, {total_chars / 1e6:.1f} M characters, {cpus} CPUs")
+    tts = OpenaiTTS(config)
+    start = time.perf_counter()
+    expected = [list(tts._iter_chunks(document, config)) for document in documents]
+    serial = time.perf_counter() - start
+    print(f"{'in process':>12}: {serial:7.2f} s  {total_chars / serial / 1e6:6.2f} M chars/s")
+
+    for processes in pool_sizes:
+        with CorpusPreprocessor(processes, config) as preprocessor:
+            # Start the workers before timing.
+            list(preprocessor.iter_prepared(documents[:processes]))
+            start = time.perf_counter()
+            prepared = list(preprocessor.iter_prepared(documents))
+            elapsed = time.perf_counter() - start
+        assert [list(chunks) for chunks in prepared] == expected, "pool output differs from speak()"
+        print(f"{processes:>3} processes: {elapsed:7.2f} s  {total_chars / elapsed / 1e6:6.2f} M chars/s  "
+              f"x{serial / elapsed:.1f}")
+
+
+if __name__ == '__main__':
+    main()
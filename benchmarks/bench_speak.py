@@ -0,0 +1,145 @@
+"""End-to-end load test of OpenaiTTS against the local stub endpoint.
+
+Run from the repository root:
+
+    python benchmarks/bench_speak.py
+    python benchmarks/bench_speak.py --calls 50 --callers 4 --latency 0.3 --jitter 0.8 --error-rate 0.05
+    python benchmarks/bench_speak.py --url http://127.0.0.1:8000   # Use an already running stub
+
+Reports chunk throughput, time to first chunk, total latency per call and
+peak memory.
+"""
+
+import argparse
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from openai_tts import OpenaiTTS, RetryPolicy, TTSConfig  # noqa: E402
+from stub_server import StubServer, StubSettings  # noqa: E402
+
+SENTENCE = "The quick brown fox jumps over the lazy dog while the sun sets slowly in the west."
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_call(tts: OpenaiTTS, text: str) -> Tuple[float, float, int]:
+    """Stream one call and return (time to first chunk, total time, chunks)."""
+    start = time.perf_counter()
+    first = None
+    chunks = 0
+    for _ in tts.speak_stream(text):
+        if first is None:
+            first = time.perf_counter() - start
+        chunks += 1
+    return first or 0.0, time.perf_counter() - start, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default=None, help="Base URL of a running endpoint; starts an in-process stub if omitted")
+    parser.add_argument('--calls', type=int, default=20, help="Number of speak calls")
+    parser.add_argument('--callers', type=int, default=1, help="Threads issuing calls in parallel")
+    parser.add_argument('--sentences', type=int, default=20, help="Sentences per call")
+    parser.add_argument('--concurrency', type=int, default=16, help="TTSConfig.max_concurrency")
+    parser.add_argument('--adaptive', action='store_true', help="Enable TTSConfig.adaptive_concurrency")
+    parser.add_argument('--hedge', type=float, default=None, help="TTSConfig.hedge_percentile, e.g. 0.9")
+    parser.add_argument('--hedge-ratio', type=float, default=0.1, help="TTSConfig.hedge_max_ratio")
+    parser.add_argument('--latency', type=float, default=0.2, help="Stub median latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.5, help="Stub log-normal latency sigma")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Stub fraction of HTTP 500 responses")
+    parser.add_argument('--empty-rate', type=float, default=0.0, help="Stub fraction of empty responses")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="Stub throttling threshold (HTTP 429)")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        settings = StubSettings(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            empty_rate=args.empty_rate,
+            max_in_flight=args.max_in_flight,
+        )
+        server = StubServer(settings).start()
+        base_url = server.base_url
+
+    config = TTSConfig(
+        verbose=False,
+        base_url=base_url,
+        max_concurrency=args.concurrency,
+        adaptive_concurrency=args.adaptive,
+        hedge_percentile=args.hedge,
+        hedge_max_ratio=args.hedge_ratio,
+        retry=RetryPolicy(max_attempts=10, backoff_base=0.05, backoff_max=1.0),
+    )
+
+    def make_text(call: int) -> str:
+        # Distinct text per call, so identical in-flight requests are not coalesced.
+        return ' '.join(f"Call {call}, part {i}: {SENTENCE}" for i in range(args.sentences))
+
+    tracemalloc.start()
+    results: List[Tuple[float, float, int]] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def worker(call: int) -> None:
+        try:
+            result = run_call(tts, make_text(call))
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+            return
+        with lock:
+            results.append(result)
+
+    with OpenaiTTS(config) as tts:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.callers) as callers:
+            list(callers.map(worker, range(args.calls)))
+        elapsed = time.perf_counter() - start
+
+    _, peak_heap = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if server is not None:
+        server.stop()
+
+    if errors:
+        print(f"first error: {errors[0]}")
+    if not results:
+        print(f"All {len(errors)} calls failed")
+        return
+
+    first = [r[0] for r in results]
+    total = [r[1] for r in results]
+    chunks = sum(r[2] for r in results)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        max_rss //= 1024
+
+    print(f"calls: {len(results)} ok, {len(errors)} failed in {elapsed:.2f} s")
+    print(f"throughput: {chunks / elapsed:.1f} chunks/s")
+    print(f"time to first chunk: p50 {percentile(first, 0.5) * 1e3:.0f} ms, p99 {percentile(first, 0.99) * 1e3:.0f} ms")
+    print(f"total latency: p50 {percentile(total, 0.5) * 1e3:.0f} ms, p99 {percentile(total, 0.99) * 1e3:.0f} ms")
+    print(f"memory: peak Python heap {peak_heap / 1e6:.1f} MB, max RSS {max_rss / 1024:.1f} MB")
+    if tts.hedger is not None:
+        print(f"hedges: {tts.hedger.hedges}")
+    if server is not None:
+        print(f"stub: {server.requests} requests, {server.throttled} throttled")
+
+
+if __name__ == '__main__':
+    main()
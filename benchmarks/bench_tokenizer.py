@@ -0,0 +1,88 @@
+"""Tokenizer benchmarks, from a paragraph up to a whole book.
+
+Run from the repository root:
+
+    python benchmarks/bench_tokenizer.py
+    python benchmarks/bench_tokenizer.py --sizes 1K 500K 4M --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from openai_tts.utils import SentenceTokenizer, split_into_sentences  # noqa: E402
+
+SENTENCES: List[str] = [
+    "The sun was setting over the distant mountains, painting the sky in shades of orange and pink.",
+    "Dr. Smith and Mrs. Jones met at 5 p.m. to discuss the results.",
+    "Visit https://www.example.com/docs/getting-started for the full guide.",
+    "Questions can be sent to support@example.com at any time.",
+    "She said «Wait. Not yet.» and then walked away.",
+    "The package weighs approx. 3.5 kg vs. the 4 kg advertised.",
+    "Is this really the end?",
+    "What a day it has been!",
+    "He paused... then carried on as if nothing had happened.",
+    "Acme Corp. reported revenue of 12.5 million dollars, up 4% from last year.",
+]
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes such as ``512``, ``10K`` or ``4M`` into a number of characters."""
+    units = {'K': 1024, 'M': 1024 * 1024}
+    suffix = value[-1].upper()
+    if suffix in units:
+        return int(float(value[:-1]) * units[suffix])
+    return int(value)
+
+
+def make_document(size: int, seed: int = 0) -> str:
+    """Build a deterministic document of roughly ``size`` characters with paragraph breaks."""
+    rng = random.Random(seed)
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        sentence = rng.choice(SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+        if rng.random() < 0.1:
+            parts.append("\n\n")
+    return ' '.join(parts)[:size]
+
+
+def bench(text: str, repeat: int) -> float:
+    """Return the best wall time in seconds over ``repeat`` runs of split_into_sentences."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        split_into_sentences(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1K', '10K', '100K', '500K', '2M'],
+                        help="Document sizes in characters (suffix K or M)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per size; the best time is reported")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    SentenceTokenizer()
+    print(f"tokenizer construction: {(time.perf_counter() - start) * 1e6:.1f} us")
+    print(f"{'size':>10} {'sentences':>10} {'best (ms)':>12} {'MB/s':>8}")
+
+    for size in args.sizes:
+        text = make_document(parse_size(size))
+        sentences = len(split_into_sentences(text))
+        elapsed = bench(text, args.repeat)
+        throughput = len(text.encode('utf-8')) / elapsed / 1e6
+        print(f"{size:>10} {sentences:>10} {elapsed * 1e3:>12.2f} {throughput:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
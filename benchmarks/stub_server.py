@@ -0,0 +1,191 @@
+"""Local stand-in for the openai.fm ``/api/generate`` endpoint.
+
+The stub answers with silent MP3 audio sized to the input text. Its latency
+distribution and failure modes are configurable, so the providers can be load
+tested offline:
+
+    python benchmarks/stub_server.py --port 8000 --latency 0.3 --jitter 0.5 --error-rate 0.02
+
+and point a provider at it with ``TTSConfig(base_url="http://127.0.0.1:8000")``.
+"""
+
+import argparse
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, mono, no CRC: 417 byte frames of 26 ms.
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0xC4])
+FRAME_SIZE = 417
+SILENT_FRAME = FRAME_HEADER + bytes(FRAME_SIZE - len(FRAME_HEADER))
+
+# Like a typical encoder, every response starts with an ID3v2 tag and an Info frame.
+ID3_TAG = b'ID3\x04\x00\x00\x00\x00\x00\x17' + b'TSSE\x00\x00\x00\x0d\x00\x00\x03Lavf60.3.100'
+INFO_FRAME = FRAME_HEADER + bytes(17) + b'Info' + bytes(FRAME_SIZE - len(FRAME_HEADER) - 21)
+
+
+def silent_mp3(frames: int) -> bytes:
+    """Return a tagged MP3 file holding ``frames`` frames of silent audio."""
+    return ID3_TAG + INFO_FRAME + SILENT_FRAME * max(1, frames)
+
+
+@dataclass
+class StubSettings:
+    """Behaviour of the stub endpoint."""
+    latency: float = 0.2
+    jitter: float = 0.5
+    error_rate: float = 0.0
+    empty_rate: float = 0.0
+    max_in_flight: Optional[int] = None
+    chars_per_frame: int = 2
+    handshake: float = 0.0
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Draw a latency from a log-normal distribution with median ``latency``."""
+        if self.jitter <= 0:
+            return self.latency
+        return rng.lognormvariate(0, self.jitter) * self.latency
+
+
+class StubServer:
+    """
+    Threaded HTTP server emulating ``GET /api/generate``.
+
+    Every request sleeps for a sampled latency and then returns MP3 audio. A
+    request may instead return HTTP 500 (``error_rate``) or an empty body
+    (``empty_rate``); ``failed`` counts both. When more than ``max_in_flight``
+    requests are open, the extra requests are throttled with HTTP 429. Every new
+    connection waits ``handshake`` seconds before its first request is read,
+    standing in for the TCP and TLS handshakes of a real endpoint.
+    """
+
+    def __init__(self, settings: Optional[StubSettings] = None, host: str = "127.0.0.1", port: int = 0, seed: int = 0):
+        self.settings = settings or StubSettings()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to pass as ``TTSConfig.base_url``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body are separate writes; without this, Nagle's algorithm and
+                # delayed ACKs add ~40 ms to every response on a kept-alive connection.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if stub.settings.handshake:
+                    time.sleep(stub.settings.handshake)
+
+            def do_HEAD(self) -> None:
+                self._reply(200, b"")
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path != "/api/generate":
+                    self._reply(404, b"")
+                    return
+                text = parse_qs(url.query).get("input", [""])[0]
+                with stub._lock:
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    throttled = stub.settings.max_in_flight is not None and stub.in_flight > stub.settings.max_in_flight
+                    stub.throttled += throttled
+                    latency = stub.settings.sample_latency(stub._rng)
+                    outcome = stub._rng.random()
+                try:
+                    if throttled:
+                        self._reply(429, b"")
+                        return
+                    time.sleep(latency)
+                    if outcome < stub.settings.error_rate + stub.settings.empty_rate:
+                        with stub._lock:
+                            stub.failed += 1
+                        self._reply(500 if outcome < stub.settings.error_rate else 200, b"")
+                    else:
+                        self._reply(200, silent_mp3(len(text) // stub.settings.chars_per_frame))
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _reply(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "audio/mpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "StubServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the openai.fm generate endpoint.")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.2, help="Median response latency in seconds")
+    parser.add_argument('--jitter', type=float, default=0.5, help="Log-normal sigma of the latency; 0 for fixed")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument('--empty-rate', type=float, default=0.0, help="Fraction of requests answered with an empty body")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="Throttle with HTTP 429 above this many open requests")
+    parser.add_argument('--handshake', type=float, default=0.0, help="Delay in seconds before serving a new connection")
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        empty_rate=args.empty_rate,
+        max_in_flight=args.max_in_flight,
+        handshake=args.handshake,
+    )
+    server = StubServer(settings, host=args.host, port=args.port)
+    print(f"Serving {server.base_url}/api/generate (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,79 @@
 """
 OpenAI TTS - A Python library for using OpenAI's text-to-speech API.
+
+Public names are imported on first access, so ``import openai_tts`` stays cheap
+for short-lived processes.
 """
 
-from openai_tts.providers.openai import OpenaiTTS
-from openai_tts.config import TTSConfig, VoiceType
-from openai_tts.exceptions import TTSException, TTSRequestError
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from openai_tts.providers.openai import OpenaiTTS
+    from openai_tts.providers.async_openai import AsyncOpenaiTTS
+    from openai_tts.providers.composite import AsyncCompositeTTS, CompositeTTS
+    from openai_tts.cache import AudioCache
+    from openai_tts.config import RetryPolicy, SynthesisJob, TTSConfig, VoiceType
+    from openai_tts.exceptions import TTSCircuitOpenError, TTSException, TTSRequestError
+    from openai_tts.metrics import ChunkEvent, Instrumentation, MetricsCollector
+    from openai_tts.mp3 import MP3Writer
+    from openai_tts.preprocess import CorpusPreprocessor
+    from openai_tts.server import TTSServer
+    from openai_tts.utils import PreparedText
+
+_EXPORTS = {
+    'OpenaiTTS': 'openai_tts.providers.openai',
+    'AsyncOpenaiTTS': 'openai_tts.providers.async_openai',
+    'CompositeTTS': 'openai_tts.providers.composite',
+    'AsyncCompositeTTS': 'openai_tts.providers.composite',
+    'AudioCache': 'openai_tts.cache',
+    'RetryPolicy': 'openai_tts.config',
+    'SynthesisJob': 'openai_tts.config',
+    'TTSConfig': 'openai_tts.config',
+    'VoiceType': 'openai_tts.config',
+    'TTSException': 'openai_tts.exceptions',
+    'TTSRequestError': 'openai_tts.exceptions',
+    'TTSCircuitOpenError': 'openai_tts.exceptions',
+    'ChunkEvent': 'openai_tts.metrics',
+    'Instrumentation': 'openai_tts.metrics',
+    'MetricsCollector': 'openai_tts.metrics',
+    'MP3Writer': 'openai_tts.mp3',
+    'CorpusPreprocessor': 'openai_tts.preprocess',
+    'TTSServer': 'openai_tts.server',
+    'PreparedText': 'openai_tts.utils',
+}
+
+__all__ = [
+    'OpenaiTTS',
+    'AsyncOpenaiTTS',
+    'CompositeTTS',
+    'AsyncCompositeTTS',
+    'AudioCache',
+    'RetryPolicy',
+    'SynthesisJob',
+    'TTSConfig',
+    'VoiceType',
+    'TTSException',
+    'TTSRequestError',
+    'TTSCircuitOpenError',
+    'ChunkEvent',
+    'Instrumentation',
+    'MetricsCollector',
+    'MP3Writer',
+    'CorpusPreprocessor',
+    'PreparedText',
+    'TTSServer',
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['OpenaiTTS', 'TTSConfig', 'VoiceType', 'TTSException', 'TTSRequestError']
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+"""Entry point for ``python -m openai_tts``."""
+
+import sys
+
+from openai_tts.cli import main
+
+sys.exit(main())
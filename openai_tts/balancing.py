@@ -0,0 +1,136 @@
+"""Spreading requests over several endpoints by measured latency and health."""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Collection, List, Optional, Sequence
+
+
+@dataclass
+class EndpointStats:
+    """Running view of one endpoint, as seen by the requests sent to it."""
+    latency: Optional[float] = None
+    success_rate: float = 1.0
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+
+class LoadBalancer:
+    """
+    Picks the endpoint for each request from live latency and failure statistics.
+
+    Each endpoint is scored by its smoothed latency, multiplied by the number of
+    requests it would have in flight and divided by its smoothed success rate; the
+    lowest score wins, ties are broken at random. An endpoint without a latency yet
+    borrows the average of the others, so new endpoints are tried straight away.
+    A failed request ejects its endpoint for ``ejection_time`` seconds, doubling
+    with each consecutive failure up to ``max_ejection_time``, so retries move to
+    the other endpoints at once. Ejected endpoints are only used when nothing else
+    is available, and a success ends the ejection.
+    """
+
+    MIN_SUCCESS_RATE: float = 0.05
+
+    def __init__(
+        self,
+        count: int,
+        alpha: float = 0.2,
+        ejection_time: float = 1.0,
+        max_ejection_time: float = 30.0
+    ) -> None:
+        if count < 1:
+            raise ValueError("at least one endpoint is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.ejection_time = ejection_time
+        self.max_ejection_time = max_ejection_time
+        self.stats: List[EndpointStats] = [EndpointStats() for _ in range(count)]
+        self._lock = threading.Lock()
+
+    def _score(self, stats: EndpointStats, default_latency: float) -> float:
+        latency = default_latency if stats.latency is None else stats.latency
+        return latency * (stats.in_flight + 1) / max(self.MIN_SUCCESS_RATE, stats.success_rate)
+
+    def choose(self, available: Optional[Sequence[bool]] = None, avoid: Collection[int] = ()) -> Optional[int]:
+        """
+        Pick an endpoint and count a request in flight on it.
+
+        Every call that returns an index must be followed by ``finish()`` for it.
+
+        Args:
+            available (Optional[Sequence[bool]]): Whether each endpoint may be used at all,
+                for example because its circuit is not open. Defaults to all of them.
+            avoid (Collection[int]): Endpoints to use only when no other healthy endpoint is
+                available, such as the ones already working on the same chunk.
+
+        Returns:
+            Optional[int]: Index of the chosen endpoint, or None if none is available.
+        """
+        now = time.monotonic()
+        with self._lock:
+            known = [s.latency for s in self.stats if s.latency is not None]
+            default_latency = sum(known) / len(known) if known else 0.0
+            best = None
+            best_rank = None
+            for index, stats in enumerate(self.stats):
+                if available is not None and not available[index]:
+                    continue
+                rank = (
+                    stats.ejected_until > now,
+                    index in avoid,
+                    self._score(stats, default_latency),
+                    random.random()
+                )
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = index, rank
+            if best is not None:
+                self.stats[best].in_flight += 1
+            return best
+
+    def has_healthy(self) -> bool:
+        """Return True if some endpoint is not currently ejected."""
+        now = time.monotonic()
+        with self._lock:
+            return any(stats.ejected_until <= now for stats in self.stats)
+
+    def finish(self, index: int, ok: Optional[bool], latency: Optional[float] = None) -> None:
+        """
+        Record the outcome of a request started with ``choose()``.
+
+        Args:
+            index (int): The endpoint the request was sent to.
+            ok (Optional[bool]): Whether the endpoint answered, or None if the request says
+                nothing about its health, such as one rejected for its own content.
+            latency (Optional[float]): Seconds the request took, if it produced audio.
+        """
+        with self._lock:
+            stats = self.stats[index]
+            stats.in_flight -= 1
+            if ok is None:
+                return
+            stats.requests += 1
+            if ok:
+                stats.success_rate += self.alpha * (1 - stats.success_rate)
+                stats.consecutive_failures = 0
+                stats.ejected_until = 0.0
+                if latency is not None:
+                    if stats.latency is None:
+                        stats.latency = latency
+                    else:
+                        stats.latency += self.alpha * (latency - stats.latency)
+            else:
+                stats.success_rate -= self.alpha * stats.success_rate
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                ejection = self.ejection_time * 2 ** (stats.consecutive_failures - 1)
+                stats.ejected_until = time.monotonic() + min(self.max_ejection_time, ejection)
+
+    def snapshot(self) -> List[EndpointStats]:
+        """Return a consistent copy of the statistics of every endpoint."""
+        with self._lock:
+            return [EndpointStats(**vars(stats)) for stats in self.stats]
@@ -0,0 +1,236 @@
+"""Persistent on-disk cache for synthesized audio chunks."""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_last_access ON chunks (last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (id, total_bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS chunks_insert AFTER INSERT ON chunks BEGIN
+    UPDATE stats SET total_bytes = total_bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_delete AFTER DELETE ON chunks BEGIN
+    UPDATE stats SET total_bytes = total_bytes - OLD.size WHERE id = 0;
+END;
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so trivially different inputs share a cache entry."""
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def chunk_cache_key(text: str, voice: str, prompt: str) -> str:
+    """
+    Build the content address of a synthesized chunk.
+
+    Args:
+        text (str): The chunk text.
+        voice (str): The voice name used for synthesis.
+        prompt (str): The voice prompt sent with the request.
+
+    Returns:
+        str: Hex encoded SHA-256 digest identifying the audio.
+    """
+    digest = hashlib.sha256()
+    for part in (normalize_text(text), voice, prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class AudioCache:
+    """
+    Size-bounded LRU cache of audio chunks stored in a single SQLite database.
+
+    SQLite provides the locking, so one cache directory can be shared by any
+    number of threads and processes. Every thread gets its own connection.
+
+    Hits only take a read lock. Their access times are collected in memory and
+    written in batches, at the latest with the next ``put()`` or after
+    ``TOUCH_INTERVAL`` seconds, so reads do not contend for the write lock. The
+    cache is an optimization: database errors, such as a lock held past
+    ``TIMEOUT`` or a full disk, are logged and treated as a miss or a skipped store.
+    """
+
+    DATABASE_NAME: str = "chunks.sqlite3"
+    TIMEOUT: float = 30.0
+    TOUCH_BATCH: int = 256
+    TOUCH_INTERVAL: float = 10.0
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Open (or create) a cache in the given directory.
+
+        Args:
+            directory (Union[str, Path]): Directory holding the cache database.
+            max_bytes (int): Total audio size kept before least recently used entries are evicted.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / self.DATABASE_NAME
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._touches_flushed = time.monotonic()
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection owned by the calling thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=self.TIMEOUT, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a chunk and mark it as recently used.
+
+        Args:
+            key (str): Key produced by :func:`chunk_cache_key`.
+
+        Returns:
+            Optional[bytes]: The cached audio, or None on a miss.
+        """
+        try:
+            row = self._connection().execute('SELECT data FROM chunks WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Audio cache lookup failed, treating it as a miss: %s", e)
+            return None
+        if row is None:
+            return None
+        with self._lock:
+            self._touched[key] = time.time()
+            due = (
+                len(self._touched) >= self.TOUCH_BATCH
+                or time.monotonic() - self._touches_flushed >= self.TOUCH_INTERVAL
+            )
+        if due:
+            self.flush()
+        return bytes(row[0])
+
+    def _take_touches(self) -> List[Tuple[float, str]]:
+        """Return the access times collected since the last write and forget them."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+            self._touches_flushed = time.monotonic()
+        return [(last_access, key) for key, last_access in touched.items()]
+
+    def flush(self) -> None:
+        """Write the access times of recent hits to the database."""
+        touches = self._take_touches()
+        if touches:
+            self._write(lambda conn: conn.executemany('UPDATE chunks SET last_access = ? WHERE key = ?', touches))
+
+    def _write(self, operation: Callable[[sqlite3.Connection], Any]) -> bool:
+        """Run ``operation(conn)`` in a write transaction, returning False if the database failed."""
+        try:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+        except sqlite3.Error as e:
+            logger.warning("Audio cache write skipped: %s", e)
+            return False
+        try:
+            operation(conn)
+            conn.execute('COMMIT')
+        except BaseException as e:
+            try:
+                conn.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass
+            if not isinstance(e, sqlite3.Error):
+                raise
+            logger.warning("Audio cache write skipped: %s", e)
+            return False
+        return True
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store a chunk, evicting least recently used entries beyond ``max_bytes``.
+
+        Args:
+            key (str): Key produced by :func:`chunk_cache_key`.
+            data (bytes): The audio to store.
+        """
+        if not data or len(data) > self.max_bytes:
+            return
+        # Pending access times go in first, so eviction sees recent hits.
+        touches = self._take_touches()
+
+        def store(conn: sqlite3.Connection) -> None:
+            if touches:
+                conn.executemany('UPDATE chunks SET last_access = ? WHERE key = ?', touches)
+            conn.execute('DELETE FROM chunks WHERE key = ?', (key,))
+            conn.execute(
+                'INSERT INTO chunks (key, data, size, last_access) VALUES (?, ?, ?, ?)',
+                (key, sqlite3.Binary(data), len(data), time.time())
+            )
+            self._evict(conn)
+
+        self._write(store)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete the oldest entries until the cache fits in ``max_bytes``."""
+        total = conn.execute('SELECT total_bytes FROM stats WHERE id = 0').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in conn.execute('SELECT key, size FROM chunks ORDER BY last_access'):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany('DELETE FROM chunks WHERE key = ?', victims)
+
+    def size(self) -> int:
+        """Return the total number of audio bytes currently stored."""
+        return self._connection().execute('SELECT total_bytes FROM stats WHERE id = 0').fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every cached chunk."""
+        self._connection().execute('DELETE FROM chunks')
+
+    def close(self) -> None:
+        """Write pending access times and close the connections opened by this cache instance."""
+        self.flush()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM chunks').fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"AudioCache({os.fspath(self.directory)!r}, max_bytes={self.max_bytes})"
@@ -0,0 +1,317 @@
+"""Command-line tool for bulk synthesis from files, directories, stdin and manifests."""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+from openai_tts.config import TTSConfig, VoiceType
+from openai_tts.metrics import MetricsCollector
+from openai_tts.preprocess import CorpusPreprocessor
+from openai_tts.providers.openai import OpenaiTTS
+from openai_tts.utils import TextSource
+
+
+@dataclass
+class BulkJob:
+    """One output file of a bulk run."""
+    index: int
+    source: str
+    text: Optional[TextSource]
+    output_path: Path
+    voice: Optional[VoiceType] = None
+    error: Optional[str] = None
+
+
+def parse_voice(value: str) -> VoiceType:
+    """Return the voice with the given name or value, ignoring case."""
+    for voice in VoiceType:
+        if value.lower() in (voice.value, voice.name.lower()):
+            return voice
+    raise ValueError(f"unknown voice {value!r}, expected one of {', '.join(v.value for v in VoiceType)}")
+
+
+def read_manifest(path: Path, output_dir: Path, start: int = 0) -> List[BulkJob]:
+    """
+    Read a JSONL manifest of jobs.
+
+    Every non-empty line is an object with ``text`` (or ``text_file``, relative to
+    the manifest), and optionally ``voice`` and ``output`` (relative to ``output_dir``).
+    Rows that cannot be used become jobs carrying an error, so they show up in the
+    results instead of stopping the run.
+
+    Args:
+        path (Path): The manifest file.
+        output_dir (Path): Directory for relative output paths.
+        start (int): Index of the first job.
+
+    Returns:
+        List[BulkJob]: One job per row.
+    """
+    jobs = []
+    with path.open(encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            source = f"{path}:{line_number}"
+            job = BulkJob(start + len(jobs), source, None, output_dir / f"{path.stem}-{line_number:05d}.mp3")
+            jobs.append(job)
+            try:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("row is not a JSON object")
+                if row.get('output'):
+                    job.output_path = output_dir / row['output']
+                if row.get('voice'):
+                    job.voice = parse_voice(row['voice'])
+                if isinstance(row.get('text'), str):
+                    job.text = row['text']
+                elif row.get('text_file'):
+                    job.text = path.parent / row['text_file']
+                    job.source = str(job.text)
+                else:
+                    raise ValueError("row has neither 'text' nor 'text_file'")
+            except ValueError as e:
+                job.error = f"invalid manifest row: {e}"
+    return jobs
+
+
+def collect_jobs(args: argparse.Namespace, parser: argparse.ArgumentParser) -> List[BulkJob]:
+    """Turn the command-line inputs into a list of jobs."""
+    output_dir = Path(args.output_dir)
+    jobs: List[BulkJob] = []
+    for value in args.inputs:
+        if value == '-':
+            jobs.append(BulkJob(len(jobs), '<stdin>', sys.stdin, output_dir / 'stdin.mp3'))
+            continue
+        path = Path(value)
+        if path.is_dir():
+            for file in sorted(p for p in path.glob(args.pattern) if p.is_file()):
+                output_path = output_dir / file.relative_to(path).with_suffix('.mp3')
+                jobs.append(BulkJob(len(jobs), str(file), file, output_path))
+        elif path.is_file():
+            jobs.append(BulkJob(len(jobs), str(path), path, output_dir / f"{path.stem}.mp3"))
+        else:
+            parser.error(f"no such file or directory: {value}")
+    for manifest in args.manifest:
+        jobs.extend(read_manifest(Path(manifest), output_dir, start=len(jobs)))
+
+    if args.inputs.count('-') > 1:
+        parser.error("stdin can only be read once")
+    if args.output is not None:
+        if len(jobs) != 1:
+            parser.error("--output needs exactly one input")
+        jobs[0].output_path = Path(args.output)
+    seen: Dict[Path, str] = {}
+    for job in jobs:
+        key = job.output_path.resolve()
+        if key in seen:
+            parser.error(f"{job.source} and {seen[key]} would both write {job.output_path}")
+        seen[key] = job.source
+    return jobs
+
+
+class Progress(MetricsCollector):
+    """Metrics collector that also tracks finished jobs and reports progress."""
+
+    def __init__(self, total_jobs: int, stream: TextIO = sys.stderr) -> None:
+        super().__init__()
+        self.total_jobs = total_jobs
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.stream = stream
+        self.started = time.monotonic()
+        self._stop = threading.Event()
+        self._tty = stream.isatty()
+
+    def job_finished(self, ok: bool) -> None:
+        with self._lock:
+            self.jobs_done += 1
+            self.jobs_failed += not ok
+
+    def line(self) -> str:
+        """Describe the progress so far in one line."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        with self._lock:
+            chunks = self.chunks['ok'] + self.chunks['cache_hit']
+            failed = f", {self.jobs_failed} failed" if self.jobs_failed else ""
+            return (
+                f"[{self.jobs_done}/{self.total_jobs} files{failed}] {chunks} chunks in {elapsed:.1f} s, "
+                f"{chunks / elapsed:.1f} chunks/s, {self.bytes_received / elapsed / 1e6:.2f} MB/s"
+            )
+
+    def _print(self, final: bool = False) -> None:
+        if self._tty:
+            print(f"\r\033[K{self.line()}", end="\n" if final else "", file=self.stream, flush=True)
+        else:
+            print(self.line(), file=self.stream, flush=True)
+
+    def _report(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self._print()
+
+    def start(self, interval: float) -> None:
+        """Print a progress line every ``interval`` seconds until ``stop()``."""
+        threading.Thread(target=self._report, args=(interval,), name="openai-tts-progress", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop reporting and print the final line."""
+        self._stop.set()
+        self._print(final=True)
+
+
+def ready_jobs(jobs: List[BulkJob], preprocessor: Optional[CorpusPreprocessor]) -> Iterator[BulkJob]:
+    """Yield the jobs in order, with their text already chunked when a preprocessor is given."""
+    if preprocessor is None:
+        yield from jobs
+        return
+    prepared = preprocessor.iter_prepared((job.text for job in jobs if job.error is None), return_exceptions=True)
+    for job in jobs:
+        if job.error is None:
+            chunks = next(prepared)
+            if isinstance(chunks, BaseException):
+                job.error = f"{type(chunks).__name__}: {chunks}"
+            else:
+                job.text = chunks
+        yield job
+
+
+def run_job(tts: OpenaiTTS, job: BulkJob) -> Dict[str, Any]:
+    """Render one job and return its results record. Never raises."""
+    started = time.monotonic()
+    record: Dict[str, Any] = {
+        'index': job.index,
+        'input': job.source,
+        'output': str(job.output_path),
+        'voice': (job.voice or tts.config.voice).value,
+    }
+    error = job.error
+    if error is None:
+        try:
+            job.output_path.parent.mkdir(parents=True, exist_ok=True)
+            tts.speak(job.text, voice=job.voice, output_path=job.output_path, verbose=False)
+            record['bytes'] = job.output_path.stat().st_size
+        except Exception as e:
+            error = str(e)
+    record['status'] = 'error' if error else 'ok'
+    record['seconds'] = round(time.monotonic() - started, 3)
+    if error:
+        record['error'] = error
+    return record
+
+
+def make_provider(config: TTSConfig, base_urls: Optional[List[str]]) -> OpenaiTTS:
+    """Return a provider for one endpoint, or one balancing across several."""
+    if base_urls and len(base_urls) > 1:
+        from openai_tts.providers.composite import CompositeTTS
+        return CompositeTTS(base_urls, config)
+    return OpenaiTTS(config)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='openai-tts',
+        description="Convert text files, directories, stdin or JSONL manifests to MP3 files in parallel."
+    )
+    parser.add_argument('inputs', nargs='*', help="Text files, directories of text files, or - for stdin")
+    parser.add_argument('-m', '--manifest', action='append', default=[],
+                        help="JSONL manifest with one {\"text\" or \"text_file\", \"voice\", \"output\"} object per line")
+    parser.add_argument('-o', '--output', default=None, help="Output file, when there is a single input")
+    parser.add_argument('-d', '--output-dir', default='.', help="Directory for output files (default: current directory)")
+    parser.add_argument('--pattern', default='*.txt', help="Glob for files inside directories, e.g. '**/*.txt' (default: *.txt)")
+    parser.add_argument('-r', '--results', default=None,
+                        help="Where to write the JSONL results manifest (default: OUTPUT_DIR/results.jsonl)")
+    parser.add_argument('-v', '--voice', type=parse_voice, default=None, help="Voice for inputs that do not set one")
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help="Maximum requests in flight across all files")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="Files rendered at the same time (default: --concurrency)")
+    parser.add_argument('-p', '--processes', type=int, default=None,
+                        help="Prepare (sanitize, tokenize, chunk) files in this many worker processes")
+    parser.add_argument('--chunk-chars', type=int, default=None, help="Pack sentences into chunks of up to this many characters")
+    parser.add_argument('--base-url', action='append', default=None,
+                        help="Endpoint base URL; repeat to balance requests across several endpoints")
+    parser.add_argument('--cache-dir', default=None, help="Directory of the on-disk audio cache")
+    parser.add_argument('--journal-dir', default=None, help="Directory of resume journals for interrupted files")
+    parser.add_argument('--rate-limit', type=float, default=None, help="Maximum requests per second")
+    parser.add_argument('--hedge', type=float, default=None, help="Hedge requests slower than this latency percentile, e.g. 0.95")
+    parser.add_argument('--metrics', default=None, help="Write Prometheus metrics to this file when done")
+    parser.add_argument('--progress-interval', type=float, default=2.0, help="Seconds between progress lines")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Only report failures")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command-line tool.
+
+    Returns:
+        int: Exit status, 0 if every job succeeded and 1 otherwise.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.manifest:
+        parser.error("nothing to do: pass input files, a directory, - for stdin, or --manifest")
+    jobs = collect_jobs(args, parser)
+    if not jobs:
+        parser.error("no input files found")
+
+    progress = Progress(len(jobs))
+    config = TTSConfig(
+        verbose=False,
+        max_concurrency=args.concurrency,
+        chunk_max_chars=args.chunk_chars,
+        cache_dir=args.cache_dir,
+        journal_dir=args.journal_dir,
+        rate_limit=args.rate_limit,
+        hedge_percentile=args.hedge,
+        instrumentation=progress
+    )
+    if args.voice is not None:
+        config.voice = args.voice
+    if args.base_url:
+        config.base_url = args.base_url[0]
+
+    results_path = Path(args.results) if args.results else Path(args.output_dir) / 'results.jsonl'
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    preprocessor = CorpusPreprocessor(args.processes, config) if args.processes else None
+    workers = args.jobs or args.concurrency
+    # Files handed to the runners but not finished yet, so preparation stays just ahead of synthesis.
+    slots = threading.BoundedSemaphore(2 * workers)
+    lock = threading.Lock()
+
+    def finished(future: Future) -> None:
+        record = future.result()
+        with lock:
+            results.write(json.dumps(record, ensure_ascii=False) + '\n')
+            results.flush()
+            progress.job_finished(record['status'] == 'ok')
+            if record['status'] != 'ok':
+                print(f"failed: {record['input']}: {record['error']}", file=sys.stderr)
+        slots.release()
+
+    if not args.quiet:
+        progress.start(args.progress_interval)
+    # Chunk requests of every file share the provider's worker pool, so --concurrency
+    # bounds the requests in flight no matter how many files run at once.
+    try:
+        with results_path.open('w', encoding='utf-8') as results, make_provider(config, args.base_url) as tts, \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="openai-tts-job") as runners:
+            for job in ready_jobs(jobs, preprocessor):
+                slots.acquire()
+                runners.submit(run_job, tts, job).add_done_callback(finished)
+    finally:
+        if preprocessor is not None:
+            preprocessor.close()
+    if not args.quiet:
+        progress.stop()
+    if args.metrics:
+        Path(args.metrics).write_text(progress.render_prometheus(), encoding='utf-8')
+    return 1 if progress.jobs_failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,20 @@
 """Configuration classes for TTS functionality."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List
-import os
+from typing import List, Optional
+import random
+
+from openai_tts.metrics import Instrumentation
+
+DEFAULT_PROMPT: str = (
+    'Voice: High quality, crisp, clear and with full of emotions like Excitement, confusion, surprise, '
+    'frustration, anger, disappointment, happiness, calmness, sarcasm, friendliness, flirtatiousness, '
+    'curiosity, and more. I use my tones, inflections, and pauses to convey these emotions just like a human would.'
+)
+
+# File written by speak() when no output path is configured, in the working directory at call time.
+DEFAULT_OUTPUT_FILE: str = "output.mp3"
 
 class VoiceType(Enum):
     """Enumeration of available voice types for text-to-speech."""
@@ -24,10 +35,53 @@ class VoiceType(Enum):
         """Get list of all available voice names."""
         return [voice.name for voice in cls]
 
+@dataclass
+class RetryPolicy:
+    """Retry settings for chunk requests."""
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    jitter: float = 0.5
+    deadline: Optional[float] = 120.0
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff delay in seconds after the given (1-based) failed attempt."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter * random.random())
+
 @dataclass
 class TTSConfig:
     """Configuration class for Text-to-Speech settings."""
     timeout: int = 30
     verbose: bool = True
-    output_path: str = os.path.join(os.getcwd(), "output.mp3")
+    output_path: Optional[str] = None
     voice: VoiceType = VoiceType.SHIMMER
+    base_url: str = "https://www.openai.fm"
+    prompt: str = DEFAULT_PROMPT
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+    journal_dir: Optional[str] = None
+    coalesce_requests: bool = True
+    max_concurrency: int = 16
+    max_pending_chunks: Optional[int] = None
+    chunk_max_chars: Optional[int] = None
+    first_chunk_chars: Optional[int] = None
+    rewrite_mp3_headers: bool = True
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    endpoint_ejection_time: float = 1.0
+    rate_limit: Optional[float] = None
+    rate_burst: int = 5
+    adaptive_concurrency: bool = False
+    latency_tolerance: float = 2.0
+    hedge_percentile: Optional[float] = None
+    hedge_max_ratio: float = 0.1
+    instrumentation: Optional[Instrumentation] = None
+
+@dataclass
+class SynthesisJob:
+    """A single text to render as part of a batch."""
+    text: str
+    voice: Optional[VoiceType] = None
+    output_path: Optional[str] = None
@@ -7,3 +7,7 @@ class TTSException(Exception):
 class TTSRequestError(TTSException):
     """Exception raised when there's an error in TTS request."""
     pass
+
+class TTSCircuitOpenError(TTSRequestError):
+    """Exception raised when requests are rejected because the endpoint is unhealthy."""
+    pass
@@ -0,0 +1,89 @@
+"""Hedged requests: duplicating unusually slow chunk requests to cut tail latency."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from typing import Deque, Dict, Optional
+
+
+class Hedger:
+    """
+    Decides when a slow chunk request should be duplicated.
+
+    Latencies of successful requests are kept in a sliding window. A request that
+    has been running for longer than the ``percentile`` of that window may be
+    hedged with a second, identical request; the first response wins, and a
+    winning hedge hands its audio to the original request so it stops. Every
+    finished request earns ``max_ratio`` hedge tokens (up to ``burst``) and every
+    hedge spends one, so hedging adds at most ``max_ratio`` extra requests per
+    request in the long run.
+    """
+
+    MIN_SAMPLES: int = 20
+
+    def __init__(self, percentile: float = 0.95, max_ratio: float = 0.1, window: int = 200, burst: float = 10.0) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._started: Dict[str, float] = {}
+        self._preempted: Dict[str, Future] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.hedges = 0
+
+    def begin(self, key: str) -> Future:
+        """
+        Note that the request for ``key`` has started.
+
+        Returns:
+            Future: Resolved with the audio of a hedge that beat the request, which
+            should then stop retrying and return that audio instead.
+        """
+        with self._lock:
+            self._started.setdefault(key, time.monotonic())
+            return self._preempted.setdefault(key, Future())
+
+    def end(self, key: str, latency: Optional[float] = None) -> None:
+        """Note that the request for ``key`` has finished, with its latency if it succeeded."""
+        with self._lock:
+            self._started.pop(key, None)
+            self._preempted.pop(key, None)
+            self._tokens = min(self.burst, self._tokens + self.max_ratio)
+            if latency is not None:
+                self._latencies.append(latency)
+
+    def preempt(self, key: str, audio: bytes) -> None:
+        """Hand the audio of a winning hedge to the request for ``key``, if it is still running."""
+        with self._lock:
+            preempted = self._preempted.get(key)
+        if preempted is not None:
+            try:
+                preempted.set_result(audio)
+            except InvalidStateError:
+                # Another hedge for the same key won first.
+                pass
+
+    def started_at(self, key: str) -> Optional[float]:
+        """Return when the request for ``key`` started, or None if it is not running."""
+        return self._started.get(key)
+
+    def delay(self) -> Optional[float]:
+        """Return how long a request may run before it is hedged, or None until enough latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.MIN_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+
+    def try_acquire(self) -> bool:
+        """Spend a hedge token if one is available."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
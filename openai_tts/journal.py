@@ -0,0 +1,112 @@
+"""On-disk checkpoint journal that lets an interrupted synthesis resume."""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+class Journal:
+    """
+    Record of the finished chunks of one synthesis job.
+
+    The journal directory holds ``manifest.jsonl``, an append-only list of
+    ``{"index", "key", "text"}`` records naming every chunk of the job in order,
+    and one ``<index>-<key>.mp3`` file per chunk that has been synthesized. Chunk
+    files are written atomically, so a crash never leaves a partial chunk behind.
+    When the same job runs again, chunks found in the journal are not requested.
+    """
+
+    MANIFEST = "manifest.jsonl"
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open or create a journal.
+
+        Args:
+            path (Union[str, Path]): Directory of this job's journal.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.entries: Dict[int, str] = {}
+        manifest = self.path / self.MANIFEST
+        if manifest.exists():
+            with manifest.open(encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry['index']] = entry['key']
+                    except (ValueError, KeyError, TypeError):
+                        # A torn last line from an interrupted write.
+                        continue
+        self._manifest = manifest.open('a', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._saves_done = threading.Condition(self._lock)
+        self._saving = 0
+        self._discarded = False
+
+    @classmethod
+    def for_output(cls, root: Union[str, Path], output_path: Union[str, Path]) -> "Journal":
+        """Return the journal of the job writing ``output_path``, kept under ``root``."""
+        job = hashlib.sha256(str(Path(output_path).resolve()).encode('utf-8')).hexdigest()[:32]
+        return cls(Path(root) / job)
+
+    def _chunk_path(self, index: int, key: str) -> Path:
+        return self.path / f"{index:06d}-{key}.mp3"
+
+    def record(self, index: int, key: str, text: str) -> None:
+        """Add a chunk to the manifest unless it is already listed with the same key."""
+        with self._lock:
+            if self.entries.get(index) == key:
+                return
+            self._manifest.write(json.dumps({'index': index, 'key': key, 'text': text}) + '\n')
+            self._manifest.flush()
+            self.entries[index] = key
+
+    def get(self, index: int, key: str) -> Optional[bytes]:
+        """Return the saved audio of a chunk, or None if it has not been synthesized yet."""
+        try:
+            return self._chunk_path(index, key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, index: int, key: str, audio: bytes) -> None:
+        """Save the audio of a finished chunk. Does nothing once the journal is discarded."""
+        with self._lock:
+            if self._discarded:
+                return
+            self._saving += 1
+        try:
+            path = self._chunk_path(index, key)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with tmp_path.open('wb') as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        finally:
+            with self._lock:
+                self._saving -= 1
+                self._saves_done.notify_all()
+
+    def close(self) -> None:
+        """Close the manifest, keeping the journal for a later run."""
+        with self._lock:
+            self._manifest.close()
+
+    def discard(self) -> None:
+        """
+        Close and delete the journal once its job has completed.
+
+        Chunks are saved from worker threads as they finish, so saves still in
+        progress are waited for, and later ones are ignored.
+        """
+        with self._lock:
+            self._discarded = True
+            self._saves_done.wait_for(lambda: not self._saving)
+        self.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __len__(self) -> int:
+        return len(self.entries)
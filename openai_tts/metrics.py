@@ -0,0 +1,177 @@
+"""Instrumentation hooks and a built-in metrics aggregator."""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+@dataclass
+class ChunkEvent:
+    """Outcome of producing the audio for one chunk."""
+    chunk_number: int
+    voice: str
+    queue_wait: float = 0.0
+    latency: float = 0.0
+    bytes_received: int = 0
+    attempts: int = 0
+    cache_hit: bool = False
+    error: Optional[str] = None
+    hedge: bool = False
+
+
+class Instrumentation:
+    """
+    Receiver for provider events. Subclass and override the hooks you need.
+
+    Set an instance as ``TTSConfig.instrumentation``. When it is None, the
+    providers skip event construction entirely. Hooks are called from worker
+    threads and must be thread-safe.
+    """
+
+    def on_chunk(self, event: ChunkEvent) -> None:
+        """
+        Called once per chunk, after a cache hit, a successful request or a final failure.
+
+        Hedged duplicate requests report their own event with ``hedge`` set.
+        """
+
+    def on_span(self, name: str, duration: float) -> None:
+        """
+        Called when a stage of a call finishes.
+
+        Span names are ``tokenize``, ``fan_out`` (first submission until the last
+        chunk is available) and ``write`` (time spent writing output).
+        """
+
+
+class Histogram:
+    """Thread-safe cumulative histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = q * self.count
+            seen = 0
+            for bound, count in zip(self.buckets, self.counts):
+                seen += count
+                if seen >= target:
+                    return bound
+            return float('inf')
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Aggregates provider events into counters and histograms.
+
+    ``render_prometheus()`` returns the metrics in the Prometheus text exposition format.
+    """
+
+    def __init__(self, namespace: str = "openai_tts", buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.namespace = namespace
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self.chunks: Dict[str, int] = {"ok": 0, "cache_hit": 0, "error": 0}
+        self.retries = 0
+        self.hedges = 0
+        self.bytes_received = 0
+        self.request_latency = Histogram(buckets)
+        self.queue_wait = Histogram(buckets)
+        self.spans: Dict[str, Histogram] = {}
+
+    def on_chunk(self, event: ChunkEvent) -> None:
+        if event.hedge:
+            with self._lock:
+                self.hedges += 1
+            return
+        result = "cache_hit" if event.cache_hit else ("error" if event.error else "ok")
+        with self._lock:
+            self.chunks[result] += 1
+            self.retries += max(0, event.attempts - 1)
+            self.bytes_received += event.bytes_received
+        if not event.cache_hit:
+            self.request_latency.observe(event.latency)
+            self.queue_wait.observe(event.queue_wait)
+
+    def on_span(self, name: str, duration: float) -> None:
+        histogram = self.spans.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.spans.setdefault(name, Histogram(self._buckets))
+        histogram.observe(duration)
+
+    def _histogram_lines(self, name: str, histogram: Histogram, labels: str = "") -> List[str]:
+        lines = []
+        with histogram._lock:
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels}le="+Inf"}} {histogram.count}')
+            suffix = f"{{{labels.rstrip(',')}}}" if labels else ""
+            lines.append(f"{name}_sum{suffix} {histogram.sum}")
+            lines.append(f"{name}_count{suffix} {histogram.count}")
+        return lines
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        with self._lock:
+            chunks = dict(self.chunks)
+            retries = self.retries
+            hedges = self.hedges
+            bytes_received = self.bytes_received
+            spans = dict(self.spans)
+
+        lines = [
+            f"# HELP {ns}_chunks_total Chunks produced, by result.",
+            f"# TYPE {ns}_chunks_total counter",
+        ]
+        lines += [f'{ns}_chunks_total{{result="{result}"}} {count}' for result, count in chunks.items()]
+        lines += [
+            f"# HELP {ns}_retries_total Request attempts beyond the first.",
+            f"# TYPE {ns}_retries_total counter",
+            f"{ns}_retries_total {retries}",
+            f"# HELP {ns}_hedges_total Hedged duplicate requests that ran to completion.",
+            f"# TYPE {ns}_hedges_total counter",
+            f"{ns}_hedges_total {hedges}",
+            f"# HELP {ns}_bytes_received_total Audio bytes received from the endpoint.",
+            f"# TYPE {ns}_bytes_received_total counter",
+            f"{ns}_bytes_received_total {bytes_received}",
+            f"# HELP {ns}_request_latency_seconds Time spent requesting a chunk, including retries.",
+            f"# TYPE {ns}_request_latency_seconds histogram",
+        ]
+        lines += self._histogram_lines(f"{ns}_request_latency_seconds", self.request_latency)
+        lines += [
+            f"# HELP {ns}_queue_wait_seconds Time a chunk waited for a worker.",
+            f"# TYPE {ns}_queue_wait_seconds histogram",
+        ]
+        lines += self._histogram_lines(f"{ns}_queue_wait_seconds", self.queue_wait)
+        lines += [
+            f"# HELP {ns}_span_duration_seconds Duration of call stages.",
+            f"# TYPE {ns}_span_duration_seconds histogram",
+        ]
+        for name, histogram in sorted(spans.items()):
+            lines += self._histogram_lines(f"{ns}_span_duration_seconds", histogram, f'span="{name}",')
+        return "\n".join(lines) + "\n"
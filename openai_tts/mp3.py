@@ -0,0 +1,353 @@
+"""MPEG audio frame parsing and single-header concatenation of MP3 chunks."""
+
+import io
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+# Bitrates in kbit/s for Layer III, indexed by the 4-bit bitrate field.
+BITRATES_V1: Tuple[int, ...] = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+BITRATES_V2: Tuple[int, ...] = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Sample rates in Hz, keyed by the 2-bit version field (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5).
+SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+XING_FLAGS = 0x0F  # Frames, bytes, TOC and quality fields present
+XING_SIZE = 120  # Tag, flags, frames, bytes, 100 byte TOC and quality
+TOC_POINTS = 100
+IOV_BATCH = 512
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """Decoded fields of a Layer III frame header."""
+    raw: bytes
+    version: int
+    bitrate_index: int
+    sample_rate: int
+    padding: int
+    mono: bool
+
+    @property
+    def mpeg1(self) -> bool:
+        return self.version == 3
+
+    @property
+    def bitrate(self) -> int:
+        """Bitrate in kbit/s."""
+        return (BITRATES_V1 if self.mpeg1 else BITRATES_V2)[self.bitrate_index]
+
+    @property
+    def samples(self) -> int:
+        """Samples per channel in one frame."""
+        return 1152 if self.mpeg1 else 576
+
+    @property
+    def side_info_size(self) -> int:
+        """Size of the side information following the header."""
+        if self.mpeg1:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+    @property
+    def length(self) -> int:
+        """Total frame length in bytes, header included."""
+        return (self.samples // 8) * self.bitrate * 1000 // self.sample_rate + self.padding
+
+
+def parse_header(data: bytes, offset: int = 0) -> Optional[FrameHeader]:
+    """
+    Decode the Layer III frame header at ``offset``.
+
+    Returns:
+        Optional[FrameHeader]: The header, or None if the bytes are not a valid Layer III header.
+    """
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    version = (b1 >> 3) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0 or version == 1 or (b1 >> 1) & 0x03 != 1:
+        return None
+    if bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    return FrameHeader(
+        raw=bytes(data[offset:offset + 4]),
+        version=version,
+        bitrate_index=bitrate_index,
+        sample_rate=SAMPLE_RATES[version][rate_index],
+        padding=(b2 >> 1) & 0x01,
+        mono=(b3 >> 6) == 3
+    )
+
+
+def id3v2_size(data: bytes, offset: int = 0) -> int:
+    """Return the size of an ID3v2 tag starting at ``offset``, or 0 if there is none."""
+    if data[offset:offset + 3] != b'ID3' or len(data) < offset + 10:
+        return 0
+    flags = data[offset + 5]
+    size = 0
+    for byte in data[offset + 6:offset + 10]:
+        size = (size << 7) | (byte & 0x7F)
+    return 10 + size + (10 if flags & 0x10 else 0)
+
+
+def is_info_frame(data: bytes, offset: int, header: FrameHeader) -> bool:
+    """Return True if the frame at ``offset`` carries a Xing, Info or VBRI header instead of audio."""
+    tag_offset = offset + 4 + header.side_info_size
+    if data[tag_offset:tag_offset + 4] in (b'Xing', b'Info'):
+        return True
+    return data[offset + 36:offset + 40] == b'VBRI'
+
+
+@dataclass
+class AudioFrames:
+    """Location of the audio frames inside one MP3 chunk."""
+    segments: List[Tuple[int, int]]
+    frame_lengths: List[int]
+    first_header: FrameHeader
+    bitrates: frozenset
+
+
+def scan_frames(data: bytes) -> Optional[AudioFrames]:
+    """
+    Locate the audio frames of an MP3 chunk, skipping tags and metadata frames.
+
+    Leading ID3v2 tags, a trailing ID3v1 tag, Xing/Info/VBRI frames, a truncated
+    last frame and any junk between frames are left out.
+
+    Args:
+        data (bytes): A complete MP3 file as returned by the endpoint.
+
+    Returns:
+        Optional[AudioFrames]: The frames found, or None if the data holds no audio frames.
+    """
+    start = 0
+    while True:
+        size = id3v2_size(data, start)
+        if not size:
+            break
+        start += size
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b'TAG':
+        end -= 128
+
+    segments: List[Tuple[int, int]] = []
+    frame_lengths: List[int] = []
+    bitrates = set()
+    first: Optional[FrameHeader] = None
+    segment_start = None
+    pos = start
+    while pos + 4 <= end:
+        header = parse_header(data, pos)
+        if header is None or pos + header.length > end or (
+            first is not None and (header.version, header.sample_rate) != (first.version, first.sample_rate)
+        ):
+            if segment_start is not None:
+                segments.append((segment_start, pos))
+                segment_start = None
+            next_sync = data.find(b'\xff', pos + 1, end)
+            if next_sync < 0:
+                break
+            pos = next_sync
+            continue
+        if is_info_frame(data, pos, header):
+            if segment_start is not None:
+                segments.append((segment_start, pos))
+                segment_start = None
+            pos += header.length
+            continue
+        if first is None:
+            first = header
+        if segment_start is None:
+            segment_start = pos
+        frame_lengths.append(header.length)
+        bitrates.add(header.bitrate_index)
+        pos += header.length
+    if segment_start is not None:
+        segments.append((segment_start, pos))
+    if first is None:
+        return None
+    return AudioFrames(segments, frame_lengths, first, frozenset(bitrates))
+
+
+def xing_frame(
+    template: FrameHeader,
+    frames: int = 0,
+    total_bytes: int = 0,
+    toc: Optional[bytes] = None,
+    vbr: bool = False
+) -> bytes:
+    """
+    Build a Xing (VBR) or Info (CBR) frame describing a whole file.
+
+    The frame copies the version, sample rate and channel mode of ``template`` and
+    uses the lowest bitrate whose frame can hold the header. Without ``toc`` an empty
+    placeholder frame of the same size is returned.
+    """
+    needed = 4 + template.side_info_size + XING_SIZE
+    bitrates = BITRATES_V1 if template.mpeg1 else BITRATES_V2
+    for bitrate_index in range(1, 15):
+        if (template.samples // 8) * bitrates[bitrate_index] * 1000 // template.sample_rate >= needed:
+            break
+    b0, b1, b2, b3 = template.raw
+    header = bytes((b0, b1 | 0x01, (bitrate_index << 4) | (b2 & 0x0C), b3))
+    length = (template.samples // 8) * bitrates[bitrate_index] * 1000 // template.sample_rate
+
+    frame = bytearray(length)
+    frame[:4] = header
+    offset = 4 + template.side_info_size
+    frame[offset:offset + 4] = b'Xing' if vbr else b'Info'
+    if toc is not None:
+        struct.pack_into('>III', frame, offset + 4, XING_FLAGS, frames, total_bytes)
+        frame[offset + 16:offset + 116] = toc
+    return bytes(frame)
+
+
+class MP3Writer:
+    """
+    Writes MP3 chunks to one file as a single, seekable MP3 stream.
+
+    Each chunk's ID3 tags and Xing/Info/VBRI frames are dropped, and the audio frames
+    are written as ``memoryview`` slices of the chunk, with ``os.writev`` when the
+    target is an unbuffered file. On seekable targets a placeholder Info frame is
+    written first and filled in on ``close()`` with the frame count, byte count and
+    seek table of the whole file. Chunks that cannot be parsed are written unchanged
+    and disable the header.
+    """
+
+    def __init__(self, file: BinaryIO, index: bool = True) -> None:
+        """
+        Args:
+            file (BinaryIO): Binary file object to write to.
+            index (bool): Whether to strip per-chunk metadata and write a file-wide header.
+        """
+        self.file = file
+        self.index = index
+        self.bytes_written = 0
+        self._fileno: Optional[int] = None
+        if hasattr(os, 'writev') and isinstance(file, io.FileIO):
+            self._fileno = file.fileno()
+        try:
+            self._seekable = file.seekable()
+        except (AttributeError, OSError, ValueError):
+            self._seekable = False
+        self._template: Optional[FrameHeader] = None
+        self._header_pos: Optional[int] = None
+        self._header_len = 0
+        self._frames = 0
+        self._audio_bytes = 0
+        self._bitrates: set = set()
+        self._valid = True
+        # Offsets of every ``_stride``-th frame, thinned out as the file grows.
+        self._offsets: List[int] = []
+        self._stride = 1
+
+    def _write_views(self, views: Sequence[memoryview]) -> None:
+        """Write every view, using vectored writes when possible."""
+        if self._fileno is None:
+            for view in views:
+                while view:
+                    written = self.file.write(view)
+                    if written is None:
+                        break
+                    view = view[written:]
+            return
+        views = list(views)
+        while views:
+            batch = views[:IOV_BATCH]
+            written = os.writev(self._fileno, batch)
+            consumed = 0
+            for view in batch:
+                if written < len(view):
+                    break
+                written -= len(view)
+                consumed += 1
+            views = views[consumed:]
+            if written:
+                views[0] = views[0][written:]
+
+    def _record_frames(self, frame_lengths: List[int]) -> None:
+        """Track frame offsets for the seek table with bounded memory."""
+        offset = self._audio_bytes
+        for length in frame_lengths:
+            if self._frames % self._stride == 0:
+                self._offsets.append(offset)
+                if len(self._offsets) > 4 * TOC_POINTS:
+                    self._offsets = self._offsets[::2]
+                    self._stride *= 2
+            self._frames += 1
+            offset += length
+        self._audio_bytes = offset
+
+    def write(self, *chunks: bytes) -> int:
+        """
+        Append one or more complete MP3 chunks.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        views: List[memoryview] = []
+        for chunk in chunks:
+            view = memoryview(chunk)
+            frames = scan_frames(chunk) if self.index else None
+            if frames is None:
+                # Not something we can parse; keep the bytes and give up on the header.
+                self._valid = self._valid and not self.index
+                views.append(view)
+                continue
+            if self._template is None:
+                self._template = frames.first_header
+                if self._seekable and self.bytes_written == 0:
+                    placeholder = xing_frame(self._template)
+                    self._header_pos = self.file.tell()
+                    self._header_len = len(placeholder)
+                    views.append(memoryview(placeholder))
+            elif (frames.first_header.version, frames.first_header.sample_rate) != (
+                self._template.version, self._template.sample_rate
+            ):
+                self._valid = False
+            self._bitrates |= frames.bitrates
+            self._record_frames(frames.frame_lengths)
+            views.extend(view[start:end] for start, end in frames.segments)
+
+        size = sum(len(view) for view in views)
+        self._write_views(views)
+        self.bytes_written += size
+        return size
+
+    def _toc(self, total_bytes: int) -> bytes:
+        """Build the 100 entry Xing seek table."""
+        toc = bytearray(TOC_POINTS)
+        for i in range(TOC_POINTS):
+            frame = i * self._frames // TOC_POINTS
+            sample = min(len(self._offsets) - 1, round(frame / self._stride))
+            position = self._header_len + self._offsets[sample]
+            toc[i] = min(255, position * 256 // total_bytes)
+        return bytes(toc)
+
+    def close(self) -> None:
+        """Fill in the file-wide header. The file itself is left open."""
+        if self._header_pos is None or not self._valid or not self._frames:
+            return
+        total_bytes = self._header_len + self._audio_bytes
+        header = xing_frame(
+            self._template,
+            frames=self._frames,
+            total_bytes=total_bytes,
+            toc=self._toc(total_bytes),
+            vbr=len(self._bitrates) > 1
+        )
+        end = self.file.tell()
+        self.file.seek(self._header_pos)
+        self._write_views([memoryview(header)])
+        self.file.seek(end)
+        self._header_pos = None
+
+    def __enter__(self) -> "MP3Writer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
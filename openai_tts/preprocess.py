@@ -0,0 +1,164 @@
+"""Parallel preparation of text corpora in a pool of worker processes."""
+
+import io
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, Optional, Tuple, Union
+
+from openai_tts.config import TTSConfig
+from openai_tts.utils import PreparedText, TextSource, iter_sentences, pack_sentences, split_into_sentences
+
+
+def _prepare(
+    source: Union[str, Path],
+    incremental: bool,
+    chunk_max_chars: Optional[int],
+    first_chunk_chars: Optional[int]
+) -> Tuple[str, bytes]:
+    """
+    Sanitize, tokenize and chunk one document in a worker process.
+
+    The chunks are returned as their concatenation plus an array of their lengths,
+    which pickles to two objects no matter how many chunks there are.
+    """
+    if not incremental:
+        chunks: Iterable[str] = split_into_sentences(source)
+    else:
+        chunks = iter_sentences(io.StringIO(source) if isinstance(source, str) else source)
+    if chunk_max_chars:
+        chunks = pack_sentences(chunks, chunk_max_chars, first_chunk_chars)
+    parts = []
+    lengths = array('L')
+    for chunk in chunks:
+        parts.append(chunk)
+        lengths.append(len(chunk))
+    return ''.join(parts), lengths.tobytes()
+
+
+def _unpack(text: str, lengths: bytes) -> PreparedText:
+    """Rebuild the chunks packed by ``_prepare``."""
+    sizes = array('L')
+    sizes.frombytes(lengths)
+    chunks = PreparedText()
+    offset = 0
+    for size in sizes:
+        chunks.append(text[offset:offset + size])
+        offset += size
+    return chunks
+
+
+class CorpusPreprocessor:
+    """
+    Sanitizes, tokenizes and chunks many documents in a pool of processes.
+
+    Each document is prepared by one worker exactly as ``speak()`` would split it,
+    so chunks, cache keys and journals are the same as without the pool. Paths are
+    read by the workers themselves, so only the path crosses the process boundary
+    on the way in and only the packed chunks on the way out. Parallelism is across
+    documents; a single very large document is still prepared by one process.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        config: Optional[TTSConfig] = None,
+        max_pending: Optional[int] = None,
+        mp_context=None
+    ) -> None:
+        """
+        Args:
+            processes (Optional[int]): Number of worker processes. Defaults to the number of CPUs.
+            config (Optional[TTSConfig]): Configuration whose chunking settings are used.
+            max_pending (Optional[int]): Documents submitted ahead of the one being yielded.
+                Defaults to four per process.
+            mp_context: Optional multiprocessing context for the pool.
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.config = config or TTSConfig()
+        self.max_pending = max(1, max_pending or 4 * self.processes)
+        self._mp_context = mp_context
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=self._mp_context)
+        return self._pool
+
+    def _submit(self, document: TextSource) -> Future:
+        """Send one document to the pool."""
+        if isinstance(document, str):
+            source, incremental = document, False
+        elif isinstance(document, os.PathLike):
+            source, incremental = Path(os.fspath(document)), True
+        elif hasattr(document, 'read'):
+            source, incremental = document.read(), True
+        else:
+            source, incremental = ''.join(document), True
+        return self._get_pool().submit(
+            _prepare, source, incremental, self.config.chunk_max_chars, self.config.first_chunk_chars
+        )
+
+    def iter_prepared(
+        self,
+        documents: Iterable[TextSource],
+        return_exceptions: bool = False
+    ) -> Iterator[Union[PreparedText, BaseException]]:
+        """
+        Prepare documents in parallel and yield them in input order.
+
+        Documents are read from ``documents`` only as fast as results are consumed,
+        so a synthesis stage can start on the first document while later ones are
+        still being prepared.
+
+        Args:
+            documents (Iterable[TextSource]): Texts, paths, file objects or iterables of text fragments.
+            return_exceptions (bool): Yield the exception of a document that could not be
+                prepared instead of raising it.
+
+        Returns:
+            Iterator[Union[PreparedText, BaseException]]: The chunks of each document,
+            ready to pass to ``speak()``.
+        """
+        documents = iter(documents)
+        window: Deque[Future] = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(window) < self.max_pending:
+                    document = next(documents, None)
+                    if document is None:
+                        exhausted = True
+                        break
+                    try:
+                        window.append(self._submit(document))
+                    except Exception as e:
+                        failed: Future = Future()
+                        failed.set_exception(e)
+                        window.append(failed)
+                if not window:
+                    return
+                future = window.popleft()
+                try:
+                    yield _unpack(*future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    yield e
+        finally:
+            for future in window:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "CorpusPreprocessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,6 +1,33 @@
 """TTS provider implementations."""
 
-from openai_tts.providers.base import TTSProvider
-from openai_tts.providers.openai import OpenaiTTS
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ['TTSProvider', 'OpenaiTTS']
\ No newline at end of file
+if TYPE_CHECKING:
+    from openai_tts.providers.base import TTSProvider
+    from openai_tts.providers.openai import OpenaiTTS
+    from openai_tts.providers.async_openai import AsyncOpenaiTTS
+    from openai_tts.providers.composite import AsyncCompositeTTS, CompositeTTS
+
+_EXPORTS = {
+    'TTSProvider': 'openai_tts.providers.base',
+    'OpenaiTTS': 'openai_tts.providers.openai',
+    'AsyncOpenaiTTS': 'openai_tts.providers.async_openai',
+    'CompositeTTS': 'openai_tts.providers.composite',
+    'AsyncCompositeTTS': 'openai_tts.providers.composite',
+}
+
+__all__ = ['TTSProvider', 'OpenaiTTS', 'AsyncOpenaiTTS', 'CompositeTTS', 'AsyncCompositeTTS']
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
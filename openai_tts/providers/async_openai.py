@@ -0,0 +1,541 @@
+"""Asyncio OpenAI TTS provider implementation."""
+
+import asyncio
+import io
+import time
+from collections import deque
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, BinaryIO, Callable, Deque, Dict, Iterable, Optional, Tuple, Union
+)
+
+from openai_tts.config import TTSConfig, VoiceType
+from openai_tts.exceptions import TTSException, TTSRequestError
+from openai_tts.journal import Journal
+from openai_tts.mp3 import MP3Writer
+from openai_tts.providers.openai import REQUEST_HEADERS, OpenaiTTS
+from openai_tts.resilience import response_status
+from openai_tts.singleflight import AsyncSingleFlight
+from openai_tts.sinks import OutputSink, as_writer
+from openai_tts.utils import TextSource, split_into_sentences
+
+if TYPE_CHECKING:
+    from curl_cffi import AsyncSession
+
+
+class AsyncOpenaiTTS(OpenaiTTS):
+    """
+    OpenAI TTS implementation for asyncio applications.
+
+    Requests are issued from a single ``curl_cffi`` ``AsyncSession`` and the number of
+    requests in flight across all calls on this instance is capped by
+    ``TTSConfig.max_concurrency``. The blocking ``speak`` API remains available.
+    """
+
+    SLOT_POLL_INTERVAL: float = 0.01
+
+    def __init__(self, config: Optional[TTSConfig] = None):
+        """
+        Initialize asyncio OpenAI TTS provider.
+
+        Args:
+            config (Optional[TTSConfig]): Configuration settings. Defaults to TTSConfig().
+        """
+        super().__init__(config)
+        self._async_session: Optional["AsyncSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._async_single_flight = AsyncSingleFlight()
+
+    def _get_async_session(self) -> "AsyncSession":
+        """Create the async session on first use so it binds to the running event loop."""
+        if self._async_session is None:
+            from curl_cffi import AsyncSession
+            self._async_session = AsyncSession(max_clients=self.config.max_concurrency)
+            self._async_session.headers.update(REQUEST_HEADERS)
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        return self._async_session
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking call on the event loop's default executor.
+
+        The cache and the journal do SQLite and file I/O, and a cache shared between
+        processes may wait up to ``AudioCache.TIMEOUT`` for its lock, so they are
+        never called from the event loop itself.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+    def _asave_to_journal(self, journal: Journal, chunk_number: int, key: str, task: asyncio.Task) -> None:
+        """Done callback saving a finished chunk to the journal from the default executor."""
+        if not task.cancelled() and task.exception() is None:
+            task.get_loop().run_in_executor(None, journal.put, chunk_number, key, task.result()[1])
+
+    async def _aacquire_slot(self, deadline: Optional[float]) -> None:
+        """Wait for the shared limiters without blocking the event loop."""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise TTSRequestError("Deadline exceeded while waiting for the rate limiter")
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if self.concurrency_limiter is not None:
+            # The limiter is shared with worker threads, so poll rather than block.
+            while not self.concurrency_limiter.try_acquire():
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TTSRequestError("Deadline exceeded while waiting for a request slot")
+                await asyncio.sleep(self.SLOT_POLL_INTERVAL)
+
+    async def _aattempt(
+        self,
+        chunk_number: int,
+        params: Dict[str, str],
+        config: TTSConfig,
+        deadline: Optional[float]
+    ) -> Tuple[bytes, Optional[Exception]]:
+        """
+        Send one generation request without blocking the event loop.
+
+        Returns:
+            Tuple[bytes, Optional[Exception]]: The audio, or empty audio and the error
+            of a failure that may be retried.
+
+        Raises:
+            TTSCircuitOpenError: If the endpoint's circuit is open.
+            TTSRequestError: If the request was rejected and must not be retried.
+        """
+        from curl_cffi import exceptions
+
+        # Wait for the limiters first, so a request that times out waiting never holds the probe.
+        await self._aacquire_slot(deadline)
+        self._check_circuit()
+        started = time.monotonic()
+        status: Optional[int] = None
+        audio = b''
+        error: Optional[Exception] = None
+        try:
+            response = await self._get_async_session().get(
+                self.PROVIDER_URL,
+                params=params,
+                timeout=self._request_timeout(config, deadline)
+            )
+            status = response.status_code
+            response.raise_for_status()
+            audio = response.content
+        except exceptions.RequestException as e:
+            status = response_status(e)
+            error = e
+        except BaseException:
+            # Cancelled or out of time: the endpoint's health is unknown, so let another request probe.
+            self.circuit_breaker.release_probe()
+            raise
+        finally:
+            self._release_slot(started, bool(audio), status)
+
+        return audio, self._record_outcome(audio, error, status, chunk_number, config)
+
+    async def _agenerate_audio_chunk(
+        self,
+        text: str,
+        chunk_number: int,
+        config: Optional[TTSConfig] = None,
+        deadline: Optional[float] = None,
+        queued_at: Optional[float] = None,
+        hedge: bool = False
+    ) -> tuple[int, bytes]:
+        """
+        Generate audio for a single text chunk without blocking the event loop.
+
+        Retries follow the same policy and circuit breaker as the blocking provider.
+
+        Args:
+            text (str): The text chunk to convert.
+            chunk_number (int): The sequence number of the chunk.
+            config (Optional[TTSConfig]): Configuration for this request. Defaults to the instance config.
+            deadline (Optional[float]): ``time.monotonic()`` value after which no retry is attempted.
+                Defaults to ``config.retry.deadline`` seconds from the start of this chunk.
+            queued_at (Optional[float]): ``time.monotonic()`` value when the chunk was queued,
+                used to report queue wait to ``config.instrumentation``.
+            hedge (bool): Whether this is a hedged duplicate of a slow request. Other
+                requests stop retrying once a hedge of them wins, and return its audio.
+
+        Returns:
+            tuple[int, bytes]: Chunk number and audio data.
+
+        Raises:
+            TTSRequestError: If the request fails.
+        """
+        config = config or self.config
+        params = self._request_params(text, config)
+        # Creates the semaphore on first use.
+        self._get_async_session()
+        key = self._chunk_key(text, config)
+        if queued_at is None:
+            queued_at = time.monotonic()
+
+        async with self._semaphore:
+            started_call = time.monotonic()
+            if deadline is None:
+                deadline = self._call_deadline(config)
+            preempted = self.hedger.begin(key) if self.hedger is not None and not hedge else None
+            attempt = 0
+            latency: Optional[float] = None
+            try:
+                while True:
+                    if preempted is not None and preempted.done():
+                        return chunk_number, preempted.result()
+                    attempt += 1
+                    audio, error = await self._aattempt(chunk_number, params, config, deadline)
+
+                    if audio:
+                        latency = time.monotonic() - started_call
+                        if self.cache is not None:
+                            await self._run_blocking(self.cache.put, key, audio)
+                        self._report_success(config, chunk_number, started_call, queued_at, attempt, audio, hedge)
+                        return chunk_number, audio
+
+                    delay = self._retry_delay(attempt, config, deadline)
+                    if delay is None:
+                        raise TTSRequestError(f"Chunk {chunk_number} failed after {attempt} attempts: {error}")
+                    if preempted is not None:
+                        # Wake up as soon as a hedge of this request has won.
+                        await asyncio.wait([asyncio.wrap_future(preempted)], timeout=delay)
+                    else:
+                        await asyncio.sleep(delay)
+            except Exception as e:
+                if config.instrumentation is not None:
+                    self._emit_chunk(config, chunk_number, started_call, queued_at, attempt, error=e, hedge=hedge)
+                raise
+            finally:
+                if self.hedger is not None:
+                    self.hedger.end(None if hedge else key, latency)
+
+    async def _asubmit_chunk(
+        self,
+        key: str,
+        text: str,
+        chunk_number: int,
+        config: TTSConfig,
+        on_done: Optional[Callable[[asyncio.Task], Any]] = None
+    ) -> tuple[int, bytes]:
+        """
+        Request a chunk, joining an identical request in flight when ``coalesce_requests`` is set.
+
+        ``on_done`` is called with the task of the request actually sent, so it also sees
+        audio that a coalesced request delivers after this caller was cancelled.
+        """
+        request = partial(self._agenerate_audio_chunk, text.strip(), chunk_number, config, None, time.monotonic())
+        if config.coalesce_requests:
+            return await self._async_single_flight.run(key, request, on_done)
+        task = asyncio.ensure_future(request())
+        if on_done is not None:
+            task.add_done_callback(on_done)
+        return await task
+
+    async def _aawait_chunk(
+        self,
+        task: asyncio.Task,
+        key: str,
+        text: str,
+        chunk_number: int,
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> bytes:
+        """Wait for the audio of a chunk, hedging its request like the blocking provider does."""
+        hedger = self.hedger
+        while hedger is not None and not task.done():
+            delay = hedger.delay()
+            if delay is None:
+                break
+            started = hedger.started_at(key)
+            timeout = delay if started is None else started + delay - time.monotonic()
+            if timeout > 0:
+                await asyncio.wait([task], timeout=timeout)
+                continue
+            if not hedger.try_acquire():
+                break
+
+            hedge = asyncio.ensure_future(
+                self._agenerate_audio_chunk(text.strip(), chunk_number, config, None, time.monotonic(), hedge=True)
+            )
+            try:
+                pending = {task, hedge}
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for winner in done:
+                        if not winner.cancelled() and winner.exception() is None and winner.result()[1]:
+                            if winner is hedge:
+                                hedger.preempt(key, winner.result()[1])
+                                task.cancel()
+                                if journal is not None:
+                                    await self._run_blocking(journal.put, chunk_number, key, winner.result()[1])
+                            return winner.result()[1]
+            finally:
+                hedge.cancel()
+            break
+        _, audio = await task
+        return audio
+
+    async def _aiter_audio(
+        self,
+        chunks: Iterable[str],
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Fetch audio for a sequence of chunks concurrently and yield it in chunk order.
+
+        Like the blocking provider, only a window of ``max_pending_chunks`` chunks is
+        scheduled ahead of the chunk being yielded, and an optional ``journal`` is
+        consulted and updated. Cache and journal lookups and saves run on the default
+        executor, so a slow disk or a cache locked by another process does not stall
+        the event loop.
+        """
+        self._get_async_session()
+        window_size = self._window_size(config)
+        window: Deque[tuple[int, str, str, Union[bytes, asyncio.Task]]] = deque()
+        chunks = iter(chunks)
+        chunk_number = 0
+
+        async def fill() -> None:
+            nonlocal chunk_number
+            while len(window) < window_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                chunk_number += 1
+                key = self._chunk_key(chunk, config)
+                audio = None
+                if journal is not None or self.cache is not None:
+                    audio = await self._run_blocking(self._lookup_chunk, key, chunk, chunk_number, config, journal)
+                if audio is None:
+                    save = partial(self._asave_to_journal, journal, chunk_number, key) if journal is not None else None
+                    audio = asyncio.ensure_future(self._asubmit_chunk(key, chunk, chunk_number, config, save))
+                window.append((chunk_number, key, chunk, audio))
+
+        started = ready = time.monotonic()
+        try:
+            await fill()
+            while window:
+                i, key, chunk, audio_data = window.popleft()
+                await fill()
+                if isinstance(audio_data, asyncio.Task):
+                    try:
+                        audio_data = await self._aawait_chunk(audio_data, key, chunk, i, config, journal)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        if config.verbose:
+                            print(f"Failed to generate audio for chunk {i}: {e}")
+                        raise
+                    ready = time.monotonic()
+                yield audio_data
+            if config.instrumentation is not None:
+                config.instrumentation.on_span("fan_out", ready - started)
+        finally:
+            for _, _, _, audio_data in window:
+                if isinstance(audio_data, asyncio.Task):
+                    audio_data.cancel()
+
+    async def aspeak_stream(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Convert text to speech, yielding audio in order as soon as each chunk is ready.
+
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            voice (Optional[VoiceType]): Optional voice override.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Yields:
+            bytes: MP3 audio for the next chunk of text.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        current_config = self._resolve_config(voice=voice, verbose=verbose, config=config)
+        chunks = self._iter_chunks(text, current_config)
+
+        audio_stream = self._aiter_audio(chunks, current_config)
+        try:
+            async for audio_data in audio_stream:
+                yield audio_data
+        except (GeneratorExit, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            raise TTSException(f"Failed to generate audio: {e}")
+        finally:
+            await audio_stream.aclose()
+
+    async def _awrite_audio(self, audio: AsyncIterator[bytes], file: BinaryIO, config: TTSConfig) -> int:
+        """Write chunk audio to a file object as one MP3 stream and return the bytes written."""
+        write_time = 0.0
+        writer = MP3Writer(file, index=config.rewrite_mp3_headers)
+        async for audio_data in audio:
+            write_started = time.monotonic()
+            writer.write(audio_data)
+            write_time += time.monotonic() - write_started
+        writer.close()
+        if config.instrumentation is not None:
+            config.instrumentation.on_span("write", write_time)
+        return writer.bytes_written
+
+    async def aspeak(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> str:
+        """
+        Convert text to speech and save it to a file without blocking the event loop.
+
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            voice (Optional[VoiceType]): Optional voice override.
+            output_path (Optional[Union[str, Path]]): Optional output file path.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Returns:
+            str: Path to the generated audio file.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        current_config = self._resolve_config(voice, output_path, verbose, config)
+        chunks = self._iter_chunks(text, current_config)
+        journal = None
+
+        try:
+            journal = await self._run_blocking(self._open_journal, current_config)
+            output_file = Path(current_config.output_path)
+            with output_file.open('wb', buffering=0) as f:
+                await self._awrite_audio(self._aiter_audio(chunks, current_config, journal), f, current_config)
+            if journal is not None:
+                # Waits for chunk saves still in progress before deleting the journal.
+                await self._run_blocking(journal.discard)
+
+            if current_config.verbose:
+                print(f"Audio saved to {output_file.absolute()}")
+            return str(output_file)
+
+        except asyncio.CancelledError:
+            if journal is not None:
+                journal.close()
+            raise
+        except Exception as e:
+            if journal is not None:
+                journal.close()
+                if current_config.verbose:
+                    print(f"Progress saved to journal {journal.path}")
+            raise TTSException(f"Failed to generate audio: {e}")
+
+    async def aspeak_to(
+        self,
+        text: TextSource,
+        sink: OutputSink,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> int:
+        """
+        Asyncio counterpart of ``speak_to()``.
+
+        The sink is written to from the event loop, so it should not block for long;
+        an ``io.BytesIO`` or a callable that queues the audio for an async uploader works well.
+
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            sink (OutputSink): Where to write the audio.
+            voice (Optional[VoiceType]): Optional voice override.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        current_config = self._resolve_config(voice=voice, verbose=verbose, config=config)
+        writer = as_writer(sink)
+        chunks = self._iter_chunks(text, current_config)
+        try:
+            return await self._awrite_audio(self._aiter_audio(chunks, current_config), writer, current_config)
+        except Exception as e:
+            raise TTSException(f"Failed to generate audio: {e}")
+
+    async def aspeak_bytes(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> bytes:
+        """
+        Asyncio counterpart of ``speak_bytes()``.
+
+        Returns:
+            bytes: The complete MP3 file.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        buffer = io.BytesIO()
+        await self.aspeak_to(text, buffer, voice, verbose, config)
+        return buffer.getvalue()
+
+    async def awarmup(self, connections: int = 1) -> int:
+        """
+        Asyncio counterpart of ``warmup()``.
+
+        Creates the async session and opens up to ``connections`` concurrent
+        connections to the endpoint, which stay alive for the requests that follow.
+
+        Args:
+            connections (int): Number of connections to open, capped at ``max_concurrency``.
+
+        Returns:
+            int: Number of connections that reached the endpoint.
+        """
+        from curl_cffi import exceptions
+
+        split_into_sentences("Warm up.")
+        session = self._get_async_session()
+        count = max(1, min(connections, self.config.max_concurrency))
+
+        async def connect() -> bool:
+            try:
+                await session.head(self.config.base_url, timeout=self.config.timeout)
+            except exceptions.RequestException as e:
+                if self.config.verbose:
+                    print(f"Warmup connection failed: {e}")
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(connect() for _ in range(count))))
+
+    async def aclose(self) -> None:
+        """Close the async HTTP session along with the blocking worker pool and sessions."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._semaphore = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncOpenaiTTS":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -9,10 +9,10 @@ from typing import (
     Optional,
     Union,
 )
-from typing_extensions import TypeAlias
 from dataclasses import dataclass, Field
 
-from openai_tts.config import TTSConfig
+from openai_tts.config import TTSConfig, VoiceType
+from openai_tts.utils import TextSource
 
 
 class TTSProvider(ABC):
@@ -33,3 +33,27 @@ class TTSProvider(ABC):
             TTSException: If there's an error during the conversion process
         """
         pass
+
+    @abstractmethod
+    def speak_stream(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> Generator[bytes, None, None]:
+        """Convert text to speech, yielding audio chunks in order as they become available.
+
+        Args:
+            text: The text to convert to speech
+            voice: The voice to use, overriding the configured one
+            verbose: Whether to print progress, overriding the configured setting
+            config: Configuration settings for the TTS operation
+
+        Yields:
+            bytes: Audio data for the next chunk of text
+
+        Raises:
+            TTSException: If there's an error during the conversion process
+        """
+        pass
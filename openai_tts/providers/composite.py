@@ -0,0 +1,216 @@
+"""Providers that spread chunk requests over several interchangeable endpoints."""
+
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from openai_tts.balancing import LoadBalancer
+from openai_tts.config import TTSConfig
+from openai_tts.exceptions import TTSCircuitOpenError
+from openai_tts.providers.async_openai import AsyncOpenaiTTS
+from openai_tts.providers.openai import OpenaiTTS
+from openai_tts.resilience import CircuitBreaker, CircuitGroup
+
+Route = Tuple[str, str, str]
+
+
+class CompositeTTS(OpenaiTTS):
+    """
+    OpenAI TTS provider that balances chunk requests across several endpoints.
+
+    Calls behave exactly like ``OpenaiTTS`` calls, with one worker pool, cache,
+    journal, hedger and retry policy for the whole provider; only the endpoint of
+    each request attempt is chosen per attempt by a ``LoadBalancer``. Endpoints with
+    lower latency and fewer requests in flight get more of the chunks. A failed
+    attempt ejects its endpoint for ``endpoint_ejection_time`` seconds and the retry
+    goes straight to another endpoint without backing off, while endpoints whose
+    circuit is open are skipped until it half-opens. Hedged requests are sent to an
+    endpoint other than the one already working on the chunk, so with
+    ``hedge_percentile`` set, chunks stuck on a degraded endpoint are moved to a
+    healthy one. The provider only fails fast once every endpoint's circuit is open.
+
+    Each endpoint keeps its own circuit breaker, rate limiter and adaptive
+    concurrency limiter, shared process-wide with any other provider for the same URL.
+    """
+
+    MEMBER_CLASS = OpenaiTTS
+
+    def __init__(self, endpoints: Sequence[Union[str, OpenaiTTS]], config: Optional[TTSConfig] = None):
+        """
+        Initialize the composite provider.
+
+        Args:
+            endpoints (Sequence[Union[str, OpenaiTTS]]): Base URLs of the endpoints, or providers
+                to send requests through. Providers passed in are not closed by this one.
+            config (Optional[TTSConfig]): Configuration settings. Defaults to TTSConfig().
+
+        Raises:
+            ValueError: If no endpoint is given.
+        """
+        if not endpoints:
+            raise ValueError("at least one endpoint is required")
+        config = config or TTSConfig()
+        # Members only send requests; caching, journaling, hedging and reporting happen here.
+        member_config = replace(
+            config, cache_dir=None, journal_dir=None, hedge_percentile=None, instrumentation=None
+        )
+        self.members: List[OpenaiTTS] = []
+        self._owned: List[OpenaiTTS] = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, str):
+                member = self.MEMBER_CLASS(replace(member_config, base_url=endpoint))
+                self._owned.append(member)
+            else:
+                member = endpoint
+            self.members.append(member)
+        self.balancer = LoadBalancer(
+            len(self.members),
+            ejection_time=config.endpoint_ejection_time,
+            max_ejection_time=config.circuit_reset_timeout
+        )
+        self._routes: Dict[Route, List[int]] = {}
+        self._routes_lock = threading.Lock()
+        super().__init__(config)
+        self.circuit_breaker = CircuitGroup([member.circuit_breaker for member in self.members])
+
+    def close(self) -> None:
+        """Shut down the worker pool and the endpoints created by this provider."""
+        super().close()
+        for member in self._owned:
+            member.close()
+
+    def _connect(self) -> int:
+        """Open the calling thread's connection to every endpoint, returning how many were reached."""
+        return sum(member._connect() for member in self.members)
+
+    def endpoint_health(self) -> List[Dict[str, Any]]:
+        """
+        Describe every endpoint as the balancer sees it.
+
+        Returns:
+            List[Dict[str, Any]]: Per endpoint, its URL, circuit state, smoothed latency
+            and success rate, requests in flight, finished requests and failures, and
+            whether it is currently ejected.
+        """
+        now = time.monotonic()
+        return [
+            {
+                'url': member.config.base_url,
+                'circuit': member.circuit_breaker.state,
+                'latency': stats.latency,
+                'success_rate': round(stats.success_rate, 3),
+                'in_flight': stats.in_flight,
+                'requests': stats.requests,
+                'failures': stats.failures,
+                'ejected': stats.ejected_until > now,
+            }
+            for member, stats in zip(self.members, self.balancer.snapshot())
+        ]
+
+    def _route(self, params: Dict[str, str]) -> Tuple[Route, int]:
+        """
+        Choose the endpoint for one attempt at a chunk.
+
+        Raises:
+            TTSCircuitOpenError: If the circuit of every endpoint is open.
+        """
+        route = (params['input'], params['voice'], params['prompt'])
+        available = [member.circuit_breaker.state != CircuitBreaker.OPEN for member in self.members]
+        with self._routes_lock:
+            busy = self._routes.setdefault(route, [])
+            index = self.balancer.choose(available, busy)
+            if index is None:
+                if not busy:
+                    del self._routes[route]
+                urls = ", ".join(member.config.base_url for member in self.members)
+                raise TTSCircuitOpenError(f"Circuits open for every endpoint ({urls}); failing fast until one recovers")
+            busy.append(index)
+        return route, index
+
+    def _finish(self, route: Route, index: int, ok: Optional[bool], latency: Optional[float] = None) -> None:
+        """Record the outcome of an attempt started with ``_route()``."""
+        with self._routes_lock:
+            busy = self._routes[route]
+            busy.remove(index)
+            if not busy:
+                del self._routes[route]
+        self.balancer.finish(index, ok, latency)
+
+    def _attempt(
+        self,
+        chunk_number: int,
+        params: Dict[str, str],
+        config: TTSConfig,
+        deadline: Optional[float]
+    ) -> Tuple[bytes, Optional[Exception]]:
+        """Send one generation request to the endpoint the balancer picks."""
+        route, index = self._route(params)
+        started = time.monotonic()
+        try:
+            audio, error = self.members[index]._attempt(chunk_number, params, config, deadline)
+        except TTSCircuitOpenError as e:
+            # Another attempt got the half-open probe; try a different endpoint.
+            self._finish(route, index, False)
+            return b'', e
+        except BaseException:
+            self._finish(route, index, None)
+            raise
+        self._finish(route, index, bool(audio), time.monotonic() - started if audio else None)
+        return audio, error
+
+    def _retry_delay(self, attempt: int, config: TTSConfig, deadline: Optional[float]) -> Optional[float]:
+        """Retry at once while another endpoint is healthy, and back off once none is."""
+        delay = super()._retry_delay(attempt, config, deadline)
+        if delay is not None and self.balancer.has_healthy():
+            return 0.0
+        return delay
+
+
+class AsyncCompositeTTS(CompositeTTS, AsyncOpenaiTTS):
+    """
+    Asyncio counterpart of ``CompositeTTS``.
+
+    Endpoints given as URLs become ``AsyncOpenaiTTS`` providers, each with its own
+    async session; providers passed in must be ``AsyncOpenaiTTS`` instances. The number
+    of requests in flight across all endpoints is capped by ``max_concurrency``.
+    """
+
+    MEMBER_CLASS = AsyncOpenaiTTS
+
+    async def _aattempt(
+        self,
+        chunk_number: int,
+        params: Dict[str, str],
+        config: TTSConfig,
+        deadline: Optional[float]
+    ) -> Tuple[bytes, Optional[Exception]]:
+        """Send one generation request to the endpoint the balancer picks, without blocking."""
+        route, index = self._route(params)
+        started = time.monotonic()
+        try:
+            audio, error = await self.members[index]._aattempt(chunk_number, params, config, deadline)
+        except TTSCircuitOpenError as e:
+            self._finish(route, index, False)
+            return b'', e
+        except BaseException:
+            self._finish(route, index, None)
+            raise
+        self._finish(route, index, bool(audio), time.monotonic() - started if audio else None)
+        return audio, error
+
+    async def awarmup(self, connections: int = 1) -> int:
+        """
+        Open up to ``connections`` connections to every endpoint.
+
+        Returns:
+            int: Number of connections that reached an endpoint.
+        """
+        return sum(await asyncio.gather(*(member.awarmup(connections) for member in self.members)))
+
+    async def aclose(self) -> None:
+        """Close the async sessions of the endpoints created by this provider, then the provider."""
+        for member in self._owned:
+            await member.aclose()
+        await super().aclose()
@@ -1,20 +1,86 @@
 """OpenAI TTS provider implementation."""
 
+import io
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from collections import deque
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, Optional, Union, List, Generator, AsyncGenerator
-from typing_extensions import TypeAlias
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, Deque, Dict, Optional, Set, Tuple, Union, List, Generator, AsyncGenerator,
+    Iterable, Iterator
+)
 from uuid import uuid4
 
-from curl_cffi import Session, exceptions
-
-from openai_tts.config import TTSConfig, VoiceType
-from openai_tts.exceptions import TTSException, TTSRequestError
+from openai_tts.cache import AudioCache, chunk_cache_key
+from openai_tts.config import DEFAULT_OUTPUT_FILE, SynthesisJob, TTSConfig, VoiceType
+from openai_tts.exceptions import TTSCircuitOpenError, TTSException, TTSRequestError
+from openai_tts.hedging import Hedger
+from openai_tts.journal import Journal
+from openai_tts.metrics import ChunkEvent
+from openai_tts.mp3 import MP3Writer
 from openai_tts.providers.base import TTSProvider
-from openai_tts.utils import split_into_sentences
+from openai_tts.ratelimit import (
+    AdaptiveConcurrencyLimiter,
+    TokenBucket,
+    get_concurrency_limiter,
+    get_rate_limiter,
+)
+from openai_tts.resilience import get_circuit_breaker, is_retryable_status, response_status
+from openai_tts.singleflight import SingleFlight
+from openai_tts.sinks import OutputSink, as_writer
+from openai_tts.utils import PreparedText, TextSource, iter_sentences, pack_sentences, split_into_sentences
+
+if TYPE_CHECKING:
+    from curl_cffi import Session
+
+REQUEST_HEADERS: Dict[str, str] = {
+    'sec-ch-ua-platform': '"Windows"',
+    'Referer': 'https://www.openai.fm/',
+    'sec-ch-ua': '"Microsoft Edge";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
+    'sec-ch-ua-mobile': '?0',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36 Edg/137.0.0.0',
+    'DNT': '1',
+    'Range': 'bytes=0-',
+}
+
+
+@dataclass
+class _Batch:
+    """
+    Bookkeeping of one ``speak_many`` call.
+
+    Chunk audio is kept only while a job that has not been written or failed
+    still uses it.
+    """
+    configs: List[TTSConfig]
+    keys: List[List[str]] = field(default_factory=list)
+    users: Dict[str, Set[int]] = field(default_factory=dict)
+    audio: Dict[str, bytes] = field(default_factory=dict)
+    pending: Dict[str, Tuple[str, TTSConfig]] = field(default_factory=dict)
+    remaining: List[int] = field(default_factory=list)
+    errors: Dict[int, Exception] = field(default_factory=dict)
+    results: List[Optional[str]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.results = [None] * len(self.configs)
+
+    def jobs_using(self, key: str) -> Set[int]:
+        """Return the jobs still waiting for a chunk."""
+        return set(self.users.get(key, ()))
+
+    def release(self, job_index: int) -> None:
+        """Drop the audio no other job still needs, once a job is written or has failed."""
+        for key in set(self.keys[job_index]):
+            users = self.users[key]
+            if job_index in users:
+                users.discard(job_index)
+                if not users:
+                    self.audio.pop(key, None)
 
 
 class OpenaiTTS(TTSProvider):
@@ -28,29 +94,350 @@ class OpenaiTTS(TTSProvider):
             config (Optional[TTSConfig]): Configuration settings. Defaults to TTSConfig().
         """
         self.config = config or TTSConfig()
+        self.cache: Optional[AudioCache] = None
+        if self.config.cache_dir:
+            self.cache = AudioCache(self.config.cache_dir, max_bytes=self.config.cache_max_bytes)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
         self._setup_session()
 
     def _setup_session(self) -> None:
-        """Set up the HTTP session with required headers."""
-        self.PROVIDER_URL: str = "https://www.openai.fm/api/generate"
-        self.session = Session()
-        self.session.headers.update({
-            'sec-ch-ua-platform': '"Windows"',
-            'Referer': 'https://www.openai.fm/',
-            'sec-ch-ua': '"Microsoft Edge";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
-            'sec-ch-ua-mobile': '?0',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36 Edg/137.0.0.0',
-            'DNT': '1',
-            'Range': 'bytes=0-',
-        })
-
-    def _generate_audio_chunk(self, text: str, chunk_number: int) -> tuple[int, bytes]:
+        """Set up the per-thread HTTP session pool."""
+        self.PROVIDER_URL: str = f"{self.config.base_url.rstrip('/')}/api/generate"
+        self._local = threading.local()
+        self._sessions: List["Session"] = []
+        self.circuit_breaker = get_circuit_breaker(
+            self.PROVIDER_URL,
+            failure_threshold=self.config.circuit_failure_threshold,
+            reset_timeout=self.config.circuit_reset_timeout
+        )
+        self.rate_limiter: Optional[TokenBucket] = None
+        if self.config.rate_limit:
+            self.rate_limiter = get_rate_limiter(self.PROVIDER_URL, self.config.rate_limit, self.config.rate_burst)
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+        if self.config.adaptive_concurrency:
+            self.concurrency_limiter = get_concurrency_limiter(
+                self.PROVIDER_URL,
+                initial_limit=min(4, self.config.max_concurrency),
+                max_limit=self.config.max_concurrency,
+                latency_tolerance=self.config.latency_tolerance
+            )
+        self.hedger: Optional[Hedger] = None
+        if self.config.hedge_percentile:
+            self.hedger = Hedger(self.config.hedge_percentile, self.config.hedge_max_ratio)
+
+    @property
+    def session(self) -> "Session":
+        """
+        HTTP session owned by the calling thread.
+
+        Each worker thread keeps its own session, and with it its own alive TLS
+        connections, for the lifetime of the provider.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            # curl_cffi dominates the package's import time, so it is loaded on first use.
+            from curl_cffi import Session
+            session = Session()
+            session.headers.update(REQUEST_HEADERS)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the long-lived worker pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrency,
+                    thread_name_prefix="openai-tts"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool and close every pooled HTTP session."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Pay the one-off setup costs before the first request.
+
+        Loads ``curl_cffi``, creates the HTTP sessions of up to ``connections`` worker
+        threads and opens a connection from each of them to the endpoint with a
+        ``HEAD`` request. The connections are kept alive for the requests that follow,
+        so the first ``speak`` does not wait for TCP and TLS handshakes.
+
+        Args:
+            connections (int): Number of worker connections to open, capped at ``max_concurrency``.
+
+        Returns:
+            int: Number of connections that reached the endpoint.
+        """
+        split_into_sentences("Warm up.")
+        count = max(1, min(connections, self.config.max_concurrency))
+        # Holding every task until all have started puts each one on its own worker thread.
+        barrier = threading.Barrier(count)
+
+        def connect() -> int:
+            try:
+                barrier.wait(timeout=self.config.timeout)
+            except threading.BrokenBarrierError:
+                pass
+            return self._connect()
+
+        executor = self._get_executor()
+        return sum(future.result() for future in [executor.submit(connect) for _ in range(count)])
+
+    def _connect(self) -> int:
+        """Open the calling thread's connection to the endpoint, returning 1 if it was reached."""
+        from curl_cffi import exceptions
+
+        try:
+            self.session.head(self.config.base_url, timeout=self.config.timeout)
+        except exceptions.RequestException as e:
+            if self.config.verbose:
+                print(f"Warmup connection failed: {e}")
+            return 0
+        return 1
+
+    def __enter__(self) -> "OpenaiTTS":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _chunk_key(self, text: str, config: TTSConfig) -> str:
+        """Return the cache key identifying the audio for a chunk of text."""
+        return chunk_cache_key(text, config.voice.value, config.prompt)
+
+    def _request_params(self, text: str, config: TTSConfig) -> Dict[str, str]:
+        """Build the query parameters for a generation request."""
+        return {
+            'input': text.strip(),
+            'prompt': config.prompt,
+            'voice': str(config.voice.value),
+            'generation': str(uuid4()),
+        }
+
+    def _call_deadline(self, config: TTSConfig) -> Optional[float]:
+        """Return the monotonic time after which a chunk stops retrying, if bounded."""
+        if config.retry.deadline is None:
+            return None
+        return time.monotonic() + config.retry.deadline
+
+    def _retry_delay(self, attempt: int, config: TTSConfig, deadline: Optional[float]) -> Optional[float]:
+        """Return how long to wait before the next attempt, or None if retries are exhausted."""
+        if attempt >= config.retry.max_attempts:
+            return None
+        delay = config.retry.backoff(attempt)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def _request_timeout(self, config: TTSConfig, deadline: Optional[float]) -> float:
+        """Clamp the request timeout so a single attempt cannot overrun the chunk deadline."""
+        if deadline is None:
+            return config.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TTSRequestError("Deadline exceeded before the request could be sent")
+        return min(config.timeout, remaining)
+
+    def _acquire_slot(self, deadline: Optional[float]) -> None:
+        """Wait for the rate limiter and the adaptive concurrency limiter, if enabled."""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise TTSRequestError("Deadline exceeded while waiting for the rate limiter")
+            if delay > 0:
+                time.sleep(delay)
+        if self.concurrency_limiter is not None:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self.concurrency_limiter.acquire(timeout):
+                raise TTSRequestError("Deadline exceeded while waiting for a request slot")
+
+    def _return_slot(self) -> None:
+        """Give back a concurrency permit that was not used for a request."""
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(0.0, success=False)
+
+    def _release_slot(self, started: float, success: bool, status: Optional[int]) -> None:
+        """Report a finished request to the adaptive concurrency limiter."""
+        if self.concurrency_limiter is not None:
+            overloaded = not success and (status is None or status == 429 or status >= 500)
+            self.concurrency_limiter.release(time.monotonic() - started, success, overloaded)
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the endpoint's circuit is open, giving back the slot already taken."""
+        try:
+            self.circuit_breaker.check(self.PROVIDER_URL)
+        except TTSCircuitOpenError:
+            self._return_slot()
+            raise
+
+    def _record_outcome(
+        self,
+        audio: bytes,
+        error: Optional[Exception],
+        status: Optional[int],
+        chunk_number: int,
+        config: TTSConfig
+    ) -> Optional[Exception]:
+        """
+        Report the outcome of a request to the circuit breaker and classify its failure.
+
+        Returns:
+            Optional[Exception]: None if the request produced audio, otherwise the error
+            of a failure that may be retried.
+
+        Raises:
+            TTSRequestError: If the request was rejected and must not be retried.
+        """
+        if audio:
+            self.circuit_breaker.record_success()
+            return None
+        if error is None:
+            self.circuit_breaker.record_failure()
+            if config.verbose:
+                print(f"No data received for chunk {chunk_number}.")
+            return TTSRequestError("empty response body")
+        if not is_retryable_status(status):
+            self.circuit_breaker.record_success()
+            raise TTSRequestError(f"Chunk {chunk_number} was rejected: {error}")
+        # Throttling means the endpoint is up; leave it to the rate controls.
+        if status == 429:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+        if config.verbose:
+            print(f"Error processing chunk {chunk_number}: {error}")
+        return error
+
+    def _emit_chunk(
+        self,
+        config: TTSConfig,
+        chunk_number: int,
+        started: float,
+        queued_at: Optional[float],
+        attempts: int,
+        audio: bytes = b'',
+        error: Optional[Exception] = None,
+        hedge: bool = False
+    ) -> None:
+        """Report a finished chunk request to the configured instrumentation."""
+        config.instrumentation.on_chunk(ChunkEvent(
+            chunk_number=chunk_number,
+            voice=config.voice.value,
+            queue_wait=started - queued_at if queued_at is not None else 0.0,
+            latency=time.monotonic() - started,
+            bytes_received=len(audio),
+            attempts=attempts,
+            error=str(error) if error is not None else None,
+            hedge=hedge
+        ))
+
+    def _report_success(
+        self,
+        config: TTSConfig,
+        chunk_number: int,
+        started: float,
+        queued_at: Optional[float],
+        attempts: int,
+        audio: bytes,
+        hedge: bool
+    ) -> None:
+        """Announce a chunk that produced audio."""
+        if config.verbose:
+            print(f"Chunk {chunk_number} processed successfully.")
+        if config.instrumentation is not None:
+            self._emit_chunk(config, chunk_number, started, queued_at, attempts, audio=audio, hedge=hedge)
+
+    def _attempt(
+        self,
+        chunk_number: int,
+        params: Dict[str, str],
+        config: TTSConfig,
+        deadline: Optional[float]
+    ) -> Tuple[bytes, Optional[Exception]]:
+        """
+        Send one generation request, honouring the circuit breaker and the limiters.
+
+        Returns:
+            Tuple[bytes, Optional[Exception]]: The audio, or empty audio and the error
+            of a failure that may be retried.
+
+        Raises:
+            TTSCircuitOpenError: If the endpoint's circuit is open.
+            TTSRequestError: If the request was rejected and must not be retried.
+        """
+        from curl_cffi import exceptions
+
+        # Wait for the limiters first, so a request that times out waiting never holds the probe.
+        self._acquire_slot(deadline)
+        self._check_circuit()
+        started = time.monotonic()
+        status: Optional[int] = None
+        audio = b''
+        error: Optional[Exception] = None
+        try:
+            response = self.session.get(
+                self.PROVIDER_URL,
+                params=params,
+                timeout=self._request_timeout(config, deadline)
+            )
+            status = response.status_code
+            response.raise_for_status()
+            audio = response.content
+        except exceptions.RequestException as e:
+            status = response_status(e)
+            error = e
+        except BaseException:
+            # Cancelled or out of time: the endpoint's health is unknown, so let another request probe.
+            self.circuit_breaker.release_probe()
+            raise
+        finally:
+            self._release_slot(started, bool(audio), status)
+
+        return audio, self._record_outcome(audio, error, status, chunk_number, config)
+
+    def _generate_audio_chunk(
+        self,
+        text: str,
+        chunk_number: int,
+        config: Optional[TTSConfig] = None,
+        deadline: Optional[float] = None,
+        queued_at: Optional[float] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> tuple[int, bytes]:
         """
         Generate audio for a single text chunk.
 
+        Failed attempts are retried with exponential backoff until ``config.retry``
+        is exhausted or the deadline passes. Requests fail fast while the endpoint's
+        circuit breaker is open.
+
         Args:
             text (str): The text chunk to convert.
             chunk_number (int): The sequence number of the chunk.
+            config (Optional[TTSConfig]): Configuration for this request. Defaults to the instance config.
+            deadline (Optional[float]): ``time.monotonic()`` value after which no retry is attempted.
+                Defaults to ``config.retry.deadline`` seconds from the start of this chunk.
+            queued_at (Optional[float]): ``time.monotonic()`` value when the chunk was queued,
+                used to report queue wait to ``config.instrumentation``.
+            cancel (Optional[threading.Event]): Set for hedged requests; once set, the request
+                gives up before its next attempt and returns empty audio. A request that is
+                not a hedge stops as soon as a hedge of it wins, and returns the hedge's audio.
 
         Returns:
             tuple[int, bytes]: Chunk number and audio data.
@@ -58,38 +445,340 @@ class OpenaiTTS(TTSProvider):
         Raises:
             TTSRequestError: If the request fails.
         """
-        params = {
-            'input': text.strip(),
-            'prompt': 'Voice: High quality, crisp, clear and with full of emotions like Excitement, confusion, surprise, frustration, anger, disappointment, happiness, calmness, sarcasm, friendliness, flirtatiousness, curiosity, and more. I use my tones, inflections, and pauses to convey these emotions just like a human would.',
-            'voice': str(self.config.voice.value),
-            'generation': str(uuid4()),
-        }
+        config = config or self.config
+        params = self._request_params(text, config)
+        if deadline is None:
+            deadline = self._call_deadline(config)
+        hedge = cancel is not None
+        key = self._chunk_key(text, config)
+        preempted = self.hedger.begin(key) if self.hedger is not None and not hedge else None
+
+        started_call = time.monotonic()
+        attempt = 0
+        latency: Optional[float] = None
+        try:
+            while True:
+                if hedge and cancel.is_set():
+                    return chunk_number, b''
+                if preempted is not None and preempted.done():
+                    return chunk_number, preempted.result()
+                attempt += 1
+                audio, error = self._attempt(chunk_number, params, config, deadline)
+
+                if audio:
+                    latency = time.monotonic() - started_call
+                    if self.cache is not None:
+                        self.cache.put(key, audio)
+                    self._report_success(config, chunk_number, started_call, queued_at, attempt, audio, hedge)
+                    return chunk_number, audio
+
+                delay = self._retry_delay(attempt, config, deadline)
+                if delay is None:
+                    raise TTSRequestError(f"Chunk {chunk_number} failed after {attempt} attempts: {error}")
+                # Back off, but wake up as soon as the other request of a hedged pair has won.
+                if hedge:
+                    cancel.wait(delay)
+                elif preempted is not None:
+                    wait([preempted], delay)
+                else:
+                    time.sleep(delay)
+        except Exception as e:
+            if config.instrumentation is not None:
+                self._emit_chunk(config, chunk_number, started_call, queued_at, attempt, error=e, hedge=hedge)
+            raise
+        finally:
+            if self.hedger is not None:
+                self.hedger.end(None if hedge else key, latency)
+
+    def _resolve_config(
+        self,
+        voice: Optional[VoiceType] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> TTSConfig:
+        """Merge per-call overrides into the base configuration."""
+        current_config = config or self.config
+        if output_path is None and current_config.output_path is None:
+            output_path = os.path.join(os.getcwd(), DEFAULT_OUTPUT_FILE)
+
+        if voice is not None or output_path is not None or verbose is not None:
+            current_config = replace(
+                current_config,
+                voice=voice or current_config.voice,
+                output_path=Path(output_path) if output_path else current_config.output_path,
+                verbose=verbose if verbose is not None else current_config.verbose
+            )
+
+        assert isinstance(current_config, TTSConfig), "config must be an instance of TTSConfig"
+        assert current_config.voice in VoiceType, f"Voice must be one of {VoiceType.get_voice_names()}"
+        return current_config
+
+    def _split_text(self, text: str, config: TTSConfig) -> List[str]:
+        """Split text into the chunks sent as individual requests."""
+        started = time.monotonic()
+        chunks = split_into_sentences(text)
+        if config.chunk_max_chars:
+            chunks = list(pack_sentences(chunks, config.chunk_max_chars, config.first_chunk_chars))
+        if config.instrumentation is not None:
+            config.instrumentation.on_span("tokenize", time.monotonic() - started)
+        return chunks
+
+    def _iter_chunks(self, source: TextSource, config: TTSConfig) -> Iterator[str]:
+        """
+        Split a text source into the chunks sent as individual requests.
+
+        Strings are tokenized in one pass. Paths, file objects and iterables are read
+        and tokenized incrementally, so only a small part of the text is held in memory.
+        A PreparedText is already chunked and is used as is.
+        """
+        if isinstance(source, PreparedText):
+            return iter(source)
+        if isinstance(source, str):
+            return iter(self._split_text(source, config))
+        chunks = iter_sentences(source)
+        if config.chunk_max_chars:
+            chunks = pack_sentences(chunks, config.chunk_max_chars, config.first_chunk_chars)
+        return chunks
+
+    def _window_size(self, config: TTSConfig) -> int:
+        """Return how many chunks may be queued or in flight ahead of the one being written."""
+        return max(1, config.max_pending_chunks or 4 * config.max_concurrency)
+
+    def _open_journal(self, config: TTSConfig) -> Optional[Journal]:
+        """Open the checkpoint journal of a call writing to ``config.output_path``, if enabled."""
+        if not config.journal_dir:
+            return None
+        journal = Journal.for_output(config.journal_dir, config.output_path)
+        if config.verbose and len(journal):
+            print(f"Resuming from journal {journal.path} ({len(journal)} chunks recorded)")
+        return journal
 
-        while True:
+    def _save_to_journal(self, journal: Journal, chunk_number: int, key: str, future: Future) -> None:
+        """Done callback saving a finished chunk to the journal."""
+        if not future.cancelled() and future.exception() is None:
+            journal.put(chunk_number, key, future.result()[1])
+
+    def _cached_audio(
+        self,
+        key: str,
+        chunk_number: int,
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> Optional[bytes]:
+        """Return the journaled or cached audio for a chunk, reporting the hit to the instrumentation."""
+        audio = journal.get(chunk_number, key) if journal is not None else None
+        if audio is None and self.cache is not None:
+            audio = self.cache.get(key)
+        if audio is not None and config.instrumentation is not None:
+            config.instrumentation.on_chunk(ChunkEvent(chunk_number, config.voice.value, cache_hit=True))
+        return audio
+
+    def _lookup_chunk(
+        self,
+        key: str,
+        text: str,
+        chunk_number: int,
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> Optional[bytes]:
+        """List a chunk in the journal's manifest, then return its journaled or cached audio, if any."""
+        if journal is not None:
+            journal.record(chunk_number, key, text)
+        return self._cached_audio(key, chunk_number, config, journal)
+
+    def _submit_chunk(
+        self,
+        key: str,
+        text: str,
+        chunk_number: int,
+        config: TTSConfig,
+        queued_at: float,
+        on_done: Optional[Callable[[Future], Any]] = None
+    ) -> Future:
+        """
+        Schedule the request for a chunk on the worker pool.
+
+        With ``coalesce_requests`` enabled, a chunk whose key is already being requested,
+        by this call or any other, joins that request instead of sending another one.
+        ``on_done`` is called with the future of the request actually sent, so it also
+        sees audio that arrives after the returned future was cancelled.
+        """
+        args = (text.strip(), chunk_number, config, None, queued_at)
+        if config.coalesce_requests:
+            return self._single_flight.submit(
+                key, self._get_executor(), self._generate_audio_chunk, *args, callback=on_done
+            )
+        future = self._get_executor().submit(self._generate_audio_chunk, *args)
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        return future
+
+    def _await_chunk(
+        self,
+        future: Future,
+        key: str,
+        text: str,
+        chunk_number: int,
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> bytes:
+        """
+        Wait for the audio of a chunk, hedging its request if it runs unusually long.
+
+        Once the request has been running for longer than the hedging percentile of
+        recent latencies, and the hedging budget allows it, a duplicate request is sent.
+        The first successful response wins and the other request is cancelled. A
+        primary request that is already running finishes its current attempt, then
+        returns the hedge's audio to everyone waiting for it instead of retrying.
+        """
+        hedger = self.hedger
+        while hedger is not None and not future.done():
+            delay = hedger.delay()
+            if delay is None:
+                break
+            started = hedger.started_at(key)
+            timeout = delay if started is None else started + delay - time.monotonic()
+            if timeout > 0:
+                wait([future], timeout)
+                continue
+            if not hedger.try_acquire():
+                break
+
+            cancel = threading.Event()
+            hedge = self._get_executor().submit(
+                self._generate_audio_chunk, text.strip(), chunk_number, config, None, time.monotonic(), cancel
+            )
             try:
-                response = self.session.get(
-                    self.PROVIDER_URL,
-                    params=params,
-                    timeout=self.config.timeout
-                )
-                response.raise_for_status()
+                pending = {future, hedge}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for winner in done:
+                        if not winner.cancelled() and winner.exception() is None and winner.result()[1]:
+                            if winner is hedge:
+                                hedger.preempt(key, winner.result()[1])
+                                future.cancel()
+                                if journal is not None:
+                                    journal.put(chunk_number, key, winner.result()[1])
+                            return winner.result()[1]
+            finally:
+                cancel.set()
+                hedge.cancel()
+            break
+        return future.result()[1]
+
+    def _iter_audio(
+        self,
+        chunks: Iterable[str],
+        config: TTSConfig,
+        journal: Optional[Journal] = None
+    ) -> Generator[bytes, None, None]:
+        """
+        Fetch audio for a sequence of chunks concurrently and yield it in chunk order.
+
+        Only a window of ``max_pending_chunks`` chunks is taken from ``chunks`` ahead
+        of the chunk being yielded, so memory use does not grow with the length of the
+        input. Cache hits are yielded without a request. Each chunk is yielded as soon as
+        it and every chunk before it are available, while later chunks are still in flight.
+        A chunk that still fails after its retries aborts the whole stream. With a
+        ``journal``, chunks are recorded in its manifest, chunks it already holds are
+        not requested, and every newly synthesized chunk is saved to it.
+        """
+        window_size = self._window_size(config)
+        window: Deque[tuple[int, str, str, Union[bytes, Future]]] = deque()
+        chunks = iter(chunks)
+        chunk_number = 0
+
+        def fill() -> None:
+            nonlocal chunk_number
+            while len(window) < window_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                chunk_number += 1
+                key = self._chunk_key(chunk, config)
+                audio = self._lookup_chunk(key, chunk, chunk_number, config, journal)
+                if audio is None:
+                    # Saved from the request itself: a chunk still in flight when the call fails
+                    # is journaled once it arrives, even if it was coalesced with another call.
+                    save = partial(self._save_to_journal, journal, chunk_number, key) if journal is not None else None
+                    audio = self._submit_chunk(key, chunk, chunk_number, config, time.monotonic(), save)
+                window.append((chunk_number, key, chunk, audio))
+
+        started = ready = time.monotonic()
+        try:
+            fill()
+            while window:
+                i, key, chunk, audio_data = window.popleft()
+                fill()
+                if isinstance(audio_data, Future):
+                    try:
+                        audio_data = self._await_chunk(audio_data, key, chunk, i, config, journal)
+                    except Exception as e:
+                        if config.verbose:
+                            print(f"Failed to generate audio for chunk {i}: {e}")
+                        raise
+                    ready = time.monotonic()
+                yield audio_data
+            if config.instrumentation is not None:
+                config.instrumentation.on_span("fan_out", ready - started)
+        finally:
+            for _, _, _, audio_data in window:
+                if isinstance(audio_data, Future):
+                    audio_data.cancel()
+
+    def _write_audio(self, audio: Iterable[bytes], file: BinaryIO, config: TTSConfig) -> int:
+        """Write chunk audio to a file object as one MP3 stream and return the bytes written."""
+        write_time = 0.0
+        writer = MP3Writer(file, index=config.rewrite_mp3_headers)
+        for audio_data in audio:
+            write_started = time.monotonic()
+            writer.write(audio_data)
+            write_time += time.monotonic() - write_started
+        writer.close()
+        if config.instrumentation is not None:
+            config.instrumentation.on_span("write", write_time)
+        return writer.bytes_written
+
+    def speak_stream(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> Generator[bytes, None, None]:
+        """
+        Convert text to speech, yielding audio as soon as each chunk is ready.
 
-                if response.content:
-                    if self.config.verbose:
-                        print(f"Chunk {chunk_number} processed successfully.")
-                    return chunk_number, response.content
+        Chunks are yielded in order: the audio for the first sentence is produced as soon
+        as it arrives, while the remaining sentences are still being synthesized.
 
-                if self.config.verbose:
-                    print(f"No data received for chunk {chunk_number}.")
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            voice (Optional[VoiceType]): Optional voice override.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Yields:
+            bytes: MP3 audio for the next chunk of text.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        current_config = self._resolve_config(voice=voice, verbose=verbose, config=config)
+        chunks = self._iter_chunks(text, current_config)
 
-            except exceptions.RequestException as e:
-                if self.config.verbose:
-                    print(f"Error processing chunk {chunk_number}: {e}")
-                time.sleep(1)
+        try:
+            yield from self._iter_audio(chunks, current_config)
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            raise TTSException(f"Failed to generate audio: {e}")
 
     def speak(
         self,
-        text: str,
+        text: TextSource,
         voice: Optional[VoiceType] = None,
         output_path: Optional[Union[str, Path]] = None,
         verbose: Optional[bool] = None,
@@ -98,8 +787,23 @@ class OpenaiTTS(TTSProvider):
         """
         Convert text to speech using OpenAI TTS.
 
+        Audio is appended to the output file in order as chunks arrive, so the file can
+        be read while the remaining chunks are still being synthesized. Only a bounded
+        window of chunks is held in memory, so arbitrarily long inputs can be rendered
+        from a file or an iterator.
+
+        Unless ``rewrite_mp3_headers`` is disabled, the ID3 tags and Xing/Info frames of
+        the individual chunks are dropped and a single header indexing the whole file is
+        filled in when the call finishes.
+
+        With ``journal_dir`` set, every finished chunk is also saved to a journal for
+        the output path. If the call fails or the process dies, running the same call
+        again only requests the chunks that are missing. The journal is deleted once
+        the output file is complete.
+
         Args:
-            text (str): The text to convert to speech.
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
             voice (Optional[VoiceType]): Optional voice override.
             output_path (Optional[Union[str, Path]]): Optional output file path.
             verbose (Optional[bool]): Optional verbosity override.
@@ -111,47 +815,230 @@ class OpenaiTTS(TTSProvider):
         Raises:
             TTSException: If conversion fails.
         """
-        current_config = config or self.config
+        current_config = self._resolve_config(voice, output_path, verbose, config)
+        chunks = self._iter_chunks(text, current_config)
+        journal = None
 
-        if voice is not None or output_path is not None or verbose is not None:
-            current_config = TTSConfig(
-                timeout=current_config.timeout,
-                voice=voice or current_config.voice,
-                output_path=Path(output_path) if output_path else current_config.output_path,
-                verbose=verbose if verbose is not None else current_config.verbose
-            )
+        try:
+            journal = self._open_journal(current_config)
+            output_file = Path(current_config.output_path)
+            with output_file.open('wb', buffering=0) as f:
+                self._write_audio(self._iter_audio(chunks, current_config, journal), f, current_config)
+            if journal is not None:
+                journal.discard()
 
-        assert isinstance(current_config, TTSConfig), "config must be an instance of TTSConfig"
-        assert current_config.voice in VoiceType, f"Voice must be one of {VoiceType.get_voice_names()}"
+            if current_config.verbose:
+                print(f"Audio saved to {output_file.absolute()}")
+            return str(output_file)
 
-        sentences = split_into_sentences(text)
+        except Exception as e:
+            if journal is not None:
+                journal.close()
+                if current_config.verbose:
+                    print(f"Progress saved to journal {journal.path}")
+            raise TTSException(f"Failed to generate audio: {e}")
 
+    def speak_to(
+        self,
+        text: TextSource,
+        sink: OutputSink,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> int:
+        """
+        Convert text to speech and write the audio to a sink instead of a file.
+
+        ``sink`` is a binary file object (an upload stream, ``io.BytesIO``, a socket
+        file), a socket, or a callable that receives each piece of audio as ``bytes``.
+        Audio is written in order as chunks arrive, exactly as ``speak`` writes files;
+        on seekable sinks the MP3 header is filled in when the call finishes.
+
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            sink (OutputSink): Where to write the audio.
+            voice (Optional[VoiceType]): Optional voice override.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            TTSException: If conversion fails.
+        """
+        current_config = self._resolve_config(voice=voice, verbose=verbose, config=config)
+        writer = as_writer(sink)
+        chunks = self._iter_chunks(text, current_config)
         try:
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._generate_audio_chunk, sentence.strip(), i): i
-                    for i, sentence in enumerate(sentences, start=1)
-                }
+            return self._write_audio(self._iter_audio(chunks, current_config), writer, current_config)
+        except Exception as e:
+            raise TTSException(f"Failed to generate audio: {e}")
 
-                audio_chunks: Dict[int, bytes] = {}
+    def speak_bytes(
+        self,
+        text: TextSource,
+        voice: Optional[VoiceType] = None,
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> bytes:
+        """
+        Convert text to speech and return the MP3 audio.
 
-                for future in as_completed(futures):
-                    chunk_num = futures[future]
-                    try:
-                        part_number, audio_data = future.result()
-                        audio_chunks[part_number] = audio_data
-                    except Exception as e:
-                        if verbose:
-                            print(f"Failed to generate audio for chunk {chunk_num}: {e}")
+        Args:
+            text (TextSource): The text to convert to speech, or a path, text file object
+                or iterable of text fragments to read it from incrementally.
+            voice (Optional[VoiceType]): Optional voice override.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
 
-                output_file = Path(current_config.output_path)
-                with output_file.open('wb') as f:
-                    for chunk_num in sorted(audio_chunks.keys()):
-                        f.write(audio_chunks[chunk_num])
+        Returns:
+            bytes: The complete MP3 file.
 
-                if current_config.verbose:
-                    print(f"Audio saved to {output_file.absolute()}")
-                return str(output_file)
+        Raises:
+            TTSException: If conversion fails.
+        """
+        buffer = io.BytesIO()
+        self.speak_to(text, buffer, voice, verbose, config)
+        return buffer.getvalue()
 
+    def speak_many(
+        self,
+        jobs: Iterable[Union[SynthesisJob, tuple]],
+        verbose: Optional[bool] = None,
+        config: Optional[TTSConfig] = None
+    ) -> List[str]:
+        """
+        Convert several texts to speech through one shared scheduler.
+
+        The chunks of every job share the provider's worker pool, and so a single
+        concurrency limit. A (chunk, voice, prompt) combination that appears in more
+        than one place is requested only once. Each output file is written as soon
+        as all of its own chunks are ready.
+
+        Jobs without an output path are numbered after the configured one, so
+        ``output.mp3`` becomes ``output-1.mp3``, ``output-2.mp3`` and so on by job position.
+
+        Args:
+            jobs (Iterable[Union[SynthesisJob, tuple]]): Jobs to render, as SynthesisJob
+                instances or ``(text, voice, output_path)`` tuples.
+            verbose (Optional[bool]): Optional verbosity override.
+            config (Optional[TTSConfig]): Optional configuration override.
+
+        Returns:
+            List[str]: Paths to the generated audio files, in job order.
+
+        Raises:
+            ValueError: If two jobs would write the same file.
+            TTSException: If any job fails. Jobs that succeeded are still written.
+        """
+        base_config = self._resolve_config(verbose=verbose, config=config)
+        batch = self._plan_batch(jobs, base_config)
+        for job_index, count in enumerate(batch.remaining):
+            if count == 0:
+                self._finish_job(batch, job_index)
+
+        started = time.monotonic()
+        futures = {
+            self._submit_chunk(key, chunk, number, job_config, started): key
+            for number, (key, (chunk, job_config)) in enumerate(batch.pending.items(), start=1)
+        }
+        try:
+            for future in as_completed(futures):
+                self._collect_chunk(batch, futures[future], future)
+        finally:
+            for future in futures:
+                future.cancel()
+        if base_config.instrumentation is not None:
+            base_config.instrumentation.on_span("fan_out", time.monotonic() - started)
+
+        if batch.errors:
+            failed = ', '.join(str(batch.configs[i].output_path) for i in sorted(batch.errors))
+            first_error = batch.errors[min(batch.errors)]
+            raise TTSException(
+                f"Failed to generate audio for {len(batch.errors)} of {len(batch.configs)} jobs ({failed}): {first_error}"
+            )
+        return batch.results
+
+    def _plan_batch(self, jobs: Iterable[Union[SynthesisJob, tuple]], base_config: TTSConfig) -> _Batch:
+        """
+        Resolve the jobs of a ``speak_many`` call and work out which chunks to request.
+
+        Raises:
+            ValueError: If two jobs would write the same file.
+        """
+        jobs = [job if isinstance(job, SynthesisJob) else SynthesisJob(*job) for job in jobs]
+        base_path = Path(base_config.output_path)
+        configs = [
+            self._resolve_config(
+                job.voice,
+                job.output_path or base_path.with_name(f"{base_path.stem}-{job_index}{base_path.suffix}"),
+                config=base_config
+            )
+            for job_index, job in enumerate(jobs, start=1)
+        ]
+        seen: Dict[Path, int] = {}
+        for job_index, job_config in enumerate(configs):
+            output_file = Path(job_config.output_path).resolve()
+            if output_file in seen:
+                raise ValueError(f"Jobs {seen[output_file] + 1} and {job_index + 1} would both write {output_file}")
+            seen[output_file] = job_index
+
+        batch = _Batch(configs)
+        for job_index, (job, job_config) in enumerate(zip(jobs, configs)):
+            keys = []
+            for chunk_number, chunk in enumerate(self._iter_chunks(job.text, job_config), start=1):
+                key = self._chunk_key(chunk, job_config)
+                keys.append(key)
+                batch.users.setdefault(key, set()).add(job_index)
+                if key in batch.audio or key in batch.pending:
+                    continue
+                cached = self._cached_audio(key, chunk_number, job_config)
+                if cached is not None:
+                    batch.audio[key] = cached
+                else:
+                    batch.pending[key] = (chunk, job_config)
+            batch.keys.append(keys)
+        batch.remaining = [len(set(keys) - set(batch.audio)) for keys in batch.keys]
+        return batch
+
+    def _collect_chunk(self, batch: _Batch, key: str, future: Future) -> None:
+        """Take a finished chunk request of a ``speak_many`` call and write every job it completes."""
+        try:
+            _, audio = future.result()
         except Exception as e:
-            raise TTSException(f"Failed to generate audio: {e}")
+            for job_index in batch.jobs_using(key):
+                batch.errors.setdefault(job_index, e)
+                batch.release(job_index)
+            return
+        jobs = batch.jobs_using(key)
+        if not jobs:
+            # Every job using this chunk has already failed.
+            return
+        batch.audio[key] = audio
+        for job_index in jobs:
+            batch.remaining[job_index] -= 1
+            if batch.remaining[job_index] == 0:
+                self._finish_job(batch, job_index)
+
+    def _finish_job(self, batch: _Batch, job_index: int) -> None:
+        """Write the output file of a ``speak_many`` job whose chunks are all available."""
+        job_config = batch.configs[job_index]
+        try:
+            write_started = time.monotonic()
+            output_file = Path(job_config.output_path)
+            with output_file.open('wb', buffering=0) as f:
+                writer = MP3Writer(f, index=job_config.rewrite_mp3_headers)
+                writer.write(*(batch.audio[key] for key in batch.keys[job_index]))
+                writer.close()
+            if job_config.instrumentation is not None:
+                job_config.instrumentation.on_span("write", time.monotonic() - write_started)
+        except Exception as e:
+            batch.errors[job_index] = e
+            return
+        finally:
+            batch.release(job_index)
+        batch.results[job_index] = str(output_file)
+        if job_config.verbose:
+            print(f"Audio saved to {output_file.absolute()}")
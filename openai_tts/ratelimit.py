@@ -0,0 +1,199 @@
+"""Client-side rate limiting and adaptive concurrency control."""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+
+    Callers reserve a token and are told how long to wait before using it, which
+    works the same for blocking code and for asyncio.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, borrowing against future refills if the bucket is empty.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def restrict(self, rate: float, burst: int = 1) -> None:
+        """Tighten the bucket to ``rate`` and ``burst`` where they are stricter than its own."""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, max(1, burst))
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD controller for the number of requests in flight against one endpoint.
+
+    Every fast, successful response raises the limit by ``1 / limit``, or about one
+    per round trip of the whole window. Throttling (HTTP 429), server errors,
+    transport errors and rising latency multiply the limit by ``backoff``. Latency
+    counts as rising when its short-term average exceeds ``latency_tolerance`` times
+    the long-term average. Only one decrease is applied per congestion event.
+    """
+
+    SHORT_WEIGHT: float = 0.2
+    LONG_WEIGHT: float = 0.02
+    WARMUP_SAMPLES: int = 10
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._samples = 0
+        self._short_latency = 0.0
+        self._long_latency = 0.0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a permit."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """Take a permit if one is free, without blocking."""
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a permit is free.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait, or None to wait forever.
+
+        Returns:
+            bool: True if a permit was taken, False on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: float, success: bool, overloaded: bool = False) -> None:
+        """
+        Return a permit and adjust the limit from the request outcome.
+
+        Args:
+            latency (float): Seconds the request took.
+            success (bool): Whether the request produced audio.
+            overloaded (bool): Whether the endpoint signalled overload (throttling, 5xx, transport errors).
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            rising = False
+            if success:
+                if self._samples == 0:
+                    self._short_latency = self._long_latency = latency
+                else:
+                    self._short_latency += (latency - self._short_latency) * self.SHORT_WEIGHT
+                    self._long_latency += (latency - self._long_latency) * self.LONG_WEIGHT
+                self._samples += 1
+                rising = (
+                    self._samples >= self.WARMUP_SAMPLES
+                    and self._short_latency > self._long_latency * self.latency_tolerance
+                )
+            if overloaded or rising:
+                # Requests already in flight when the limit dropped report the same event.
+                if now - self._last_decrease > (self._long_latency or latency):
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._last_decrease = now
+            elif success:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Return the process-wide token bucket for an endpoint.
+
+    All providers for ``url`` share one bucket. If they ask for different settings,
+    the strictest rate and burst win and a warning is logged.
+    """
+    with _registry_lock:
+        bucket = _buckets.get(url)
+        if bucket is None:
+            bucket = _buckets[url] = TokenBucket(rate, burst)
+        elif (rate, max(1, burst)) != (bucket.rate, bucket.burst):
+            current = (bucket.rate, bucket.burst)
+            bucket.restrict(rate, burst)
+            logger.warning(
+                "Conflicting rate limits for %s: %s/s (burst %s) requested, %s/s (burst %s) in use; "
+                "sharing the stricter %s/s (burst %s)",
+                url, rate, burst, current[0], current[1], bucket.rate, bucket.burst
+            )
+        return bucket
+
+
+def get_concurrency_limiter(url: str, **kwargs) -> AdaptiveConcurrencyLimiter:
+    """
+    Return the process-wide adaptive concurrency limiter for an endpoint.
+
+    Keyword arguments are passed to AdaptiveConcurrencyLimiter and only apply
+    when the limiter for ``url`` is first created.
+    """
+    with _registry_lock:
+        limiter = _limiters.get(url)
+        if limiter is None:
+            limiter = _limiters[url] = AdaptiveConcurrencyLimiter(**kwargs)
+        return limiter
@@ -0,0 +1,155 @@
+"""Failure handling helpers shared by the TTS providers."""
+
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from openai_tts.exceptions import TTSCircuitOpenError
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+
+
+def response_status(error: BaseException) -> Optional[int]:
+    """Return the HTTP status attached to a request error, if any."""
+    response = getattr(error, 'response', None)
+    # Transport errors may carry an empty response with status 0.
+    return getattr(response, 'status_code', None) or None
+
+
+def is_retryable_status(status: Optional[int]) -> bool:
+    """
+    Decide whether a failed request is worth retrying.
+
+    Transport errors (no status), throttling and server errors are retried;
+    other client errors will fail the same way again.
+    """
+    return status is None or status in RETRYABLE_STATUS_CODES or status >= 500
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker guarding a single endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    fail fast for ``reset_timeout`` seconds. One probe request is then let
+    through; its outcome closes the circuit again or restarts the timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state, reporting an expired open circuit as half open."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def check(self, url: str) -> None:
+        """
+        Raise if the circuit does not allow a request.
+
+        Raises:
+            TTSCircuitOpenError: If the endpoint is currently considered unhealthy.
+        """
+        if not self.allow():
+            raise TTSCircuitOpenError(f"Circuit open for {url}; failing fast until the endpoint recovers")
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def release_probe(self) -> None:
+        """
+        Give up the half-open probe without an outcome, so another request can probe.
+
+        Call this when a request let through by ``check()`` ends without reaching the
+        endpoint, for example because it was cancelled.
+        """
+        with self._lock:
+            self._probing = False
+
+    def reset(self) -> None:
+        """Force the circuit closed and forget past failures."""
+        self.record_success()
+
+
+class CircuitGroup:
+    """
+    Combined state of the circuit breakers of several interchangeable endpoints.
+
+    The group is open only while every circuit is open, and closed as long as
+    any circuit is closed.
+    """
+
+    def __init__(self, breakers: Sequence[CircuitBreaker]) -> None:
+        self.breakers = list(breakers)
+
+    @property
+    def state(self) -> str:
+        states = [breaker.state for breaker in self.breakers]
+        if CircuitBreaker.CLOSED in states:
+            return CircuitBreaker.CLOSED
+        if CircuitBreaker.HALF_OPEN in states:
+            return CircuitBreaker.HALF_OPEN
+        return CircuitBreaker.OPEN
+
+    def reset(self) -> None:
+        """Force every circuit closed."""
+        for breaker in self.breakers:
+            breaker.reset()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for an endpoint.
+
+    The thresholds only apply when the breaker for ``url`` is first created.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(url)
+        if breaker is None:
+            breaker = _breakers[url] = CircuitBreaker(failure_threshold, reset_timeout)
+        return breaker
@@ -0,0 +1,347 @@
+"""HTTP server that streams synthesized MP3 audio to clients."""
+
+import argparse
+import json
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from openai_tts.cli import make_provider, parse_voice
+from openai_tts.config import TTSConfig, VoiceType
+from openai_tts.exceptions import TTSCircuitOpenError, TTSException
+from openai_tts.metrics import MetricsCollector
+from openai_tts.mp3 import MP3Writer
+from openai_tts.providers.composite import CompositeTTS
+from openai_tts.providers.openai import OpenaiTTS
+from openai_tts.resilience import CircuitBreaker
+from openai_tts.sinks import ChunkedWriter
+
+
+def caused_by(error: Optional[BaseException], kind: type) -> bool:
+    """Return True if ``error`` or an exception it was raised from is a ``kind``."""
+    while error is not None:
+        if isinstance(error, kind):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class TTSServer:
+    """
+    Serves ``POST /v1/speech`` by streaming MP3 audio as it is synthesized.
+
+    All requests share one provider, and with it one worker pool, one set of kept-alive
+    connections and one cache. At most ``max_active`` requests are synthesized at a time
+    and up to ``max_queued`` more wait for a turn; beyond that, or after waiting
+    ``queue_timeout`` seconds, requests are answered with 503 and ``Retry-After``.
+
+    The request body is either JSON (``{"text": ..., "voice": ...}``) or plain text with
+    an optional ``voice`` query parameter. ``GET /v1/speech?text=...`` works as well.
+    The response uses chunked transfer encoding and each chunk's audio is sent as soon
+    as it is ready, with per-chunk ID3 tags and Info frames stripped. Errors that happen
+    before the first audio byte get a JSON error response; later errors end the stream
+    without the terminating chunk, so clients can tell the audio is incomplete.
+
+    ``GET /healthz`` reports the load and ``GET /metrics`` the provider metrics in the
+    Prometheus text format.
+    """
+
+    SPEECH_PATH = "/v1/speech"
+
+    def __init__(
+        self,
+        tts: Optional[OpenaiTTS] = None,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_active: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        queue_timeout: float = 30.0,
+        max_text_chars: int = 100_000
+    ) -> None:
+        """
+        Args:
+            tts (Optional[OpenaiTTS]): Provider shared by all requests. Defaults to one with
+                a MetricsCollector and verbose output disabled.
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+            max_active (Optional[int]): Requests synthesized at a time. Defaults to ``max_concurrency``.
+            max_queued (Optional[int]): Requests waiting for a turn. Defaults to twice ``max_active``.
+            queue_timeout (float): Seconds a request may wait for a turn.
+            max_text_chars (int): Longest text accepted, in characters.
+        """
+        self.tts = tts or OpenaiTTS(TTSConfig(verbose=False, instrumentation=MetricsCollector()))
+        self.max_active = max_active or self.tts.config.max_concurrency
+        self.max_queued = self.max_active * 2 if max_queued is None else max_queued
+        self.queue_timeout = queue_timeout
+        self.max_text_chars = max_text_chars
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_active)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _admit(self) -> bool:
+        """Wait for a turn, or return False if the server is overloaded."""
+        with self._lock:
+            if self.active + self.queued >= self.max_active + self.max_queued:
+                self.rejected += 1
+                return False
+            self.queued += 1
+        admitted = self._slots.acquire(timeout=self.queue_timeout)
+        with self._lock:
+            self.queued -= 1
+            if admitted:
+                self.active += 1
+            else:
+                self.rejected += 1
+        return admitted
+
+    def _release(self) -> None:
+        with self._lock:
+            self.active -= 1
+        self._slots.release()
+
+    def health(self) -> Dict[str, Any]:
+        """Return the current load, and the state of each endpoint when there are several."""
+        with self._lock:
+            health = {
+                'active': self.active,
+                'queued': self.queued,
+                'rejected': self.rejected,
+                'max_active': self.max_active,
+                'max_queued': self.max_queued,
+                'circuit': self.tts.circuit_breaker.state,
+            }
+        if isinstance(self.tts, CompositeTTS):
+            health['endpoints'] = self.tts.endpoint_health()
+        return health
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Audio chunks are written as they arrive; do not hold them back.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path == "/healthz":
+                    self._send_json(200, server.health())
+                elif url.path == "/metrics":
+                    instrumentation = server.tts.config.instrumentation
+                    if not isinstance(instrumentation, MetricsCollector):
+                        self._send_json(404, {'error': "metrics are not collected"})
+                        return
+                    self._send(200, instrumentation.render_prometheus().encode('utf-8'), "text/plain; version=0.0.4")
+                elif url.path == server.SPEECH_PATH:
+                    query = parse_qs(url.query)
+                    self._speak(query.get('text', [''])[0], query.get('voice', [None])[0])
+                else:
+                    self._send_json(404, {'error': "not found"})
+
+            def do_POST(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                if length > 4 * server.max_text_chars:
+                    # UTF-8 takes at most four bytes per character; do not read the body at all.
+                    self.close_connection = True
+                    self._send_json(413, {'error': f"text is longer than {server.max_text_chars} characters"})
+                    return
+                body = self.rfile.read(length) if length else b''
+                if url.path != server.SPEECH_PATH:
+                    self._send_json(404, {'error': "not found"})
+                    return
+                try:
+                    text, voice = self._parse_body(body, parse_qs(url.query))
+                except ValueError as e:
+                    self._send_json(400, {'error': str(e)})
+                    return
+                self._speak(text, voice)
+
+            def _parse_body(self, body: bytes, query: Dict[str, list]) -> Tuple[str, Optional[str]]:
+                voice = query.get('voice', [None])[0]
+                if self.headers.get_content_type() == 'application/json':
+                    try:
+                        payload = json.loads(body or b'{}')
+                    except ValueError:
+                        raise ValueError("request body is not valid JSON")
+                    if not isinstance(payload, dict) or not isinstance(payload.get('text', ''), str):
+                        raise ValueError("expected a JSON object with a 'text' string")
+                    return payload.get('text', ''), payload.get('voice') or voice
+                try:
+                    return body.decode('utf-8'), voice
+                except UnicodeDecodeError:
+                    raise ValueError("request body is not valid UTF-8")
+
+            def _speak(self, text: str, voice_name: Optional[str]) -> None:
+                try:
+                    voice: Optional[VoiceType] = parse_voice(voice_name) if voice_name else None
+                except ValueError as e:
+                    self._send_json(400, {'error': str(e)})
+                    return
+                if not text.strip():
+                    self._send_json(400, {'error': "no text given"})
+                    return
+                if len(text) > server.max_text_chars:
+                    self._send_json(413, {'error': f"text is longer than {server.max_text_chars} characters"})
+                    return
+                if server.tts.circuit_breaker.state == CircuitBreaker.OPEN:
+                    self._send_json(503, {'error': "endpoint is unavailable"}, {'Retry-After': "5"})
+                    return
+                if not server._admit():
+                    self._send_json(503, {'error': "server is overloaded"}, {'Retry-After': "1"})
+                    return
+                try:
+                    self._stream(text, voice)
+                finally:
+                    server._release()
+
+            def _stream(self, text: str, voice: Optional[VoiceType]) -> None:
+                audio = server.tts.speak_stream(text, voice=voice)
+                try:
+                    try:
+                        first = next(audio)
+                    except StopIteration:
+                        self._send_json(400, {'error': "text contains nothing to speak"})
+                        return
+                    except TTSException as e:
+                        self._send_json(503 if caused_by(e, TTSCircuitOpenError) else 502, {'error': str(e)})
+                        return
+
+                    self.send_response(200)
+                    self.send_header("Content-Type", "audio/mpeg")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.send_header("Cache-Control", "no-store")
+                    self.end_headers()
+                    body = ChunkedWriter(self.wfile)
+                    writer = MP3Writer(body, index=server.tts.config.rewrite_mp3_headers)
+                    try:
+                        writer.write(first)
+                        for chunk in audio:
+                            writer.write(chunk)
+                    except TTSException as e:
+                        self.log_error("synthesis failed mid-stream: %s", e)
+                        self.close_connection = True
+                        return
+                    body.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client went away; closing the generator cancels the queued chunks.
+                    self.close_connection = True
+                finally:
+                    audio.close()
+
+            def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+                self._send(status, json.dumps(payload).encode('utf-8'), "application/json", headers)
+
+            def log_message(self, format, *args) -> None:
+                if server.tts.config.verbose:
+                    super().log_message(format, *args)
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        """Serve requests until ``shutdown()`` is called."""
+        self._server.serve_forever()
+
+    def start(self) -> "TTSServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="openai-tts-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving, close the socket and the provider."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+        self.tts.close()
+
+    def __enter__(self) -> "TTSServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the server until interrupted."""
+    parser = argparse.ArgumentParser(prog='openai-tts-server', description="Stream synthesized MP3 audio over HTTP.")
+    parser.add_argument('--host', default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help="Maximum requests to the endpoint in flight")
+    parser.add_argument('--max-active', type=int, default=None, help="Requests synthesized at a time (default: --concurrency)")
+    parser.add_argument('--max-queued', type=int, default=None, help="Requests waiting for a turn before 503 (default: twice --max-active)")
+    parser.add_argument('--queue-timeout', type=float, default=30.0, help="Seconds a request may wait for a turn")
+    parser.add_argument('--max-chars', type=int, default=100_000, help="Longest text accepted")
+    parser.add_argument('-v', '--voice', type=parse_voice, default=None, help="Voice for requests that do not set one")
+    parser.add_argument('--chunk-chars', type=int, default=None, help="Pack sentences into chunks of up to this many characters")
+    parser.add_argument('--first-chunk-chars', type=int, default=None, help="Keep the first chunk this short to start audio sooner")
+    parser.add_argument('--base-url', action='append', default=None,
+                        help="Endpoint base URL; repeat to balance requests across several endpoints")
+    parser.add_argument('--cache-dir', default=None, help="Directory of the on-disk audio cache")
+    parser.add_argument('--hedge', type=float, default=None, help="Hedge requests slower than this latency percentile, e.g. 0.95")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args(argv)
+
+    config = TTSConfig(
+        verbose=args.verbose,
+        max_concurrency=args.concurrency,
+        chunk_max_chars=args.chunk_chars,
+        first_chunk_chars=args.first_chunk_chars,
+        cache_dir=args.cache_dir,
+        hedge_percentile=args.hedge,
+        instrumentation=MetricsCollector()
+    )
+    if args.voice is not None:
+        config.voice = args.voice
+    if args.base_url:
+        config.base_url = args.base_url[0]
+
+    tts = make_provider(config, args.base_url)
+    tts.warmup(min(4, args.concurrency))
+    server = TTSServer(
+        tts,
+        host=args.host,
+        port=args.port,
+        max_active=args.max_active,
+        max_queued=args.max_queued,
+        queue_timeout=args.queue_timeout,
+        max_text_chars=args.max_chars
+    )
+    print(f"Serving {server.url}{TTSServer.SPEECH_PATH} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Coalescing of identical requests that are in flight at the same time."""
+
+import threading
+from concurrent.futures import Executor, Future, InvalidStateError
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time on an executor.
+
+    While a call for a key is in flight, later submissions with the same key get a
+    future tied to that call instead of starting another one. Every caller receives
+    its own future, so one caller cancelling does not affect the others. The shared
+    call is only cancelled once every caller has cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Tuple[Future, List[Future]]] = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        executor: Executor,
+        fn: Callable[..., Any],
+        *args: Any,
+        callback: Optional[Callable[[Future], Any]] = None
+    ) -> Future:
+        """
+        Schedule ``fn(*args)`` unless a call with the same key is already in flight.
+
+        Args:
+            callback (Optional[Callable[[Future], Any]]): Done callback for the shared call
+                itself. Unlike callbacks on the returned future, it still sees the result
+                of a call that kept running after this caller cancelled.
+
+        Returns:
+            Future: A future resolved with the result of the shared call.
+        """
+        waiter: Future = Future()
+        leader = None
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                leader = executor.submit(fn, *args)
+                call = self._calls[key] = (leader, [])
+            call[1].append(waiter)
+            shared = call[0]
+        if callback is not None:
+            shared.add_done_callback(callback)
+        if leader is not None:
+            leader.add_done_callback(partial(self._resolve, key))
+        waiter.add_done_callback(partial(self._abandon, key))
+        return waiter
+
+    def _resolve(self, key: Hashable, shared: Future) -> None:
+        """Hand the outcome of a finished call to everyone waiting for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None or call[0] is not shared:
+                return
+            del self._calls[key]
+        for waiter in call[1]:
+            try:
+                if shared.cancelled():
+                    waiter.cancel()
+                elif shared.exception() is not None:
+                    waiter.set_exception(shared.exception())
+                else:
+                    waiter.set_result(shared.result())
+            except InvalidStateError:
+                # The waiter was cancelled in the meantime.
+                pass
+
+    def _abandon(self, key: Hashable, waiter: Future) -> None:
+        """Forget a cancelled waiter, cancelling the shared call if nobody else waits."""
+        if not waiter.cancelled():
+            return
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None or waiter not in call[1]:
+                return
+            call[1].remove(waiter)
+            if call[1]:
+                return
+            # Nobody is left; new callers must not join a call being cancelled.
+            del self._calls[key]
+        call[0].cancel()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight.
+
+    Calls are coalesced per key within one event loop. A caller that is cancelled
+    stops waiting, and the shared task is cancelled once no caller is left.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, List[Any]] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        callback: Optional[Callable[["asyncio.Task"], Any]] = None
+    ) -> Any:
+        """
+        Await ``factory()``, or the identical call already in flight.
+
+        Args:
+            callback (Optional[Callable[[asyncio.Task], Any]]): Done callback for the shared
+                task, which sees its result even if this caller is cancelled first.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        # Imported here so the blocking provider does not pay for loading asyncio.
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is None:
+            task = asyncio.ensure_future(factory())
+            call = self._calls[key] = [task, 0]
+            task.add_done_callback(partial(self._forget, key, call))
+        task = call[0]
+        if callback is not None:
+            task.add_done_callback(callback)
+        call[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            call[1] -= 1
+            if not call[1] and not task.done():
+                self._forget(key, call, task)
+                task.cancel()
+
+    def _forget(self, key: Hashable, call: List[Any], task: "asyncio.Task") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,56 @@
+"""Destinations other than files that synthesized audio can be written to."""
+
+import socket
+from typing import Any, BinaryIO, Callable, Union
+
+# Anything speak_to() can write to: a binary file object, a socket or a callable receiving bytes.
+OutputSink = Union[BinaryIO, socket.socket, Callable[[bytes], Any]]
+
+
+class CallbackWriter:
+    """Write-only file object that hands every write to a callback as ``bytes``."""
+
+    def __init__(self, callback: Callable[[bytes], Any]) -> None:
+        self.callback = callback
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data) -> int:
+        self.callback(bytes(data))
+        return len(data)
+
+
+class ChunkedWriter:
+    """Write-only file object that sends every write as one HTTP/1.1 chunk."""
+
+    def __init__(self, wfile: BinaryIO) -> None:
+        self.wfile = wfile
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, data) -> int:
+        if data:
+            self.wfile.write(b''.join((b'%x\r\n' % len(data), data, b'\r\n')))
+        return len(data)
+
+    def close(self) -> None:
+        """Send the terminating chunk."""
+        self.wfile.write(b'0\r\n\r\n')
+
+
+def as_writer(sink: OutputSink) -> BinaryIO:
+    """
+    Return a file object that writes to ``sink``.
+
+    Raises:
+        TypeError: If ``sink`` is not a file object, a socket or a callable.
+    """
+    if hasattr(sink, 'write'):
+        return sink
+    if isinstance(sink, socket.socket):
+        return CallbackWriter(sink.sendall)
+    if callable(sink):
+        return CallbackWriter(sink)
+    raise TypeError(f"cannot write audio to {type(sink).__name__}; expected a file object, a socket or a callable")
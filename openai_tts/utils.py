@@ -1,155 +1,210 @@
 """Utility functions for TTS functionality."""
 
+import bisect
+import os
 import re
+from itertools import chain
 from typing import List
-from typing import List, Dict, Tuple, Set, Pattern
+from typing import List, Dict, Tuple, Set, FrozenSet, Pattern, Iterable, Iterator, Optional, TextIO, Union
     
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation matching any of the words, preferring the longest match."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
 class SentenceTokenizer:
-    """# Advanced sentence tokenizer with support for complex cases and proper formatting."""
-    
-    def __init__(self) -> None:
-        # Common abbreviations by category
-        self.TITLES: Set[str] = {
-            'mr', 'mrs', 'ms', 'dr', 'prof', 'rev', 'sr', 'jr', 'esq',
-            'hon', 'pres', 'gov', 'atty', 'supt', 'det', 'rev', 'col','maj', 'gen', 'capt', 'cmdr',
-            'lt', 'sgt', 'cpl', 'pvt'
-        }
-        
-        self.ACADEMIC: Set[str] = {
-            'ph.d', 'phd', 'm.d', 'md', 'b.a', 'ba', 'm.a', 'ma', 'd.d.s', 'dds',
-            'm.b.a', 'mba', 'b.sc', 'bsc', 'm.sc', 'msc', 'llb', 'll.b', 'bl'
-        }
-        
-        self.ORGANIZATIONS: Set[str] = {
-            'inc', 'ltd', 'co', 'corp', 'llc', 'llp', 'assn', 'bros', 'plc', 'cos',
-            'intl', 'dept', 'est', 'dist', 'mfg', 'div'
-        }
-        
-        self.MONTHS: Set[str] = {
-            'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
-        }
-        
-        self.UNITS: Set[str] = {
-            'oz', 'pt', 'qt', 'gal', 'ml', 'cc', 'km', 'cm', 'mm', 'ft', 'in',
-            'kg', 'lb', 'lbs', 'hz', 'khz', 'mhz', 'ghz', 'kb', 'mb', 'gb', 'tb'
-        }
-        
-        self.TECHNOLOGY: Set[str] = {
-            'v', 'ver', 'app', 'sys', 'dir', 'exe', 'lib', 'api', 'sdk', 'url',
-            'cpu', 'gpu', 'ram', 'rom', 'hdd', 'ssd', 'lan', 'wan', 'sql', 'html'
-        }
-        
-        self.MISC: Set[str] = {
-            'vs', 'etc', 'ie', 'eg', 'no', 'al', 'ca', 'cf', 'pp', 'est', 'st',
-            'approx', 'appt', 'apt', 'dept', 'depts', 'min', 'max', 'avg'
-        }
-
-        # Combine all abbreviations
-        self.all_abbreviations: Set[str] = (
-            self.TITLES | self.ACADEMIC | self.ORGANIZATIONS |
-            self.MONTHS | self.UNITS | self.TECHNOLOGY | self.MISC
-        )
+    """
+    # Advanced sentence tokenizer with support for complex cases and proper formatting.
 
-        # Special patterns
-        self.ELLIPSIS: str = r'\.{2,}|…'
-        self.URL_PATTERN: str = (
-            r'(?:https?:\/\/|www\.)[\w\-\.]+\.[a-zA-Z]{2,}(?:\/[^\s]*)?'
-        )
-        self.EMAIL_PATTERN: str = r'[\w\.-]+@[\w\.-]+\.\w+'
-        self.NUMBER_PATTERN: str = (
-            r'\d+(?:\.\d+)?(?:%|°|km|cm|mm|m|kg|g|lb|ft|in|mph|kmh|hz|mhz|ghz)?'
-        )
-        
-        # Quote and bracket pairs
-        self.QUOTE_PAIRS: Dict[str, str] = {
-            '"': '"', "'": "'", '"': '"', "「": "」", "『": "』",
-            "«": "»", "‹": "›", "'": "'", "‚": "'"
-        }
-        
-        self.BRACKETS: Dict[str, str] = {
-            '(': ')', '[': ']', '{': '}', '⟨': '⟩', '「': '」',
-            '『': '』', '【': '】', '〖': '〗', '｢': '｣'
-        }
-
-        # Compile regex patterns
-        self._compile_patterns()
-
-    def _compile_patterns(self) -> None:
-        """Compile regex patterns for better performance."""
-        # Pattern for finding potential sentence boundaries
-        self.SENTENCE_END: Pattern = re.compile(
-            r'''
-            # Group for sentence endings
-            (?:
-                # Standard endings with optional quotes/brackets
-                (?<=[.!?])[\"\'\)\]\}»›」』\s]*
-                
-                # Ellipsis
-                |(?:\.{2,}|…)
-                
-                # Asian-style endings
-                |(?<=[。！？」』】\s])
-            )
-            
-            # Must be followed by whitespace and capital letter or number
-            (?=\s+(?:[A-Z0-9]|["'({[\[「『《‹〈][A-Z]))
-            ''',
-            re.VERBOSE
-        )
+    All patterns are compiled once when the class is defined and ``tokenize`` keeps
+    no state on the instance, so a single tokenizer can be shared between threads.
+    Every step is a single left-to-right pass, so run time grows linearly with the
+    length of the text.
+    """
+
+    # Common abbreviations by category
+    TITLES: FrozenSet[str] = frozenset({
+        'mr', 'mrs', 'ms', 'dr', 'prof', 'rev', 'sr', 'jr', 'esq',
+        'hon', 'pres', 'gov', 'atty', 'supt', 'det', 'rev', 'col','maj', 'gen', 'capt', 'cmdr',
+        'lt', 'sgt', 'cpl', 'pvt'
+    })
+
+    ACADEMIC: FrozenSet[str] = frozenset({
+        'ph.d', 'phd', 'm.d', 'md', 'b.a', 'ba', 'm.a', 'ma', 'd.d.s', 'dds',
+        'm.b.a', 'mba', 'b.sc', 'bsc', 'm.sc', 'msc', 'llb', 'll.b', 'bl'
+    })
+
+    ORGANIZATIONS: FrozenSet[str] = frozenset({
+        'inc', 'ltd', 'co', 'corp', 'llc', 'llp', 'assn', 'bros', 'plc', 'cos',
+        'intl', 'dept', 'est', 'dist', 'mfg', 'div'
+    })
+
+    MONTHS: FrozenSet[str] = frozenset({
+        'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
+    })
+
+    UNITS: FrozenSet[str] = frozenset({
+        'oz', 'pt', 'qt', 'gal', 'ml', 'cc', 'km', 'cm', 'mm', 'ft', 'in',
+        'kg', 'lb', 'lbs', 'hz', 'khz', 'mhz', 'ghz', 'kb', 'mb', 'gb', 'tb'
+    })
+
+    TECHNOLOGY: FrozenSet[str] = frozenset({
+        'v', 'ver', 'app', 'sys', 'dir', 'exe', 'lib', 'api', 'sdk', 'url',
+        'cpu', 'gpu', 'ram', 'rom', 'hdd', 'ssd', 'lan', 'wan', 'sql', 'html'
+    })
+
+    MISC: FrozenSet[str] = frozenset({
+        'vs', 'etc', 'ie', 'eg', 'no', 'al', 'ca', 'cf', 'pp', 'est', 'st',
+        'approx', 'appt', 'apt', 'dept', 'depts', 'min', 'max', 'avg'
+    })
 
-        # Pattern for abbreviations
-        abbrev_pattern = '|'.join(re.escape(abbr) for abbr in self.all_abbreviations)
-        self.ABBREV_PATTERN: Pattern = re.compile(
-            fr'\b(?:{abbrev_pattern})\.?',
-            re.IGNORECASE
+    # Combine all abbreviations
+    all_abbreviations: FrozenSet[str] = (
+        TITLES | ACADEMIC | ORGANIZATIONS | MONTHS | UNITS | TECHNOLOGY | MISC
+    )
+
+    # Special patterns
+    ELLIPSIS: str = r'\.{2,}|…'
+    URL_PATTERN: str = (
+        r'(?:https?:\/\/|www\.)[\w\-\.]+\.[a-zA-Z]{2,}(?:\/(?:[^\s]*[^\s.,;:!?\'")\]}»›])?)?'
+    )
+    EMAIL_PATTERN: str = r'[\w\.-]+@[\w\.-]+\.\w+'
+    NUMBER_PATTERN: str = (
+        r'\d+(?:\.\d+)?(?:%|°|km|cm|mm|m|kg|g|lb|ft|in|mph|kmh|hz|mhz|ghz)?'
+    )
+
+    # Quote and bracket pairs. Only pairs whose opening and closing characters
+    # differ can be matched reliably; straight quotes double as apostrophes.
+    QUOTE_PAIRS: Dict[str, str] = {
+        "「": "」", "『": "』", "«": "»", "‹": "›"
+    }
+
+    BRACKETS: Dict[str, str] = {
+        '(': ')', '[': ']', '{': '}', '⟨': '⟩', '「': '」',
+        '『': '』', '【': '】', '〖': '〗', '｢': '｣'
+    }
+
+    # Pattern for finding potential sentence boundaries
+    SENTENCE_END: Pattern = re.compile(
+        r'''
+        # Group for sentence endings
+        (?:
+            # Standard endings with optional quotes/brackets, or a quote ending in one
+            (?<=[.!?\ue002])[\"\'\)\]\}»›」』\s]*
+
+            # Ellipsis
+            |(?:\.{2,}|…)
+
+            # Asian-style endings
+            |(?<=[。！？」』】\s])
         )
 
-    def _protect_special_cases(self, text: str) -> Tuple[str, Dict[str, str]]:
-        """Protect URLs, emails, and other special cases from being split."""
-        protected = text
-        placeholders: Dict[str, str] = {}
-        counter = 0
+        # Must be followed by whitespace and capital letter or number
+        (?=\s+(?:[A-Z0-9]|["'({[\[「『《‹〈][A-Z]))
+        ''',
+        re.VERBOSE
+    )
+
+    # Pattern for abbreviations, built as a trie so each word costs a single
+    # walk instead of one attempt per abbreviation. The longest abbreviation
+    # wins, so "mrs." is not cut short by a match on "mr".
+    ABBREV_PATTERN: Pattern = re.compile(
+        r'\b(?=[a-z])(?:{})\.?'.format(_trie_pattern(all_abbreviations)),
+        re.IGNORECASE
+    )
+
+    SPECIAL_CASES: Pattern = re.compile(f'{URL_PATTERN}|{EMAIL_PATTERN}')
+    QUOTE_CHARS: Pattern = re.compile(
+        '[{}]'.format(re.escape(''.join(QUOTE_PAIRS) + ''.join(QUOTE_PAIRS.values())))
+    )
+    # Internal markers use private-use characters, which are stripped from the input,
+    # so no literal text can be mistaken for them.
+    PROTECT_OPEN: str = '\ue000'
+    PROTECT_CLOSE: str = '\ue001'
+    PROTECT_CLOSE_TERMINAL: str = '\ue002'
+    DOT: str = '\ue003'
+    PARA: str = '\ue004'
+    MARKERS: Pattern = re.compile('[\ue000-\ue004]')
+    PLACEHOLDER: Pattern = re.compile('\ue000(\\d+)[\ue001\ue002]')
+    TERMINAL_QUOTE: Pattern = re.compile(r'[.!?…]\s*.$', re.DOTALL)
+    PARAGRAPH_BREAK: Pattern = re.compile(r'\n\s*\n')
+    WHITESPACE: Pattern = re.compile(r'\s+')
+
+    def _protect_special_cases(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Protect URLs, emails, and quoted content from being split.
+
+        Protected spans are replaced with ``PROTECT_OPEN <n> PROTECT_CLOSE`` where ``n``
+        indexes the returned list of original strings. Quotes whose content ends a
+        sentence are closed with ``PROTECT_CLOSE_TERMINAL`` instead, so the text may
+        be split after them.
+        """
+        protected: List[str] = []
+
+        def protect(content: str, quote: bool = False) -> str:
+            # Nested spans were already replaced; store the fully restored text.
+            if self.PROTECT_OPEN in content:
+                content = self._restore_special_cases(content, protected)
+            protected.append(content)
+            terminal = quote and self.TERMINAL_QUOTE.search(content) is not None
+            close = self.PROTECT_CLOSE_TERMINAL if terminal else self.PROTECT_CLOSE
+            return f'{self.PROTECT_OPEN}{len(protected) - 1}{close}'
 
         # Protect URLs and emails
-        for pattern in [self.URL_PATTERN, self.EMAIL_PATTERN]:
-            for match in re.finditer(pattern, protected):
-                placeholder = f'__PROTECTED_{counter}__'
-                placeholders[placeholder] = match.group()
-                protected = protected.replace(match.group(), placeholder)
-                counter += 1
-
-        # Protect quoted content
-        stack = []
-        protected_chars = list(protected)
-        i = 0
-        while i < len(protected_chars):
-            char = protected_chars[i]
+        text = self.SPECIAL_CASES.sub(lambda match: protect(match.group()), text)
+
+        # Protect quoted content. Only quote characters are visited; the text
+        # between them is copied as whole slices.
+        parts: List[str] = []
+        stack: List[Tuple[str, int]] = []
+        last = 0
+        for match in self.QUOTE_CHARS.finditer(text):
+            char, index = match.group(), match.start()
             if char in self.QUOTE_PAIRS:
-                stack.append((char, i))
-            elif stack and char == self.QUOTE_PAIRS[stack[-1][0]]:
-                start_quote, start_idx = stack.pop()
-                content = ''.join(protected_chars[start_idx:i + 1])
-                placeholder = f'__PROTECTED_{counter}__'
-                placeholders[placeholder] = content
-                protected_chars[start_idx:i + 1] = list(placeholder)
-                counter += 1
-            i += 1
-
-        return ''.join(protected_chars), placeholders
-
-    def _restore_special_cases(self, text: str, placeholders: Dict[str, str]) -> str:
+                parts.append(text[last:index])
+                last = index
+                stack.append((self.QUOTE_PAIRS[char], len(parts)))
+            elif stack and char == stack[-1][0]:
+                _, start = stack.pop()
+                parts.append(text[last:index + 1])
+                last = index + 1
+                content = ''.join(parts[start:])
+                del parts[start:]
+                parts.append(protect(content, quote=True))
+        parts.append(text[last:])
+
+        return ''.join(parts), protected
+
+    def _restore_special_cases(self, text: str, placeholders: List[str]) -> str:
         """Restore protected content."""
-        restored = text
-        for placeholder, original in placeholders.items():
-            restored = restored.replace(placeholder, original)
-        return restored
+        if self.PROTECT_OPEN not in text:
+            return text
+
+        def restore(match: re.Match) -> str:
+            index = int(match.group(1))
+            return placeholders[index] if index < len(placeholders) else match.group()
+
+        return self.PLACEHOLDER.sub(restore, text)
 
     def _handle_abbreviations(self, text: str) -> str:
         """Handle abbreviations to prevent incorrect sentence splitting."""
         def replace_abbrev(match: re.Match) -> str:
             abbr = match.group().lower().rstrip('.')
             if abbr in self.all_abbreviations:
-                return match.group().replace('.', '__DOT__')
+                return match.group().replace('.', self.DOT)
             return match.group()
 
         return self.ABBREV_PATTERN.sub(replace_abbrev, text)
@@ -157,9 +212,9 @@ class SentenceTokenizer:
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace while preserving paragraph breaks."""
         # Replace multiple newlines with special marker
-        text = re.sub(r'\n\s*\n', ' __PARA__ ', text)
+        text = self.PARAGRAPH_BREAK.sub(f' {self.PARA} ', text)
         # Normalize remaining whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self.WHITESPACE.sub(' ', text)
         return text.strip()
 
     def _restore_formatting(self, sentences: List[str]) -> List[str]:
@@ -167,22 +222,22 @@ class SentenceTokenizer:
         restored = []
         for sentence in sentences:
             # Restore dots in abbreviations
-            sentence = sentence.replace('__DOT__', '.')
-            
+            sentence = sentence.replace(self.DOT, '.')
+
             # Restore paragraph breaks
-            sentence = sentence.replace('__PARA__', '\n\n')
-            
+            sentence = sentence.replace(self.PARA, '\n\n')
+
             # Clean up whitespace
-            sentence = re.sub(r'\s+', ' ', sentence).strip()
-            
+            sentence = self.WHITESPACE.sub(' ', sentence).strip()
+
             # Capitalize first letter if it's lowercase and not an abbreviation
-            words = sentence.split()
-            if words and words[0].lower() not in self.all_abbreviations:
+            words = sentence.split(' ', 1)
+            if words[0] and words[0].lower() not in self.all_abbreviations:
                 sentence = sentence[0].upper() + sentence[1:]
-            
+
             if sentence:
                 restored.append(sentence)
-        
+
         return restored
 
     def tokenize(self, text: str) -> List[str]:
@@ -195,7 +250,9 @@ class SentenceTokenizer:
         Returns:
             List[str]: List of properly formatted sentences.
         """
-        if not text or not text.strip():
+        # Step 0: Drop characters reserved for the internal markers
+        text = self.MARKERS.sub('', text or '')
+        if not text.strip():
             return []
 
         # Step 1: Protect special cases
@@ -239,12 +296,19 @@ class SentenceTokenizer:
         
         return final_sentences
 
-def sanitize_text(text: str) -> str:
-    """Removes emojis from text."""
-    return re.sub(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
+EMOJI_PATTERN: Pattern = re.compile(
+    r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF'
     r'\U0001F700-\U0001F77F\U0001F780-\U0001F7FF\U0001F800-\U0001F8FF'
     r'\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF'
-    r'\U00002702-\U000027B0\U000024C2-\U0001F251]+', '', text)
+    r'\U00002702-\U000027B0\U000024C2-\U0001F251]+'
+)
+
+# Shared, precompiled tokenizer used by split_into_sentences.
+_TOKENIZER = SentenceTokenizer()
+
+def sanitize_text(text: str) -> str:
+    """Removes emojis from text."""
+    return EMOJI_PATTERN.sub('', text)
 
 def split_into_sentences(text: str) -> List[str]:
     """
@@ -257,5 +321,183 @@ def split_into_sentences(text: str) -> List[str]:
         List[str]: List of properly formatted sentences.
     """
 
-    tokenizer = SentenceTokenizer()
-    return tokenizer.tokenize(sanitize_text(text).strip())
+    return _TOKENIZER.tokenize(sanitize_text(text).strip())
+
+class PreparedText(List[str]):
+    """
+    # Text that has already been split into request-sized chunks.
+    
+    The providers send the chunks of a PreparedText as they are instead of
+    tokenizing them again. See ``openai_tts.preprocess.CorpusPreprocessor``.
+    """
+
+# Anything speak() accepts as input: text, a path, a text file object or an iterable of text fragments.
+TextSource = Union[str, os.PathLike, TextIO, Iterable[str]]
+
+PARAGRAPH_CUT: Pattern = re.compile(r'\n[^\S\n]*\n\s*')
+SENTENCE_CUT: Pattern = re.compile(
+    r'([^\s.!?]*)([.!?]+)["\'\)\]»›」』]*\s+(?=["\'(\[«‹「『]?[A-Z0-9])'
+)
+
+def iter_text_blocks(source: TextSource, block_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    # Read a text source piece by piece.
+    
+    Args:
+        source (TextSource): A string, a path, an object with a ``read`` method, or an
+            iterable of consecutive text fragments (such as the lines of a file).
+        block_size (int): Characters read at a time from paths and file objects.
+    
+    Returns:
+        Iterator[str]: Consecutive pieces of the text.
+    """
+    if isinstance(source, str):
+        yield source
+    elif isinstance(source, os.PathLike):
+        with open(source, encoding='utf-8') as f:
+            yield from iter(lambda: f.read(block_size), '')
+    elif hasattr(source, 'read'):
+        yield from iter(lambda: source.read(block_size), '')
+    else:
+        yield from source
+
+def _quoted_spans(buffer: str) -> List[Tuple[int, int]]:
+    """Return the outermost quoted spans of buffer; an unclosed quote runs to the end."""
+    spans: List[Tuple[int, int]] = []
+    stack: List[Tuple[str, int]] = []
+    for match in SentenceTokenizer.QUOTE_CHARS.finditer(buffer):
+        char, index = match.group(), match.start()
+        if char in SentenceTokenizer.QUOTE_PAIRS:
+            stack.append((SentenceTokenizer.QUOTE_PAIRS[char], index))
+        elif stack and char == stack[-1][0]:
+            _, start = stack.pop()
+            if not stack:
+                spans.append((start, index + 1))
+    if stack:
+        spans.append((stack[0][1], len(buffer)))
+    return spans
+
+def _find_cut(buffer: str) -> int:
+    """Return the end of the last sentence boundary that is safe to split at, or 0."""
+    spans = _quoted_spans(buffer)
+    starts = [start for start, _ in spans]
+
+    def quoted(index: int) -> bool:
+        i = bisect.bisect_right(starts, index) - 1
+        return i >= 0 and index < spans[i][1]
+
+    cuts = [match.end() for match in PARAGRAPH_CUT.finditer(buffer)]
+    if not cuts:
+        for match in SENTENCE_CUT.finditer(buffer):
+            word, terminator = match.group(1), match.group(2)
+            # Skip abbreviations and initials such as "Dr." or "J."
+            if terminator == '.' and (len(word) <= 1 or word.lower() in SentenceTokenizer.all_abbreviations):
+                continue
+            cuts.append(match.end())
+    for cut in reversed(cuts):
+        if not quoted(cut - 1):
+            return cut
+    return 0
+
+def iter_sentences(source: TextSource, block_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    # Incrementally split a text source into sentences.
+    
+    The text is read block by block and only the unfinished tail of the last
+    block is carried over, so memory use does not grow with the document.
+    
+    Args:
+        source (TextSource): Text, a path, a file object or an iterable of text fragments.
+        block_size (int): Characters tokenized per step.
+    
+    Returns:
+        Iterator[str]: Sentences in reading order.
+    """
+    buffer = ''
+    for block in iter_text_blocks(source, block_size):
+        buffer += block
+        if len(buffer) < block_size:
+            continue
+        cut = _find_cut(buffer)
+        if not cut and len(buffer) > 4 * block_size:
+            # No sentence boundary at all; fall back to a word boundary.
+            cut = buffer.rfind(' ') + 1 or len(buffer)
+        if cut:
+            yield from split_into_sentences(buffer[:cut])
+            buffer = buffer[cut:]
+    if buffer:
+        yield from split_into_sentences(buffer)
+
+CLAUSE_BOUNDARY: Pattern = re.compile(r'(?<=[,;:\u2013\u2014])\s+')
+
+def _greedy_join(parts: Iterable[str], limit: int) -> Iterator[str]:
+    """Join consecutive parts with spaces into pieces no longer than limit where possible."""
+    current = ''
+    for part in parts:
+        if not current:
+            current = part
+        elif len(current) + 1 + len(part) <= limit:
+            current += ' ' + part
+        else:
+            yield current
+            current = part
+    if current:
+        yield current
+
+def split_long_sentence(sentence: str, limit: int) -> Iterator[str]:
+    """
+    # Split a sentence longer than limit, preferring clause boundaries over word boundaries.
+    
+    Args:
+        sentence (str): The sentence to split.
+        limit (int): Maximum number of characters per piece.
+    
+    Returns:
+        Iterator[str]: Pieces of the sentence, in order.
+    """
+    if len(sentence) <= limit:
+        yield sentence
+        return
+
+    for clause in _greedy_join(CLAUSE_BOUNDARY.split(sentence), limit):
+        if len(clause) <= limit:
+            yield clause
+            continue
+        for words in _greedy_join(clause.split(), limit):
+            # A single word longer than the limit has to be cut.
+            for start in range(0, len(words), limit):
+                yield words[start:start + limit]
+
+def pack_sentences(
+    sentences: Iterable[str],
+    max_chars: int,
+    first_chunk_chars: Optional[int] = None
+) -> Iterator[str]:
+    """
+    # Pack consecutive sentences into request-sized chunks.
+    
+    Short sentences are merged up to max_chars and overlong sentences are split at
+    clause boundaries. When first_chunk_chars is smaller than max_chars, the first
+    chunk is kept short so audio for it comes back sooner.
+    
+    Args:
+        sentences (Iterable[str]): Sentences in reading order.
+        max_chars (int): Character budget per chunk.
+        first_chunk_chars (Optional[int]): Character budget for the first chunk.
+    
+    Returns:
+        Iterator[str]: Chunks of text, in order.
+    """
+    sentences = iter(sentences)
+
+    if first_chunk_chars and first_chunk_chars < max_chars:
+        first = next(sentences, None)
+        if first is None:
+            return
+        pieces = list(split_long_sentence(first, first_chunk_chars))
+        yield pieces[0]
+        if len(pieces) > 1:
+            sentences = chain([' '.join(pieces[1:])], sentences)
+
+    pieces = (piece for sentence in sentences for piece in split_long_sentence(sentence, max_chars))
+    yield from _greedy_join(pieces, max_chars)
@@ -17,5 +17,11 @@ setup(
         'curl-cffi',
         'future'
     ],
+    entry_points={
+        'console_scripts': [
+            'openai-tts=openai_tts.cli:main',
+            'openai-tts-server=openai_tts.server:main',
+        ],
+    },
 )
 
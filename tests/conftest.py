@@ -0,0 +1,17 @@
+"""Shared fixtures for the test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from stub_server import StubServer, StubSettings  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    """A local stand-in for the generate endpoint, answering every request after 10 ms."""
+    with StubServer(StubSettings(latency=0.01, jitter=0.0)) as server:
+        yield server
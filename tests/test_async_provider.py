@@ -0,0 +1,45 @@
+"""Tests for the asyncio provider."""
+
+import asyncio
+import sqlite3
+import time
+
+from openai_tts import AsyncOpenaiTTS, TTSConfig
+from openai_tts.cache import AudioCache
+
+TEXT = " ".join(f"Sentence number {i} is here." for i in range(5))
+
+
+async def longest_stall(coroutine) -> float:
+    """Run ``coroutine`` and return the longest time the event loop was unresponsive meanwhile."""
+    longest = 0.0
+    task = asyncio.ensure_future(coroutine)
+    while not task.done():
+        before = time.monotonic()
+        await asyncio.sleep(0.01)
+        longest = max(longest, time.monotonic() - before - 0.01)
+    await task
+    return longest
+
+
+def test_locked_cache_does_not_block_the_event_loop(stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioCache, 'TIMEOUT', 0.5)
+    config = TTSConfig(base_url=stub.base_url, cache_dir=str(tmp_path / "cache"), verbose=False)
+    tts = AsyncOpenaiTTS(config)
+    # Another process holds the write lock, so every store waits out the timeout.
+    holder = sqlite3.connect(str(tts.cache.path), isolation_level=None)
+    holder.execute('BEGIN IMMEDIATE')
+
+    async def main():
+        try:
+            return await longest_stall(tts.aspeak_bytes(TEXT))
+        finally:
+            await tts.aclose()
+
+    try:
+        stall = asyncio.run(main())
+    finally:
+        holder.execute('ROLLBACK')
+        holder.close()
+    assert stall < 0.25
+    assert stub.requests == 5
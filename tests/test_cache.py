@@ -0,0 +1,126 @@
+"""Tests for the on-disk audio cache."""
+
+import multiprocessing
+import sqlite3
+
+import pytest
+
+from openai_tts.cache import AudioCache, chunk_cache_key
+
+
+def stored_bytes(cache: AudioCache) -> int:
+    """Sum the sizes of the stored rows, independently of the running total."""
+    return cache._connection().execute('SELECT COALESCE(SUM(size), 0) FROM chunks').fetchone()[0]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AudioCache(tmp_path, max_bytes=300)
+    yield cache
+    cache.close()
+
+
+def test_cache_key_ignores_whitespace_differences():
+    assert chunk_cache_key("Hello  there.\n", "nova", "p") == chunk_cache_key("Hello there.", "nova", "p")
+    assert chunk_cache_key("Hello there.", "nova", "p") != chunk_cache_key("Hello there.", "ash", "p")
+
+
+def test_round_trip_and_miss(cache):
+    assert cache.get("missing") is None
+    cache.put("a", b"x" * 10)
+    assert cache.get("a") == b"x" * 10
+    assert len(cache) == 1
+
+
+def test_size_accounting(cache):
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"y" * 50)
+    assert cache.size() == stored_bytes(cache) == 150
+    cache.put("a", b"z" * 20)  # Replacing an entry counts only its new size.
+    assert cache.size() == stored_bytes(cache) == 70
+    cache.clear()
+    assert cache.size() == stored_bytes(cache) == 0
+    assert len(cache) == 0
+
+
+def test_empty_and_oversized_chunks_are_not_stored(cache):
+    cache.put("empty", b"")
+    cache.put("huge", b"x" * 301)
+    assert cache.get("empty") is None
+    assert cache.get("huge") is None
+    assert cache.size() == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    cache.put("c", b"c" * 100)
+    assert cache.get("a") is not None  # "b" is now the least recently used.
+    cache.put("d", b"d" * 100)
+    assert cache.get("b") is None
+    for key in "acd":
+        assert cache.get(key) is not None
+    assert cache.size() == stored_bytes(cache) == 300
+
+
+def test_hits_do_not_write_until_flushed(tmp_path):
+    cache = AudioCache(tmp_path)
+    cache.put("a", b"a" * 10)
+    before = cache._connection().execute('SELECT last_access FROM chunks').fetchone()[0]
+    assert cache.get("a") is not None
+    assert cache._connection().execute('SELECT last_access FROM chunks').fetchone()[0] == before
+    cache.flush()
+    assert cache._connection().execute('SELECT last_access FROM chunks').fetchone()[0] > before
+    cache.close()
+
+
+def test_locked_database_skips_the_store(tmp_path):
+    cache = AudioCache(tmp_path)
+    cache.TIMEOUT = 0.1
+    cache.close()
+    holder = sqlite3.connect(str(cache.path), isolation_level=None)
+    holder.execute('BEGIN IMMEDIATE')
+    try:
+        cache.put("a", b"a" * 10)  # Must not raise.
+    finally:
+        holder.execute('ROLLBACK')
+        holder.close()
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_database_errors_are_treated_as_misses(cache, monkeypatch):
+    cache.put("a", b"a" * 10)
+
+    def broken():
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(cache, '_connection', broken)
+    assert cache.get("a") is None
+    cache.put("b", b"b" * 10)  # Must not raise.
+
+
+def _worker(args):
+    directory, worker = args
+    cache = AudioCache(directory, max_bytes=4000)
+    for i in range(60):
+        key = f"{worker}-{i}"
+        cache.put(key, bytes([worker]) * (50 + i))
+        cache.get(f"{(worker + 1) % 4}-{i}")
+    cache.close()
+
+
+def test_concurrent_processes_share_the_cache(tmp_path):
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        pytest.skip("needs the fork start method")
+    with context.Pool(4) as pool:
+        pool.map(_worker, [(str(tmp_path), worker) for worker in range(4)])
+    cache = AudioCache(tmp_path, max_bytes=4000)
+    try:
+        assert 0 < cache.size() <= 4000
+        assert cache.size() == stored_bytes(cache)
+        assert len(cache) > 0
+    finally:
+        cache.close()
@@ -0,0 +1,145 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import time
+
+import pytest
+from stub_server import silent_mp3
+
+from openai_tts import AsyncOpenaiTTS, OpenaiTTS, RetryPolicy, TTSConfig
+from openai_tts.exceptions import TTSRequestError
+from openai_tts.hedging import Hedger
+
+AUDIO = silent_mp3(3)
+SLOW = 0.3
+
+
+def make_config(**overrides) -> TTSConfig:
+    settings = dict(
+        verbose=False,
+        hedge_percentile=0.5,
+        retry=RetryPolicy(backoff_base=0.01, jitter=0.0),
+        circuit_failure_threshold=10 ** 6,
+    )
+    settings.update(overrides)
+    return TTSConfig(**settings)
+
+
+def prime(hedger: Hedger, latency: float = 0.01, tokens: float = 1.0) -> None:
+    """Give the hedger enough history to hedge after ``latency`` seconds, and ``tokens`` hedges."""
+    for _ in range(Hedger.MIN_SAMPLES):
+        hedger.end(None, latency)
+    hedger._tokens = tokens
+
+
+def test_hedges_are_paid_for_by_finished_requests():
+    hedger = Hedger(max_ratio=0.25, burst=2.0)
+    assert not hedger.try_acquire()
+    for _ in range(3):
+        hedger.end("key")
+    assert not hedger.try_acquire()
+    hedger.end("key")
+    assert hedger.try_acquire()
+    assert not hedger.try_acquire()
+    assert hedger.hedges == 1
+
+
+def test_hedge_tokens_are_capped_at_the_burst():
+    hedger = Hedger(max_ratio=0.5, burst=2.0)
+    for _ in range(100):
+        hedger.end("key")
+    assert [hedger.try_acquire() for _ in range(3)] == [True, True, False]
+    assert hedger.hedges == 2
+
+
+def test_delay_is_the_latency_percentile():
+    hedger = Hedger(percentile=0.9)
+    for latency in range(1, Hedger.MIN_SAMPLES):
+        hedger.end(None, latency / 100)
+    assert hedger.delay() is None
+    hedger.end(None, 0.2)
+    assert hedger.delay() == pytest.approx(0.19)
+    # Failed requests earn tokens but say nothing about latency.
+    hedger.end(None)
+    assert hedger.delay() == pytest.approx(0.19)
+
+
+@pytest.mark.parametrize("percentile", [0, 1, 1.5])
+def test_percentile_must_be_a_fraction(percentile):
+    with pytest.raises(ValueError):
+        Hedger(percentile=percentile)
+
+
+def test_preempt_resolves_the_running_request():
+    hedger = Hedger()
+    preempted = hedger.begin("key")
+    assert hedger.started_at("key") is not None
+    hedger.preempt("key", AUDIO)
+    hedger.preempt("key", b"later hedge")
+    assert preempted.result(0) == AUDIO
+    hedger.end("key")
+    assert hedger.started_at("key") is None
+    hedger.preempt("key", AUDIO)
+    assert not hedger.begin("key").done()
+
+
+def test_slow_request_is_not_hedged_without_tokens(monkeypatch):
+    tts = OpenaiTTS(make_config())
+    prime(tts.hedger, tokens=0.0)
+    attempts = []
+
+    def attempt(chunk_number, params, config, deadline):
+        attempts.append(chunk_number)
+        time.sleep(SLOW)
+        return AUDIO, None
+
+    monkeypatch.setattr(tts, '_attempt', attempt)
+    with tts:
+        assert tts.speak_bytes("Only one chunk.")
+    assert tts.hedger.hedges == 0
+    assert len(attempts) == 1
+
+
+def test_winning_hedge_stops_the_primary_retrying(monkeypatch):
+    tts = OpenaiTTS(make_config())
+    prime(tts.hedger)
+    attempts = []
+
+    def attempt(chunk_number, params, config, deadline):
+        attempts.append(chunk_number)
+        if len(attempts) == 1:
+            time.sleep(SLOW)
+            return b'', TTSRequestError("slow failure")
+        return AUDIO, None
+
+    monkeypatch.setattr(tts, '_attempt', attempt)
+    assert tts.speak_bytes("Only one chunk.")
+    tts.close()  # Waits for the primary request, which keeps running after the hedge won.
+    assert tts.hedger.hedges == 1
+    assert len(attempts) == 2
+
+
+def test_winning_hedge_hands_its_audio_to_coalesced_callers(monkeypatch):
+    tts = AsyncOpenaiTTS(make_config())
+    prime(tts.hedger)
+    attempts = []
+
+    async def attempt(chunk_number, params, config, deadline):
+        attempts.append(chunk_number)
+        if len(attempts) == 1:
+            await asyncio.sleep(SLOW)
+            return b'', TTSRequestError("slow failure")
+        return AUDIO, None
+
+    monkeypatch.setattr(tts, '_aattempt', attempt)
+
+    async def main():
+        # Both callers wait for one request; only one of them may hedge it.
+        results = await asyncio.gather(tts.aspeak_bytes("Only one chunk."), tts.aspeak_bytes("Only one chunk."))
+        await tts.aclose()
+        return results
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert tts.hedger.hedges == 1
+    assert len(attempts) == 2
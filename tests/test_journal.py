@@ -0,0 +1,123 @@
+"""Tests for the checkpoint journal and resuming interrupted calls."""
+
+import asyncio
+
+import pytest
+
+from openai_tts import AsyncOpenaiTTS, OpenaiTTS, RetryPolicy, TTSConfig
+from openai_tts.exceptions import TTSException
+from openai_tts.journal import Journal
+
+CHUNKS = 30
+TEXT = " ".join(f"Sentence number {i} is here." for i in range(CHUNKS))
+
+
+def make_config(stub, tmp_path, **overrides) -> TTSConfig:
+    settings = dict(
+        base_url=stub.base_url,
+        journal_dir=str(tmp_path / "journal"),
+        verbose=False,
+        retry=RetryPolicy(max_attempts=1),
+        circuit_failure_threshold=10 ** 6,
+    )
+    settings.update(overrides)
+    return TTSConfig(**settings)
+
+
+def test_journal_round_trip(tmp_path):
+    journal = Journal(tmp_path / "job")
+    journal.record(0, "a" * 64, "First.")
+    journal.record(1, "b" * 64, "Second.")
+    journal.put(0, "a" * 64, b"audio")
+    assert journal.get(0, "a" * 64) == b"audio"
+    assert journal.get(0, "c" * 64) is None
+    assert journal.get(1, "b" * 64) is None
+    journal.close()
+
+    reopened = Journal(tmp_path / "job")
+    assert reopened.entries == {0: "a" * 64, 1: "b" * 64}
+    assert reopened.get(0, "a" * 64) == b"audio"
+    reopened.close()
+
+
+def test_torn_manifest_line_is_ignored(tmp_path):
+    journal = Journal(tmp_path / "job")
+    journal.record(0, "a" * 64, "First.")
+    journal.close()
+    with (tmp_path / "job" / Journal.MANIFEST).open('a', encoding='utf-8') as f:
+        f.write('{"index": 1, "ke')
+
+    reopened = Journal(tmp_path / "job")
+    assert reopened.entries == {0: "a" * 64}
+    reopened.close()
+
+
+def test_journal_path_depends_only_on_the_output(tmp_path):
+    first = Journal.for_output(tmp_path, tmp_path / "out.mp3")
+    second = Journal.for_output(tmp_path, str(tmp_path / "." / "out.mp3"))
+    other = Journal.for_output(tmp_path, tmp_path / "other.mp3")
+    for journal in (first, second, other):
+        journal.close()
+    assert first.path == second.path != other.path
+
+
+def test_put_after_discard_is_ignored(tmp_path):
+    journal = Journal(tmp_path / "job")
+    journal.put(0, "a" * 64, b"audio")
+    journal.discard()
+    journal.put(1, "b" * 64, b"late audio")
+    assert not (tmp_path / "job").exists()
+
+
+def journaled_chunks(config: TTSConfig, output) -> int:
+    journal = Journal.for_output(config.journal_dir, output)
+    journal.close()
+    return len(list(journal.path.glob("*.mp3")))
+
+
+@pytest.mark.parametrize("coalesce", [True, False], ids=["coalesced", "direct"])
+def test_chunks_in_flight_when_a_call_fails_are_journaled(stub, tmp_path, coalesce):
+    stub.settings.error_rate = 0.3
+    stub.settings.jitter = 0.5
+    output = tmp_path / "out.mp3"
+    config = make_config(stub, tmp_path, coalesce_requests=coalesce)
+
+    tts = OpenaiTTS(config)
+    with pytest.raises(TTSException):
+        tts.speak(TEXT, output_path=output)
+    tts.close()  # Waits for the requests that were still in flight.
+    sent, failed = stub.requests, stub.failed
+    assert journaled_chunks(config, output) == sent - failed
+
+    stub.settings.error_rate = 0.0
+    with OpenaiTTS(config) as tts:
+        tts.speak(TEXT, output_path=output)
+    # Only the chunks that never got audio are requested again.
+    assert stub.requests - sent == CHUNKS - (sent - failed)
+    assert not list((tmp_path / "journal").iterdir())
+
+
+def test_aspeak_resumes_from_the_journal(stub, tmp_path):
+    stub.settings.error_rate = 0.3
+    output = tmp_path / "out.mp3"
+    config = make_config(stub, tmp_path)
+
+    async def speak():
+        tts = AsyncOpenaiTTS(config)
+        try:
+            return await tts.aspeak(TEXT, output_path=output)
+        finally:
+            await tts.aclose()
+
+    with pytest.raises(TTSException):
+        asyncio.run(speak())
+    saved = journaled_chunks(config, output)
+    assert saved
+    sent = stub.requests
+
+    stub.settings.error_rate = 0.0
+    asyncio.run(speak())
+    assert stub.requests - sent == CHUNKS - saved
+    assert not list((tmp_path / "journal").iterdir())
+    with OpenaiTTS(make_config(stub, tmp_path, journal_dir=None)) as tts:
+        assert output.read_bytes() == tts.speak_bytes(TEXT)
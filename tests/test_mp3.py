@@ -0,0 +1,275 @@
+"""Tests for MP3 frame parsing and single-header concatenation."""
+
+import io
+import random
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from openai_tts.mp3 import (
+    TOC_POINTS,
+    XING_FLAGS,
+    MP3Writer,
+    id3v2_size,
+    parse_header,
+    scan_frames,
+    xing_frame,
+)
+
+# Layer III, no CRC, 44.1 kHz, joint stereo: the format encoders return by default.
+MPEG1 = 0xFB
+MPEG2 = 0xF3
+JOINT_STEREO = 0x44
+MONO = 0xC4
+
+ID3_TAG = b'ID3\x04\x00\x00\x00\x00\x00\x17' + b'TSSE\x00\x00\x00\x0d\x00\x00\x03Lavf60.3.100'
+ID3V1_TAG = b'TAG' + bytes(125)
+
+
+def frame(bitrate_index, padding=0, version=MPEG1, rate_index=0, mode=JOINT_STEREO, rng=None):
+    """Build one frame with the given header fields and random payload."""
+    header = bytes((0xFF, version, (bitrate_index << 4) | (rate_index << 2) | (padding << 1), mode))
+    length = parse_header(header).length
+    rng = rng or random.Random(length)
+    return header + bytes(rng.getrandbits(8) for _ in range(length - 4))
+
+
+def info_frame(tag=b'Info'):
+    """Build the metadata frame an encoder puts in front of the audio."""
+    header = bytes((0xFF, MPEG1, 0x90, JOINT_STEREO))
+    body = bytes(32) + tag + struct.pack('>III', XING_FLAGS, 10, 4170) + bytes(100)
+    return header + body + bytes(417 - 4 - len(body))
+
+
+def cbr_frames(count, seed=0):
+    """Frames as a 128 kbit/s encoder writes them, padded to keep the exact bitrate."""
+    rng = random.Random(seed)
+    frames = []
+    remainder = 0
+    for _ in range(count):
+        # 1152 * 128000 / 8 / 44100 = 417.96 bytes, so most frames carry a padding byte.
+        remainder += 1152 * 128000 // 8 % 44100
+        padding = 1 if remainder >= 44100 else 0
+        remainder -= padding * 44100
+        frames.append(frame(9, padding, rng=rng))
+    return frames
+
+
+def vbr_frames(count, seed=0):
+    rng = random.Random(seed)
+    return [frame(rng.choice((5, 9, 11, 14)), rng=rng) for _ in range(count)]
+
+
+def cbr_chunk(count, seed=0):
+    return ID3_TAG + info_frame() + b''.join(cbr_frames(count, seed))
+
+
+def vbr_chunk(count, seed=0):
+    return ID3_TAG + info_frame(b'Xing') + b''.join(vbr_frames(count, seed))
+
+
+def read_info(data):
+    """Decode the Info/Xing frame at the start of a written file."""
+    header = parse_header(data)
+    offset = 4 + header.side_info_size
+    tag = data[offset:offset + 4]
+    flags, frames, total_bytes = struct.unpack_from('>III', data, offset + 4)
+    toc = data[offset + 16:offset + 116]
+    return header, tag, flags, frames, total_bytes, toc
+
+
+def expected_toc(frame_offsets, total_bytes):
+    return [
+        frame_offsets[i * len(frame_offsets) // TOC_POINTS] * 256 // total_bytes
+        for i in range(TOC_POINTS)
+    ]
+
+
+def frame_offsets(data):
+    """Offsets of every audio frame in a written file, skipping its first (Info) frame."""
+    offsets = []
+    pos = parse_header(data).length
+    while pos < len(data):
+        offsets.append(pos)
+        pos += parse_header(data, pos).length
+    assert pos == len(data)
+    return offsets
+
+
+@pytest.mark.parametrize("header, fields", [
+    (bytes((0xFF, MPEG1, 0x90, JOINT_STEREO)), (3, 128, 44100, 0, False, 417, 1152)),
+    (bytes((0xFF, MPEG1, 0x92, JOINT_STEREO)), (3, 128, 44100, 1, False, 418, 1152)),
+    (bytes((0xFF, MPEG1, 0xE4, MONO)), (3, 320, 48000, 0, True, 960, 1152)),
+    (bytes((0xFF, MPEG2, 0x84, MONO)), (2, 64, 24000, 0, True, 192, 576)),
+])
+def test_parse_header(header, fields):
+    parsed = parse_header(header)
+    assert (
+        parsed.version, parsed.bitrate, parsed.sample_rate, parsed.padding, parsed.mono, parsed.length, parsed.samples
+    ) == fields
+
+
+@pytest.mark.parametrize("header", [
+    b'\xff\xfb\x90',  # Too short
+    b'\xfe\xfb\x90\x44',  # No frame sync
+    b'\xff\xfd\x90\x44',  # Layer II
+    b'\xff\xeb\x90\x44',  # Reserved MPEG version
+    b'\xff\xfb\x00\x44',  # Free-format bitrate
+    b'\xff\xfb\xf0\x44',  # Invalid bitrate
+    b'\xff\xfb\x9c\x44',  # Reserved sample rate
+])
+def test_parse_header_rejects_invalid_headers(header):
+    assert parse_header(header) is None
+
+
+def test_id3v2_size():
+    assert id3v2_size(ID3_TAG + b'\xff\xfb') == len(ID3_TAG)
+    # Synchsafe size 0x81 = 129, plus a footer.
+    assert id3v2_size(b'ID3\x04\x00\x10\x00\x00\x01\x01') == 10 + 129 + 10
+    assert id3v2_size(b'\xff\xfb\x90\x44') == 0
+    assert id3v2_size(b'ID3') == 0
+
+
+def test_scan_cbr_chunk_skips_tags_and_info_frame():
+    frames = cbr_frames(20)
+    chunk = ID3_TAG + ID3_TAG + info_frame() + b''.join(frames) + ID3V1_TAG
+    found = scan_frames(chunk)
+    start = 2 * len(ID3_TAG) + 417
+    assert found.segments == [(start, start + sum(map(len, frames)))]
+    assert found.frame_lengths == [len(f) for f in frames]
+    assert {417, 418} == set(found.frame_lengths)
+    assert found.bitrates == {9}
+    assert found.first_header.raw == frames[0][:4]
+
+
+def test_scan_vbr_chunk_collects_bitrates():
+    frames = vbr_frames(30)
+    found = scan_frames(ID3_TAG + info_frame(b'Xing') + b''.join(frames))
+    assert found.frame_lengths == [len(f) for f in frames]
+    assert found.bitrates == {5, 9, 11, 14}
+
+
+def test_scan_drops_truncated_last_frame_and_junk():
+    frames = cbr_frames(5)
+    chunk = b''.join(frames[:2]) + b'\x00junk\xff\x00' + b''.join(frames[2:]) + frames[0][:100]
+    found = scan_frames(chunk)
+    first = len(frames[0]) + len(frames[1])
+    junk_end = first + 7
+    assert found.segments == [(0, first), (junk_end, junk_end + sum(map(len, frames[2:])))]
+    assert len(found.frame_lengths) == 5
+
+
+@pytest.mark.parametrize("chunk", [
+    b'',
+    ID3_TAG,
+    ID3_TAG + info_frame(),
+    b'<html>Bad Gateway</html>',
+    bytes(random.Random(1).getrandbits(8) & 0xF0 for _ in range(2000)),
+])
+def test_scan_without_audio_frames(chunk):
+    assert scan_frames(chunk) is None
+
+
+def test_xing_frame_fits_header():
+    template = parse_header(bytes((0xFF, MPEG1, 0x90, JOINT_STEREO)))
+    placeholder = xing_frame(template)
+    header = parse_header(placeholder)
+    assert len(placeholder) == header.length
+    assert (header.version, header.sample_rate, header.mono) == (3, 44100, False)
+    assert placeholder[36:40] == b'Info'
+    assert not any(placeholder[40:])
+    assert xing_frame(template, 1, 2, bytes(100), vbr=True)[36:40] == b'Xing'
+
+
+def test_writer_joins_cbr_chunks_under_one_info_header():
+    chunks = [cbr_chunk(40, seed) for seed in range(3)]
+    out = io.BytesIO()
+    with MP3Writer(out) as writer:
+        assert writer.write(chunks[0]) + writer.write(*chunks[1:]) == len(out.getvalue())
+    data = out.getvalue()
+    header, tag, flags, frames, total_bytes, toc = read_info(data)
+    assert (tag, flags, frames, total_bytes) == (b'Info', XING_FLAGS, 120, len(data))
+    assert data[header.length:] == b''.join(b''.join(cbr_frames(40, seed)) for seed in range(3))
+    assert list(toc) == expected_toc(frame_offsets(data), len(data))
+
+
+def test_writer_marks_mixed_bitrates_as_vbr(tmp_path):
+    path = tmp_path / "out.mp3"
+    with open(path, 'wb', buffering=0) as f:  # Unbuffered, so frames go out with writev.
+        with MP3Writer(f) as writer:
+            writer.write(vbr_chunk(50, 1), cbr_chunk(50, 2))
+    data = path.read_bytes()
+    _, tag, _, frames, total_bytes, toc = read_info(data)
+    assert (tag, frames, total_bytes) == (b'Xing', 100, len(data))
+    assert list(toc) == expected_toc(frame_offsets(data), len(data))
+
+
+def test_writer_seek_table_stays_accurate_for_long_files():
+    out = io.BytesIO()
+    with MP3Writer(out) as writer:
+        for seed in range(10):
+            writer.write(vbr_chunk(250, seed))
+    data = out.getvalue()
+    _, _, _, frames, total_bytes, toc = read_info(data)
+    assert (frames, total_bytes) == (2500, len(data))
+    # Offsets are thinned out to bound memory, so entries may be off by one step.
+    exact = expected_toc(frame_offsets(data), len(data))
+    assert all(abs(got - want) <= 1 for got, want in zip(toc, exact))
+    assert list(toc) == sorted(toc)
+
+
+def test_writer_keeps_unparseable_chunks_and_skips_header():
+    garbage = b'{"error": "upstream timeout"}'
+    good = cbr_chunk(10)
+    out = io.BytesIO()
+    with MP3Writer(out) as writer:
+        writer.write(good, garbage, good[:200])
+    data = out.getvalue()
+    placeholder = xing_frame(parse_header(data))
+    assert data == placeholder + b''.join(cbr_frames(10)) + garbage + good[:200]
+
+
+def test_writer_without_index_writes_chunks_unchanged():
+    chunks = [cbr_chunk(5), b'not audio']
+    out = io.BytesIO()
+    with MP3Writer(out, index=False) as writer:
+        writer.write(*chunks)
+    assert out.getvalue() == b''.join(chunks)
+
+
+class Unseekable(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+def test_writer_on_unseekable_target_omits_header():
+    out = Unseekable()
+    with MP3Writer(out) as writer:
+        writer.write(cbr_chunk(5), cbr_chunk(5, 1))
+    assert out.getvalue() == b''.join(cbr_frames(5)) + b''.join(cbr_frames(5, 1))
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="needs ffmpeg")
+@pytest.mark.parametrize("rate_args", [["-b:a", "128k"], ["-q:a", "4"]], ids=["cbr", "vbr"])
+def test_writer_with_encoder_output(tmp_path, rate_args):
+    chunks = []
+    for i, seconds in enumerate((1.3, 0.7)):
+        path = tmp_path / f"{i}.mp3"
+        subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i", f"sine=frequency={440 * (i + 1)}:duration={seconds}",
+             "-ac", "1", "-c:a", "libmp3lame", *rate_args, str(path)],
+            check=True
+        )
+        chunks.append(path.read_bytes())
+    expected = sum(len(scan_frames(chunk).frame_lengths) for chunk in chunks)
+    out = io.BytesIO()
+    with MP3Writer(out) as writer:
+        writer.write(*chunks)
+    data = out.getvalue()
+    _, tag, _, frames, total_bytes, toc = read_info(data)
+    assert tag in (b'Info', b'Xing')
+    assert (frames, total_bytes) == (expected, len(data))
+    assert len(frame_offsets(data)) == expected
+    assert list(toc) == expected_toc(frame_offsets(data), len(data))
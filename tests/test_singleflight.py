@@ -0,0 +1,158 @@
+"""Tests for coalescing identical requests in flight."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from openai_tts import AsyncOpenaiTTS, OpenaiTTS, TTSConfig
+from openai_tts.singleflight import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+CHUNKS = 3
+TEXT = "First sentence here. Second sentence here. Third sentence here."
+
+
+class Call:
+    """A slow call that counts how often it runs and finishes when released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, value):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return value
+
+
+def test_concurrent_callers_share_one_call():
+    flight, call = SingleFlight(), Call()
+    with ThreadPoolExecutor(max_workers=CALLERS + 1) as executor:
+        waiters = []
+        threads = [
+            threading.Thread(target=lambda: waiters.append(flight.submit("key", executor, call, "result")))
+            for _ in range(CALLERS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        call.release.set()
+        assert [waiter.result(5) for waiter in waiters] == ["result"] * CALLERS
+    assert call.calls == 1
+    assert len(flight) == 0
+
+
+def test_cancelling_one_waiter_leaves_the_others():
+    flight, call = SingleFlight(), Call()
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = flight.submit("key", executor, call, "result", callback=lambda f: results.append(f.result()))
+        second = flight.submit("key", executor, call, "result")
+        call.started.wait(5)
+        assert first.cancel()
+        call.release.set()
+        assert second.result(5) == "result"
+    assert call.calls == 1
+    # The callback of the shared call still sees the result the cancelled waiter gave up on.
+    assert results == ["result"]
+
+
+def test_cancelling_every_waiter_cancels_a_pending_call():
+    flight, call, blocker = SingleFlight(), Call(), Call()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        busy = executor.submit(blocker, None)
+        blocker.started.wait(5)
+        waiters = [flight.submit("key", executor, call, "result") for _ in range(3)]
+        for waiter in waiters:
+            waiter.cancel()
+        # A new caller starts a fresh call instead of joining the cancelled one.
+        fresh = flight.submit("key", executor, call, "fresh")
+        blocker.release.set()
+        call.release.set()
+        wait([busy])
+        assert fresh.result(5) == "fresh"
+    assert call.calls == 1
+
+
+def test_async_callers_share_one_call():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def factory():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flight.run("key", factory) for _ in range(CALLERS)))
+
+    assert asyncio.run(main()) == ["result"] * CALLERS
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+def test_async_cancelling_one_caller_leaves_the_others():
+    flight = AsyncSingleFlight()
+    started = []
+
+    async def factory():
+        started.append(None)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        first = asyncio.ensure_future(flight.run("key", factory))
+        second = asyncio.ensure_future(flight.run("key", factory))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(main()) == ("result", True)
+    assert len(started) == 1
+
+
+def test_async_cancelling_every_caller_cancels_the_call():
+    flight = AsyncSingleFlight()
+    finished = []
+
+    async def factory():
+        await asyncio.sleep(0.05)
+        finished.append(None)
+
+    async def main():
+        callers = [asyncio.ensure_future(flight.run("key", factory)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert not finished
+    assert len(flight) == 0
+
+
+def test_concurrent_speak_calls_request_each_chunk_once(stub):
+    stub.settings.latency = 0.2
+    with OpenaiTTS(TTSConfig(base_url=stub.base_url, verbose=False)) as tts:
+        with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+            results = list(executor.map(tts.speak_bytes, [TEXT] * CALLERS))
+    assert len(set(results)) == 1
+    assert stub.requests == CHUNKS
+
+
+def test_concurrent_aspeak_calls_request_each_chunk_once(stub):
+    stub.settings.latency = 0.2
+
+    async def main():
+        tts = AsyncOpenaiTTS(TTSConfig(base_url=stub.base_url, verbose=False))
+        try:
+            return await asyncio.gather(*(tts.aspeak_bytes(TEXT) for _ in range(CALLERS)))
+        finally:
+            await tts.aclose()
+
+    results = asyncio.run(main())
+    assert len(set(results)) == 1
+    assert stub.requests == CHUNKS
@@ -0,0 +1,62 @@
+"""Tests for batch synthesis with speak_many."""
+
+import pytest
+
+from openai_tts import OpenaiTTS, RetryPolicy, SynthesisJob, TTSConfig
+from openai_tts.exceptions import TTSException
+from openai_tts.metrics import MetricsCollector
+
+
+def make_config(stub, tmp_path, **overrides) -> TTSConfig:
+    settings = dict(
+        base_url=stub.base_url,
+        output_path=str(tmp_path / "output.mp3"),
+        verbose=False,
+        retry=RetryPolicy(max_attempts=1),
+        circuit_failure_threshold=10 ** 6,
+    )
+    settings.update(overrides)
+    return TTSConfig(**settings)
+
+
+def test_shared_chunks_are_requested_once(stub, tmp_path):
+    jobs = [
+        ("Welcome. Your order shipped.", None, str(tmp_path / "a.mp3")),
+        SynthesisJob("Welcome. Your order is late.", output_path=str(tmp_path / "b.mp3")),
+        ("Welcome.", None, None),
+        ("Welcome. Goodbye.", None, None),
+    ]
+    with OpenaiTTS(make_config(stub, tmp_path)) as tts:
+        paths = tts.speak_many(jobs)
+    assert paths == [
+        str(tmp_path / "a.mp3"), str(tmp_path / "b.mp3"), str(tmp_path / "output-3.mp3"), str(tmp_path / "output-4.mp3")
+    ]
+    assert stub.requests == 4
+    assert all((tmp_path / name).stat().st_size for name in ("a.mp3", "b.mp3", "output-3.mp3", "output-4.mp3"))
+
+
+def test_jobs_writing_the_same_file_are_rejected(stub, tmp_path):
+    with OpenaiTTS(make_config(stub, tmp_path)) as tts:
+        with pytest.raises(ValueError):
+            tts.speak_many([("One.", None, str(tmp_path / "x.mp3")), ("Two.", None, str(tmp_path / "x.mp3"))])
+    assert stub.requests == 0
+
+
+def test_cache_hits_are_reported(stub, tmp_path):
+    metrics = MetricsCollector()
+    config = make_config(stub, tmp_path, cache_dir=str(tmp_path / "cache"), instrumentation=metrics)
+    with OpenaiTTS(config) as tts:
+        tts.speak_many([("Hello there. General Kenobi.", None, None)])
+        tts.speak_many([("Hello there.", None, None)])
+    assert stub.requests == 2
+    assert metrics.chunks["cache_hit"] == 1
+
+
+def test_failed_jobs_do_not_stop_the_others(stub, tmp_path):
+    stub.settings.error_rate = 1.0
+    with OpenaiTTS(make_config(stub, tmp_path, cache_dir=str(tmp_path / "cache"))) as tts:
+        tts.cache.put(tts._chunk_key("Cached.", tts.config), b"cached audio")
+        with pytest.raises(TTSException, match="1 of 2 jobs"):
+            tts.speak_many([("Cached.", None, None), ("Cached. Not cached.", None, None)])
+    assert (tmp_path / "output-1.mp3").read_bytes() == b"cached audio"
+    assert not (tmp_path / "output-2.mp3").exists()
@@ -0,0 +1,94 @@
+"""Regression tests for SentenceTokenizer and split_into_sentences."""
+
+import pytest
+
+from openai_tts.utils import SentenceTokenizer, split_into_sentences
+
+
+@pytest.mark.parametrize("text, expected", [
+    (
+        "Mr. Smith met Mrs. Jones at Acme Inc. on Monday. They talked.",
+        ["Mr. Smith met Mrs. Jones at Acme Inc. on Monday.", "They talked."],
+    ),
+    (
+        "Dr. Brown works at Widgets Ltd. in town. She likes it.",
+        ["Dr. Brown works at Widgets Ltd. in town.", "She likes it."],
+    ),
+    (
+        "It costs approx. 5 dollars. Buy it.",
+        ["It costs approx. 5 dollars.", "Buy it."],
+    ),
+])
+def test_abbreviations_do_not_end_sentences(text, expected):
+    assert split_into_sentences(text) == expected
+
+
+def test_longest_abbreviation_wins():
+    # "Mrs." must not be cut short by a match on "mr".
+    assert split_into_sentences("Mrs. Jones left. Mr. Jones stayed.") == ["Mrs. Jones left.", "Mr. Jones stayed."]
+
+
+def test_decimals_and_percentages():
+    assert split_into_sentences("Pi is 3.14 today. The price rose 2.5% overnight.") == [
+        "Pi is 3.14 today.",
+        "The price rose 2.5% overnight.",
+    ]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Visit https://example.com. Then sign up.", ["Visit https://example.com.", "Then sign up."]),
+    (
+        "Read https://example.com/docs/page.html. Then sign up.",
+        ["Read https://example.com/docs/page.html.", "Then sign up."],
+    ),
+    ("See www.example.org/a/b. Then leave.", ["See www.example.org/a/b.", "Then leave."]),
+    ("Write to team@example.com. We reply fast.", ["Write to team@example.com.", "We reply fast."]),
+])
+def test_urls_and_emails_keep_trailing_period_outside(text, expected):
+    assert split_into_sentences(text) == expected
+
+
+def test_urls_are_not_split_inside():
+    assert split_into_sentences("Open https://example.com/a.b/c.d?x=1 Now then.") == [
+        "Open https://example.com/a.b/c.d?x=1 Now then."
+    ]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("He said «Stop. Now.» Then he left.", ["He said «Stop. Now.»", "Then he left."]),
+    ("He said «stop» and left. Fine.", ["He said «stop» and left.", "Fine."]),
+    (
+        "«She wrote ‹Go. Run.› on the wall.» Everyone saw it.",
+        ["«She wrote ‹Go. Run.› on the wall.»", "Everyone saw it."],
+    ),
+    ("He wrote ‹Go. Run.› Then more.", ["He wrote ‹Go. Run.›", "Then more."]),
+])
+def test_quotes_are_kept_whole(text, expected):
+    assert split_into_sentences(text) == expected
+
+
+def test_unclosed_quote_does_not_swallow_text():
+    assert split_into_sentences("He said «wait. Then left.") == ["He said «wait.", "Then left."]
+
+
+@pytest.mark.parametrize("literal", ["__PROTECTED_7__", "__PROTECTED_0__", "__DOT__", "__PARA__"])
+def test_text_resembling_internal_markers_is_kept(literal):
+    assert split_into_sentences(f"The token {literal} is literal. Next one.") == [
+        f"The token {literal} is literal.",
+        "Next one.",
+    ]
+
+
+def test_private_use_marker_characters_are_dropped():
+    assert SentenceTokenizer().tokenize("A \ue0000\ue001 b. Next \ue003one.") == ["A 0 b.", "Next one."]
+
+
+def test_paragraph_breaks_and_empty_input():
+    assert split_into_sentences("First line.\n\nSecond line. Done.") == ["First line. Second line.", "Done."]
+    assert split_into_sentences("   ") == []
+
+
+def test_tokenizer_is_deterministic_for_shared_instance():
+    tokenizer = SentenceTokenizer()
+    text = "Mr. A met Mrs. B at C Inc. today. «Hi. There.» See https://x.org/p. Bye."
+    assert tokenizer.tokenize(text) == tokenizer.tokenize(text) == split_into_sentences(text)